@@ -0,0 +1,413 @@
+"""
+Local stand-ins for every upstream a wallet run talks to
+
+One aiohttp server answers for all hosts. The benchmark rewrites `https://<host>/<path>`
+to `http://127.0.0.1:<port>/<host>/<path>` and points every network RPC to `/rpc/<network>`.
+Each upstream group gets its own latency and error injection profile.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from urllib.parse import unquote
+
+from aiohttp import web
+
+GALXE_HOSTS = {"graphigo.prd.galaxy.eco", "savings-graphigo.prd.latch.io"}
+TWITTER_HOSTS = {"x.com", "api.x.com", "upload.x.com", "caps.x.com"}
+CAPTCHA_HOSTS = {"api.capmonster.cloud"}
+RPC_HOST = "rpc"
+
+CAMPAIGN_IDS = ["GCpict6X7N", "GC5mTt8px6", "GCoUVt8dHz"]
+REWARD_TIERS = ["Follow Forte Foundation", "Tweet Bullish About @ForteProtocol", "Like X post from Forte", "Forte Quiz"]
+TWITTER_CREATED_AT = (datetime.utcnow() - timedelta(days=400)).strftime("%a %b %d %H:%M:%S +0000 %Y")
+
+
+@dataclass
+class UpstreamProfile:
+    latency_ms: float = 50
+    jitter_ms: float = 20
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+
+
+@dataclass
+class MockConfig:
+    galxe: UpstreamProfile = field(default_factory=UpstreamProfile)
+    twitter: UpstreamProfile = field(default_factory=UpstreamProfile)
+    rpc: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(latency_ms=30, jitter_ms=10))
+    captcha: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(latency_ms=500, jitter_ms=200))
+    other: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(latency_ms=20, jitter_ms=5))
+    # free claim through the Galxe payment task, or "Insufficient" to force the on-chain claim transaction
+    precheck_result: str = "Sufficient"
+
+
+def twitter_user_id(screen_name: str) -> int:
+    return int(hashlib.sha1(screen_name.encode()).hexdigest()[:12], 16)
+
+
+def _cred_id(campaign_index: int, tier_index: int) -> str:
+    return str(1000 + campaign_index * 10 + tier_index)
+
+
+@dataclass
+class _GalxeAccount:
+    galxe_id: str = ""
+    twitter_user_id: int | None = None
+    synced: set = field(default_factory=set)
+    claimed: set = field(default_factory=set)
+
+
+class GalxeMock:
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.accounts: dict[str, _GalxeAccount] = {}
+        self.tokens: dict[str, str] = {}
+
+    def _address(self, request: web.Request, variables: dict) -> str:
+        token = request.headers.get("authorization")
+        if token in self.tokens:
+            return self.tokens[token]
+        raw = json.dumps(variables)
+        match = re.search(r"0x[0-9a-fA-F]{40}", raw)
+        return match.group(0).lower() if match else "unknown"
+
+    def _account(self, address: str) -> _GalxeAccount:
+        return self.accounts.setdefault(address, _GalxeAccount(galxe_id=f"gid-{address[-8:]}"))
+
+    def _campaign(self, account: _GalxeAccount, campaign_id: str) -> dict:
+        index = CAMPAIGN_IDS.index(campaign_id) if campaign_id in CAMPAIGN_IDS else 0
+
+        def condition(tier_index: int, name: str) -> dict:
+            cred_id = _cred_id(index, tier_index)
+            eligible = cred_id in account.synced
+            return {
+                "cred": {"id": cred_id, "name": name, "eligible": int(eligible)},
+                "eligible": eligible,
+                "eligibleAddress": account.galxe_id if eligible else "",
+                "attrs": [{"key": "value", "op": ">", "val": "0", "__typename": "ExprEntityAttr"}],
+            }
+
+        reward_configs = []
+        for tier_index, name in enumerate(REWARD_TIERS, start=1):
+            cred_id = _cred_id(index, tier_index)
+            reward_configs.append(
+                {
+                    "id": f"rc-{cred_id}",
+                    "conditions": [condition(tier_index, name)],
+                    "rewards": [{"arithmeticFormula": "10", "rewardCount": int(campaign_id in account.claimed), "rewardVal": "10"}],
+                    "eligible": cred_id in account.synced,
+                }
+            )
+
+        return {
+            "id": campaign_id,
+            "referralCode": f"REF{campaign_id}{random.randint(0, 10**9)}",
+            "taskConfig": {
+                "participateCondition": {"conditions": [condition(5, "Hold Gravity")], "eligible": _cred_id(index, 5) in account.synced},
+                "rewardConfigs": reward_configs,
+                "referralConfig": {"id": f"ref-{campaign_id}", "conditions": [condition(6, "Invite friends")], "rewards": [], "eligible": False},
+            },
+        }
+
+    def handle(self, request: web.Request, payload: dict) -> dict:
+        operation = payload.get("operationName")
+        variables = payload.get("variables") or {}
+        address = self._address(request, variables)
+        account = self._account(address)
+        input_data = variables.get("input") or {}
+
+        if operation == "GalxeIDExist":
+            return {"data": {"galxeIdExist": True}}
+        if operation == "SignIn":
+            token = f"bench-{address}-{random.randint(0, 10**9)}"
+            self.tokens[token] = address
+            return {"data": {"signin": token}}
+        if operation == "BasicUserInfo":
+            twitter_id = str(account.twitter_user_id) if account.twitter_user_id else None
+            return {"data": {"addressInfo": {"id": account.galxe_id, "isBot": False, "twitterUserID": twitter_id}}}
+        if operation in ("checkTwitterAccount", "VerifyTwitterAccount"):
+            match = re.search(r"x\.com/([^/]+)/status", input_data.get("tweetURL", ""))
+            account.twitter_user_id = twitter_user_id(match.group(1)) if match else None
+            key = "checkTwitterAccount" if operation == "checkTwitterAccount" else "verifyTwitterAccount"
+            return {"data": {key: {"twitterUserID": str(account.twitter_user_id) if account.twitter_user_id else None}}}
+        if operation == "DeleteSocialAccount":
+            account.twitter_user_id = None
+            return {"data": {"deleteSocialAccount": {"code": 0, "message": ""}}}
+        if operation in ("QuestCredList", "QuestCredState"):
+            # the state query is a subset of the list, the client only reads the wallet fields from it
+            return {"data": {"campaign": self._campaign(account, variables.get("id"))}}
+        if operation == "SyncCredentialValue":
+            account.synced.add(str(input_data.get("syncOptions", {}).get("credId")))
+            return {"data": {"syncCredentialValue": {"value": {"allow": True}}}}
+        if operation == "syncEvaluateCredentialValue":
+            account.synced.add(str(input_data.get("syncOptions", {}).get("credId")))
+            return {"data": {"syncEvaluateCredentialValue": {"result": True, "value": {"allow": True}}}}
+        if operation == "followSpace":
+            return {"data": {"followSpace": 1}}
+        if operation == "readQuiz":
+            return {"data": {"credential": {"metadata": {"quiz": {"material": "", "quizzes": []}}}}}
+        if operation == "TwitterOauth2Status":
+            return {"data": {"twitterOauth2Status": {"oauthRateLimited": False}}}
+        if operation == "GetUserPlusSubscription":
+            return {"data": {"userPlusSubscription": {"active": False}}}
+        if operation == "CampaignClaimInfo":
+            claimed = variables.get("id") in account.claimed
+            return {
+                "data": {
+                    "campaign": {
+                        "id": variables.get("id"),
+                        "chain": "GRAVITY_ALPHA",
+                        "numberID": 1000 + (CAMPAIGN_IDS.index(variables.get("id")) if variables.get("id") in CAMPAIGN_IDS else 0),
+                        "whitelistInfo": {
+                            "address": address,
+                            "claimedLoyaltyPoints": 40 if claimed else 0,
+                            "currentPeriodMaxLoyaltyPoints": 40,
+                            "currentPeriodClaimedLoyaltyPoints": 40 if claimed else 0,
+                            "maxCount": -1,
+                            "usedCount": 0,
+                        },
+                    }
+                }
+            }
+        if operation == "PrepareParticipate":
+            return {
+                "data": {
+                    "prepareParticipate": {
+                        "allow": True,
+                        "loyaltyPointsTxResp": {
+                            "loyaltyPointContract": "0x" + "11" * 20,
+                            "loyaltyPointDistributionStation": "0x" + "22" * 20,
+                            "VerifyIDs": [random.randint(1, 10**9)],
+                            "signature": "0x" + "ab" * 65,
+                            "claimFeeAmount": "0",
+                            "Points": [40],
+                        },
+                    }
+                }
+            }
+        if operation == "ssPreCheckCampaign":
+            return {"data": {"campaign": {"ssPaymentPreCheckClaimPoints": {"checkRes": self.config.precheck_result}}}}
+        if operation == "registerSSPaymentTask":
+            campaign_id = CAMPAIGN_IDS[(input_data["taskDetail"]["questTask"]["campaignId"] - 1000) % len(CAMPAIGN_IDS)]
+            account.claimed.add(campaign_id)
+            return {"data": {"registerSSPaymentTask": {"taskId": random.randint(1, 10**9), "success": True, "failureReason": ""}}}
+        if operation == "paymentTaskInfo":
+            return {"data": {"paymentTaskInfo": {"status": "Success"}}}
+        if operation == "SpaceLoyaltyPoints":
+            return {"data": {"space": {"addressLoyaltyPoints": {"points": 40 * len(account.claimed), "rank": 1}}}}
+        return {"data": {}}
+
+
+class TwitterMock:
+    def handle(self, request: web.Request, path: str, body: bytes) -> dict:
+        auth_token = request.cookies.get("auth_token", "") or request.headers.get("cookie", "")
+        screen_name = f"bench_{hashlib.md5(auth_token.encode()).hexdigest()[:10]}"
+
+        if path.endswith("account/settings.json"):
+            return {"screen_name": screen_name}
+        if "UserByScreenName" in path:
+            match = re.search(r"screen_name['\"]?\s*[:=]\s*['\"]?([A-Za-z0-9_]+)", unquote(request.query_string))
+            name = match.group(1) if match else screen_name
+            return {"data": {"user": {"result": self._user(name)}}}
+        if "CreateTweet" in path:
+            payload = json.loads(body or b"{}")
+            tweet_id = str(random.randint(10**17, 10**18))
+            return {
+                "data": {
+                    "create_tweet": {
+                        "tweet_results": {
+                            "result": {
+                                "rest_id": tweet_id,
+                                "core": {"user_results": {"result": self._user(screen_name)}},
+                                "legacy": {
+                                    "id_str": tweet_id,
+                                    "full_text": payload.get("variables", {}).get("tweet_text", ""),
+                                    "lang": "en",
+                                    "created_at": datetime.utcnow().strftime("%a %b %d %H:%M:%S +0000 %Y"),
+                                    "conversation_id_str": tweet_id,
+                                },
+                            }
+                        }
+                    }
+                }
+            }
+        if "DeleteTweet" in path:
+            return {"data": {"delete_tweet": {"tweet_results": {}}}}
+        return {}
+
+    @staticmethod
+    def _user(screen_name: str) -> dict:
+        return {
+            "rest_id": str(twitter_user_id(screen_name)),
+            "legacy": {
+                "screen_name": screen_name,
+                "description": "",
+                "followers_count": 120,
+                "friends_count": 80,
+                "created_at": TWITTER_CREATED_AT,
+            },
+        }
+
+
+class RpcMock:
+    CHAIN_IDS = {"gravity": 1625, "ethereum": 1, "arbitrum": 42161, "base": 8453, "optimism": 10, "bsc": 56, "polygon": 137}
+
+    def __init__(self):
+        self.nonces: dict[str, int] = {}
+
+    def call(self, network: str, request: dict) -> dict:
+        method = request.get("method")
+        params = request.get("params") or []
+        result = self._result(network, method, params)
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def _result(self, network: str, method: str, params: list):
+        if method == "eth_chainId":
+            return hex(self.CHAIN_IDS.get(network, 1))
+        if method == "net_version":
+            return str(self.CHAIN_IDS.get(network, 1))
+        if method == "eth_getBalance":
+            return hex(5 * 10**18)
+        if method == "eth_getTransactionCount":
+            return hex(self.nonces.get(str(params[0]).lower(), 0) if params else 0)
+        if method in ("eth_gasPrice", "eth_maxPriorityFeePerGas"):
+            return hex(10**9)
+        if method == "eth_estimateGas":
+            return hex(100_000)
+        if method == "eth_blockNumber":
+            return hex(int(time.time()))
+        if method == "eth_getBlockByNumber":
+            return {"number": hex(int(time.time())), "baseFeePerGas": hex(10**9), "timestamp": hex(int(time.time())), "transactions": []}
+        if method == "eth_feeHistory":
+            return {"oldestBlock": hex(1), "baseFeePerGas": [hex(10**9)] * 2, "gasUsedRatio": [0.5], "reward": [[hex(10**9)]]}
+        if method == "eth_call":
+            return "0x" + "00" * 31 + "01"
+        if method == "eth_sendRawTransaction":
+            return "0x" + hashlib.sha256(str(params).encode()).hexdigest()
+        if method == "eth_getTransactionReceipt":
+            return {
+                "transactionHash": params[0] if params else "0x" + "00" * 32,
+                "status": "0x1",
+                "blockNumber": hex(int(time.time())),
+                "blockHash": "0x" + "00" * 32,
+                "gasUsed": hex(21000),
+                "cumulativeGasUsed": hex(21000),
+                "effectiveGasPrice": hex(10**9),
+                "logs": [],
+                "logsBloom": "0x" + "00" * 256,
+                "transactionIndex": "0x0",
+                "contractAddress": None,
+                "from": "0x" + "00" * 20,
+                "to": "0x" + "00" * 20,
+                "type": "0x2",
+            }
+        if method == "eth_getTransactionByHash":
+            return {"hash": params[0] if params else "0x" + "00" * 32, "blockNumber": hex(int(time.time()))}
+        return None
+
+
+class MockUpstreams:
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.galxe = GalxeMock(config)
+        self.twitter = TwitterMock()
+        self.rpc = RpcMock()
+        self.captcha_tasks: dict[int, float] = {}
+        self.requests = 0
+
+    def _profile(self, host: str) -> UpstreamProfile:
+        if host in GALXE_HOSTS:
+            return self.config.galxe
+        if host in TWITTER_HOSTS:
+            return self.config.twitter
+        if host in CAPTCHA_HOSTS:
+            return self.config.captcha
+        if host == RPC_HOST:
+            return self.config.rpc
+        return self.config.other
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        host, _, path = request.match_info["tail"].partition("/")
+        profile = self._profile(host)
+
+        await asyncio.sleep(max(0.0, random.gauss(profile.latency_ms, profile.jitter_ms)) / 1000)
+        roll = random.random()
+        if roll < profile.throttle_rate:
+            return web.json_response(
+                {"errors": [{"message": "Rate limit exceeded", "code": 88}]}, status=429, headers={"x-rate-limit-reset": str(int(time.time()) + 1)}
+            )
+        if roll < profile.throttle_rate + profile.error_rate:
+            return web.json_response({"errors": [{"message": "injected upstream error"}]}, status=500)
+
+        body = await request.read()
+        if host in GALXE_HOSTS:
+            return web.json_response(self.galxe.handle(request, json.loads(body or b"{}")))
+        if host in TWITTER_HOSTS:
+            return web.json_response(self.twitter.handle(request, path, body))
+        if host in CAPTCHA_HOSTS:
+            return web.json_response(self._captcha(path, json.loads(body or b"{}")))
+        if host == RPC_HOST:
+            payload = json.loads(body or b"{}")
+            if isinstance(payload, list):
+                return web.json_response([self.rpc.call(path, item) for item in payload])
+            return web.json_response(self.rpc.call(path, payload))
+        if host == "api.ipify.org":
+            return web.Response(text="127.0.0.1")
+        if host == "api.coingecko.com":
+            return web.json_response({token: {"usd": 2500} for token in ("ethereum", "binancecoin", "matic-network", "avalanche-2")})
+        if host == "api.binance.com":
+            return web.json_response({"asks": [["2500.0", "1"]], "bids": [["2499.0", "1"]]})
+        if host == "chainid.network":
+            return web.json_response(self._chains())
+        return web.json_response({"error": f"no stand-in for {host}"}, status=404)
+
+    def _chains(self) -> list[dict]:
+        """Chain list looked up for networks configured without coin symbol or decimals"""
+        return [
+            {"chainId": chain_id, "name": network, "nativeCurrency": {"symbol": "ETH", "decimals": 18}}
+            for network, chain_id in RpcMock.CHAIN_IDS.items()
+        ]
+
+    def _captcha(self, path: str, payload: dict) -> dict:
+        if path.startswith("createTask"):
+            task_id = random.randint(1, 10**9)
+            self.captcha_tasks[task_id] = time.monotonic()
+            return {"errorId": 0, "taskId": task_id}
+        if path.startswith("getTaskResult"):
+            self.captcha_tasks.pop(payload.get("taskId"), None)
+            return {
+                "errorId": 0,
+                "status": "ready",
+                "solution": {
+                    "lot_number": hashlib.md5(str(payload).encode()).hexdigest(),
+                    "captcha_output": "bench",
+                    "pass_token": "bench",
+                    "gen_time": str(int(time.time())),
+                },
+            }
+        return {"errorId": 1, "errorDescription": f"unknown captcha method {path}"}
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024**2)
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        return app
+
+
+def serve(config: MockConfig, port: int, ready) -> None:
+    """Process entry point: run the stand-ins until the process is terminated"""
+
+    async def main():
+        runner = web.AppRunner(MockUpstreams(config).app(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host="127.0.0.1", port=port).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
@@ -0,0 +1,348 @@
+"""
+Offline end-to-end throughput benchmark
+
+Runs `functions.activity.execute` with `start_main_action` for synthetic wallets against
+local stand-ins of Galxe, x.com, JSON-RPC nodes and a captcha API, then reports wallets/hour,
+p50/p99 latency per pipeline stage and per upstream, CPU time and peak memory.
+
+    python -m benchmarks.run --wallets 200 --threads 20
+    python -m benchmarks.run --wallets 200 --galxe-error-rate 0.05 --output bench.json
+    python -m benchmarks.run --wallets 200 --baseline bench.json --max-regression 0.1
+
+Cooldowns and pauses of the pipeline (start pause, pauses between steps, retry backoff) are shortened
+by --time-scale. Limiter, circuit breaker and write buffer timers run in real time, the stand-ins keep
+their real latency. The run fails (exit code 1, no throughput) when no wallet completes.
+"""
+
+# must be called before any other imports
+from utils.pyarmor_bootstrap import ensure_pyarmor_runtime_on_path
+
+ensure_pyarmor_runtime_on_path()
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import time
+import types
+from urllib.parse import urlsplit
+
+import requests
+import yaml
+
+from benchmarks.mock_upstreams import MockConfig, UpstreamProfile, serve
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# modules whose own cooldowns and pauses are shortened by --time-scale
+PAUSING_MODULES = ("functions.activity", "modules.quests_client", "utils.galxe.galxe_client", "utils.galxe.galxe_auth", "utils.retry", "libs.base")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline throughput benchmark with mock upstreams")
+    parser.add_argument("--wallets", type=int, default=100, help="number of synthetic wallets")
+    parser.add_argument("--threads", type=int, default=10, help="threads setting used for the run")
+    parser.add_argument("--in-flight", type=int, default=0, help="max_wallets_in_flight setting used for the run")
+    parser.add_argument("--time-scale", type=float, default=0.001, help="multiplier for sleeps inside the pipeline")
+    parser.add_argument("--onchain-claim", action="store_true", help="claim points with an on-chain transaction instead of a free claim")
+    for upstream, latency in (("galxe", 50), ("twitter", 80), ("rpc", 30), ("captcha", 500)):
+        parser.add_argument(f"--{upstream}-latency", type=float, default=latency, help=f"mean {upstream} latency in ms")
+        parser.add_argument(f"--{upstream}-error-rate", type=float, default=0.0, help=f"share of {upstream} requests answered with 500")
+        parser.add_argument(f"--{upstream}-throttle-rate", type=float, default=0.0, help=f"share of {upstream} requests answered with 429")
+    parser.add_argument("--settings", help="settings.yaml to start from instead of the template")
+    parser.add_argument("--log-level", default="ERROR")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.1, help="allowed relative throughput drop / p99 growth vs the baseline")
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def mock_config(args: argparse.Namespace) -> MockConfig:
+    def profile(name: str) -> UpstreamProfile:
+        latency = getattr(args, f"{name}_latency")
+        return UpstreamProfile(
+            latency_ms=latency,
+            jitter_ms=latency * 0.3,
+            error_rate=getattr(args, f"{name}_error_rate"),
+            throttle_rate=getattr(args, f"{name}_throttle_rate"),
+        )
+
+    return MockConfig(
+        galxe=profile("galxe"),
+        twitter=profile("twitter"),
+        rpc=profile("rpc"),
+        captcha=profile("captcha"),
+        precheck_result="Insufficient" if args.onchain_claim else "Sufficient",
+    )
+
+
+def prepare_environment(args: argparse.Namespace, workdir: str) -> None:
+    """Point the project at a throwaway DB and settings file, must run before project imports"""
+    template = args.settings or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "settings_template.yaml")
+    with open(template) as f:
+        settings = yaml.safe_load(f) or {}
+
+    settings.update(
+        {
+            "private_key_encryption": False,
+            "threads": args.threads,
+            "max_wallets_in_flight": args.in_flight,
+            "range_wallets_to_run": [0, 0],
+            "exact_wallets_to_run": [],
+            "check_git_updates": False,
+            "log_level": args.log_level,
+            "random_pause_start_wallet": {"min": 0, "max": 60},
+            "random_pause_wallet_after_all_completion": {"min": 0, "max": 0},
+            "proxy_preflight": False,
+            "metrics": {"enabled": False},
+        }
+    )
+    settings_file = os.path.join(workdir, "settings.yaml")
+    with open(settings_file, "w") as f:
+        yaml.safe_dump(settings, f)
+
+    os.environ["SETTINGS_FILE"] = settings_file
+    os.environ["WALLETS_DB"] = os.path.join(workdir, "wallets.db")
+
+
+def create_wallets(count: int) -> None:
+    from eth_account import Account
+
+    from utils.db_api.migrate import migrate
+    from utils.db_api.models import Wallet
+    from utils.db_api.wallet_api import db
+
+    migrate()
+    for i in range(count):
+        account = Account.create()
+        db.s.add(Wallet(private_key=account.key.hex(), address=account.address, twitter_token=os.urandom(20).hex()))
+    db.commit()
+
+
+def local_url(mock_url: str, url) -> str:
+    parts = urlsplit(str(url))
+    return f"{mock_url}/{parts.hostname}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+def redirect_upstreams(mock_url: str) -> None:
+    """Send every HTTP request and RPC call of the pipeline to the stand-ins, must run before project imports"""
+    original_sync_request = requests.Session.request
+
+    def sync_request(self, method, url, *args, **kwargs):
+        # the chain list lookup of libs.eth_async.data.models runs at import time
+        return original_sync_request(self, method, local_url(mock_url, url), *args, **kwargs)
+
+    requests.Session.request = sync_request
+
+    from curl_cffi.requests import AsyncSession
+
+    import utils.galxe.galxe_client as galxe_client
+    from libs.baseAsyncSession import BaseAsyncSession
+    from libs.eth_async.data.models import Network, Networks
+
+    original_request = AsyncSession.request
+
+    async def request(self, method, url, *args, **kwargs):
+        return await original_request(self, method, local_url(mock_url, url), *args, **kwargs)
+
+    AsyncSession.request = request
+
+    for network in vars(Networks).values():
+        if isinstance(network, Network):
+            network.rpc = f"{mock_url}/rpc/{network.name}"
+
+    async def get_captcha(action: str, **kwargs):
+        async with BaseAsyncSession() as session:
+            task = await session.post(url="https://api.capmonster.cloud/createTask", json={"task": {"type": "GeeTestTask", "action": action}})
+            result = await session.post(url="https://api.capmonster.cloud/getTaskResult", json={"taskId": task.json()["taskId"]})
+            result = result.json()
+        solution = result["solution"]
+        return {
+            "lotNumber": solution["lot_number"],
+            "captchaOutput": solution["captcha_output"],
+            "passToken": solution["pass_token"],
+            "genTime": solution["gen_time"],
+        }
+
+    galxe_client.get_captcha = get_captcha
+
+
+def scale_pauses(time_scale: float) -> None:
+    """Shorten cooldowns and pauses of the pipeline modules only, asyncio.sleep stays untouched for the rest of the process"""
+    import importlib
+
+    import utils.cooldown
+
+    original_cooldown = utils.cooldown.cooldown_sleep
+
+    async def cooldown_sleep(seconds: float) -> None:
+        await original_cooldown(seconds * time_scale)
+
+    async def sleep(delay, *args, **kwargs):
+        return await asyncio.sleep(delay * time_scale, *args, **kwargs)
+
+    scaled_asyncio = types.SimpleNamespace(**{**vars(asyncio), "sleep": sleep})
+    for name in PAUSING_MODULES:
+        module = importlib.import_module(name)
+        if getattr(module, "cooldown_sleep", None) is original_cooldown:
+            module.cooldown_sleep = cooldown_sleep
+        if getattr(module, "asyncio", None) is asyncio:
+            module.asyncio = scaled_asyncio
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(q * (len(values) - 1))))
+    return values[index]
+
+
+def summarize(samples: dict[tuple, list[float]], label: str) -> dict[str, dict]:
+    grouped: dict[str, list[float]] = {}
+    for labels, values in samples.items():
+        grouped.setdefault(dict(labels).get(label, ""), []).extend(values)
+    return {
+        key: {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 0.5) * 1000, 1),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 1),
+        }
+        for key, values in sorted(grouped.items())
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    from functions.activity import execute, start_main_action, wallets_to_run
+    from utils.metrics import Metrics
+
+    Metrics.keep_samples()
+    wallets = list(wallets_to_run())
+
+    cpu_started = time.process_time()
+    started = time.monotonic()
+    stats = await execute(wallets, start_main_action)
+    elapsed = time.monotonic() - started
+    cpu = time.process_time() - cpu_started
+
+    stage_results: dict[str, dict] = {}
+    for labels, value in Metrics.counters("stage_total").items():
+        labels = dict(labels)
+        stage_results.setdefault(labels["stage"], {})[labels["result"]] = int(value)
+
+    stages = summarize(Metrics.samples("stage_duration_seconds"), "stage")
+    for stage, results in stage_results.items():
+        stages.setdefault(stage, {})["results"] = results
+
+    max_rss_mb = None
+    if resource:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        max_rss_mb = round(max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+    # failed wallets and empty stage tables mean the pipeline broke, not that it was fast
+    completed = stats.get("completed", 0) if stage_results else 0
+    return {
+        "wallets": len(wallets),
+        "threads": args.threads,
+        "time_scale": args.time_scale,
+        "elapsed_s": round(elapsed, 2),
+        "wallets_per_hour": round(completed / elapsed * 3600, 1) if completed and elapsed else None,
+        "results": dict(stats),
+        "stages": stages,
+        "http": summarize(Metrics.samples("http_request_duration_seconds"), "host"),
+        "rpc": summarize(Metrics.samples("rpc_request_duration_seconds"), "method"),
+        "captcha": summarize(Metrics.samples("captcha_solve_duration_seconds"), "provider"),
+        "cpu_s": round(cpu, 2),
+        "cpu_per_wallet_ms": round(cpu / completed * 1000, 1) if completed else None,
+        "max_rss_mb": max_rss_mb,
+    }
+
+
+def print_report(report: dict) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    if report["wallets_per_hour"] is None:
+        throughput = "[bold red]no wallet completed[/bold red]"
+    else:
+        throughput = f"[bold green]{report['wallets_per_hour']} wallets/hour[/bold green]"
+    console.print(
+        f"[bold]{report['wallets']} wallets[/bold] in {report['elapsed_s']}s -> {throughput} "
+        f"| results {report['results']} | CPU {report['cpu_s']}s ({report['cpu_per_wallet_ms']}ms/wallet) | max RSS {report['max_rss_mb']} MB"
+    )
+    for section in ("stages", "http", "rpc", "captcha"):
+        table = Table(title=section)
+        table.add_column("name")
+        table.add_column("count", justify="right")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p99 ms", justify="right")
+        for name, row in report[section].items():
+            table.add_row(name, str(row.get("count", 0)), str(row.get("p50_ms", "")), str(row.get("p99_ms", "")))
+        console.print(table)
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    problems = []
+    if baseline.get("wallets_per_hour") and report["wallets_per_hour"] < baseline["wallets_per_hour"] * (1 - max_regression):
+        problems.append(f"throughput {report['wallets_per_hour']} < baseline {baseline['wallets_per_hour']} wallets/hour")
+    for stage, row in report["stages"].items():
+        before = baseline.get("stages", {}).get(stage, {}).get("p99_ms")
+        if before and row.get("p99_ms", 0) > before * (1 + max_regression):
+            problems.append(f"stage {stage} p99 {row['p99_ms']}ms > baseline {before}ms")
+    return problems
+
+
+def main() -> int:
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="forte-bench-")
+    prepare_environment(args, workdir)
+
+    port = free_port()
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Event()
+    upstreams = ctx.Process(target=serve, args=(mock_config(args), port, ready), name="mock-upstreams", daemon=True)
+    upstreams.start()
+    try:
+        if not ready.wait(timeout=30):
+            raise RuntimeError("mock upstreams did not start")
+
+        redirect_upstreams(f"http://127.0.0.1:{port}")
+        scale_pauses(args.time_scale)
+        create_wallets(args.wallets)
+        report = asyncio.run(run_benchmark(args))
+    finally:
+        upstreams.terminate()
+        upstreams.join()
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if report["wallets_per_hour"] is None:
+        print("FAILED: no wallet completed or no stage recorded an event, see the results above")
+        return 1
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = compare(report, json.load(f), args.max_regression)
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,8 +14,9 @@ else:
     ROOT_DIR = Path(__file__).parent.parent.absolute()
 
 FILES_DIR = os.path.join(ROOT_DIR, "files")
-WALLETS_DB = os.path.join(FILES_DIR, "wallets.db")
-SETTINGS_FILE = os.path.join(FILES_DIR, "settings.yaml")
+# can be pointed elsewhere from the environment, e.g. by the offline benchmark
+WALLETS_DB = os.getenv("WALLETS_DB") or os.path.join(FILES_DIR, "wallets.db")
+SETTINGS_FILE = os.getenv("SETTINGS_FILE") or os.path.join(FILES_DIR, "settings.yaml")
 RESERVE_PROXY_FILE = os.path.join(FILES_DIR, "reserve_proxy.txt")
 RESERVE_TWITTER_FILE = os.path.join(FILES_DIR, "reserve_twitter.txt")
 
@@ -25,6 +26,7 @@ ABIS_DIR = os.path.join(ROOT_DIR, "data", "abis")
 SALT_PATH = os.path.join(FILES_DIR, "salt.dat")
 
 CIPHER_SUITE = None
+CIPHER_KEY = None
 LOCK = asyncio.Lock()
 
 LOGS_DIR = os.path.join(FILES_DIR, "logs")
@@ -15,6 +15,7 @@ class Settings(Singleton):
         self.check_git_updates = json_data.get("check_git_updates", True)
         self.private_key_encryption = json_data.get("private_key_encryption", False)
         self.threads = json_data.get("threads", 4)
+        self.max_wallets_in_flight = json_data.get("max_wallets_in_flight", 0)
         self.range_wallets_to_run = json_data.get("range_wallets_to_run", [])
         self.exact_wallets_to_run = json_data.get("exact_wallets_to_run", [])
         self.shuffle_wallets = json_data.get("shuffle_wallets", True)
@@ -34,17 +35,49 @@ class Settings(Singleton):
         self.random_pause_wallet_after_all_completion_max = json_data.get("random_pause_wallet_after_all_completion", {}).get("max", 0)
         self.network_for_bridge = json_data.get("network_for_bridge", [])
         self.auto_replace_proxy = json_data.get("auto_replace_proxy ", True)
+        self.proxy_preflight = json_data.get("proxy_preflight", True)
+        self.proxy_check_concurrency = json_data.get("proxy_check_concurrency", 50)
+        self.proxy_check_ttl = json_data.get("proxy_check_ttl", 3600)
+        self.only_incomplete_checkpoints = json_data.get("only_incomplete_checkpoints", False)
+        self.min_points_to_run = json_data.get("min_points_to_run", 0)
+        self.export_format = json_data.get("export", {}).get("format", "csv")
+        self.export_columns = json_data.get("export", {}).get("columns", [])
+        self.export_filters = json_data.get("export", {}).get("filters", {})
+        self.export_decrypt_keys = json_data.get("export", {}).get("decrypt_keys", False)
         self.auto_replace_twitter = json_data.get("auto_replace_twitter ", True)
         self.random_eth_for_bridge_min = json_data.get("random_eth_for_bridge", {}).get("min")
         self.random_eth_for_bridge_max = json_data.get("random_eth_for_bridge", {}).get("max")
         self.use_banned_galxe = json_data.get("use_banned_galxe", False)
+        self.campaign_cache_ttl = json_data.get("campaign_cache_ttl", 600)
 
         self.retry = json_data.get("retry", 3)
+        self.retry_budget = json_data.get("retry_budget", 6)
+        self.retry_policies = json_data.get("retry_policies", {})
+        self.session_pool = json_data.get("session_pool", True)
+        self.async_db = json_data.get("async_db", True)
+        self.write_buffer_interval = json_data.get("write_buffer_interval", 5)
+        self.event_log = json_data.get("event_log", True)
+        self.adaptive_concurrency = json_data.get("adaptive_concurrency", {}).get("enabled", True)
+        self.adaptive_concurrency_initial = json_data.get("adaptive_concurrency", {}).get("initial", 4)
+        self.adaptive_concurrency_min = json_data.get("adaptive_concurrency", {}).get("min", 1)
+        self.adaptive_concurrency_max = json_data.get("adaptive_concurrency", {}).get("max", 64)
+        self.adaptive_concurrency_decrease = json_data.get("adaptive_concurrency", {}).get("decrease", 0.5)
+        self.adaptive_concurrency_latency_factor = json_data.get("adaptive_concurrency", {}).get("latency_factor", 4)
+        self.rate_limits = json_data.get("rate_limits", {})
+        self.circuit_breaker = json_data.get("circuit_breaker", {}).get("enabled", True)
+        self.circuit_breaker_failures = json_data.get("circuit_breaker", {}).get("failures", 10)
+        self.circuit_breaker_open_seconds = json_data.get("circuit_breaker", {}).get("open_seconds", 60)
+        self.circuit_breaker_max_defers = json_data.get("circuit_breaker", {}).get("max_defers", 5)
+        self.metrics_enabled = json_data.get("metrics", {}).get("enabled", False)
+        self.metrics_port = json_data.get("metrics", {}).get("port", 9108)
+        self.metrics_file = json_data.get("metrics", {}).get("file", "")
+        self.metrics_interval = json_data.get("metrics", {}).get("interval", 15)
 
         self.first_quest_invite = json_data.get("first_quest_invite", [])
         self.second_quest_invite = json_data.get("second_quest_invite", [])
         self.third_quest_invite = json_data.get("third_quest_invite", [])
         self.only_settings_invite_codes = json_data.get("only_settings_invite_codes", False)
+        self.invite_codes_balance = json_data.get("invite_codes_balance", False)
 
 
 # Configure the logger based on the settings
@@ -1,18 +1,31 @@
-import asyncio
 import random
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List
+from typing import Iterable, Iterator
 
 from loguru import logger
 
 from data.settings import Settings
 from functions.controller import Controller
+from functions.sharding import run_sharded
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import Networks
-from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db, get_wallet_by_address
+from modules.quests_client import Quests
+from utils.browser import SessionPool
+from utils.circuit_breaker import CircuitBreakers, CircuitOpen
+from utils.cooldown import cooldown_sleep
+from utils.db_api import async_wallet_api
+from utils.db_api.selection_api import select_wallets_to_run
+from utils.db_api.write_buffer import WriteBuffer
 from utils.encryption import check_encrypt_param
+from utils.event_log import EventLog
+from utils.host_limiter import AdaptiveLimiter
+from utils.metrics import MetricsExporter
+from utils.proxy_preflight import ProxyPreflight, proxy_checked_recently
+from utils.rate_limiter import RateLimits
 from utils.resource_manager import ResourceManager
+from utils.retry import ProxyRotationRequired
+from utils.scheduler import WalletScheduler
 
 
 async def random_sleep_before_start(wallet):
@@ -20,59 +33,79 @@ async def random_sleep_before_start(wallet):
     now = datetime.now()
 
     logger.info(f"{wallet} Start at {now + timedelta(seconds=random_sleep)} sleep {random_sleep} seconds before start actions")
-    await asyncio.sleep(random_sleep)
-
-
-async def execute(wallets: List[Wallet], task_func, random_pause_wallet_after_completion: int = 0):
-    while True:
-        semaphore = asyncio.Semaphore(min(len(wallets), Settings().threads))
-
-        if Settings().shuffle_wallets:
-            random.shuffle(wallets)
-
-        async def sem_task(wallet: Wallet):
-            async with semaphore:
-                try:
-                    await task_func(wallet)
-                except Exception as e:
-                    logger.error(f"[{wallet.id}] failed: {e}")
-
-        tasks = [asyncio.create_task(sem_task(wallet)) for wallet in wallets]
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-        if random_pause_wallet_after_completion == 0:
-            break
-
-        # update dynamically the pause time
-        next_run = datetime.now() + timedelta(seconds=random_pause_wallet_after_completion)
-        logger.info(f"Sleeping {random_pause_wallet_after_completion} seconds. Next run at: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-        await asyncio.sleep(random_pause_wallet_after_completion)
-
-
-async def activity(action: int):
+    await cooldown_sleep(random_sleep)
+
+
+async def execute(wallets: Iterable[tuple[int, datetime | None]], task_func, pause_min: int = 0, pause_max: int = 0, shard: int = 0) -> Counter:
+    scheduler = WalletScheduler(
+        task_func=task_func,
+        workers=Settings().threads,
+        in_flight=Settings().max_wallets_in_flight,
+        pause_min=pause_min,
+        pause_max=pause_max,
+        shuffle=Settings().shuffle_wallets,
+    )
+    logger.info(f"Found {scheduler.load(wallets)} wallets for action")
+    if not len(scheduler):
+        return scheduler.stats
+
+    exporter = MetricsExporter(shard=shard)
+    await exporter.start()
+    await WriteBuffer.start()
+    await EventLog.start()
+    try:
+        await scheduler.run()
+    finally:
+        await EventLog.stop()
+        await WriteBuffer.stop()
+        await exporter.stop()
+        SessionPool.log_stats()
+        await SessionPool.close_all()
+        AdaptiveLimiter.log_stats()
+        CircuitBreakers.log_stats()
+        RateLimits.log_stats()
+    return scheduler.stats
+
+
+def wallets_to_run() -> Iterator[tuple[int, datetime | None]]:
+    settings = Settings()
+    return select_wallets_to_run(
+        range_wallets=settings.range_wallets_to_run,
+        exact_wallets=settings.exact_wallets_to_run,
+        skip_complete_campaigns=Quests.CAMPAIGN_IDS if settings.only_incomplete_checkpoints else None,
+        skip_completed=True,
+        # the same wallets would stop right after start in complete_galxe_quests / _run_main_action
+        skip_banned=not settings.use_banned_galxe,
+        skip_bad_proxy=not settings.auto_replace_proxy,
+        min_points=settings.min_points_to_run,
+    )
+
+
+async def activity(action: int, workers: int = 1):
     if not check_encrypt_param():
         logger.error(f"Decryption Failed | Wrong Password")
         return
 
-    wallets = db.all(Wallet)
-    range_wallets = Settings().range_wallets_to_run
-    if range_wallets != [0, 0]:
-        start, end = range_wallets
-        wallets = [wallet for i, wallet in enumerate(wallets, start=1) if start <= i <= end]
-    else:
-        if Settings().exact_wallets_to_run:
-            wallets = [wallet for i, wallet in enumerate(wallets, start=1) if i in Settings().exact_wallets_to_run]
+    pause_min = Settings().random_pause_wallet_after_all_completion_min
+    pause_max = Settings().random_pause_wallet_after_all_completion_max
+
+    if Settings().proxy_preflight:
+        await ProxyPreflight().run()
 
-    logger.info(f"Found {len(wallets)} wallets for action")
-    if action == 1 and wallets:
-        await execute(
-            wallets,
-            start_main_action,
-            random.randint(Settings().random_pause_wallet_after_all_completion_min, Settings().random_pause_wallet_after_all_completion_max),
-        )
+    if action == 1 and workers > 1:
+        await run_sharded(wallets=list(wallets_to_run()), workers=workers, pause_min=pause_min, pause_max=pause_max)
+    elif action == 1:
+        await execute(wallets_to_run(), start_main_action, pause_min, pause_max)
 
 
 async def start_main_action(wallet):
+    try:
+        return await _run_main_action(wallet)
+    finally:
+        await SessionPool.release_wallet(wallet)
+
+
+async def _run_main_action(wallet):
     await random_sleep_before_start(wallet=wallet)
 
     settings = Settings()
@@ -86,37 +119,68 @@ async def start_main_action(wallet):
 
     controller = build_controller(wallet)
 
+    if proxy_checked_recently(wallet):
+        if wallet.proxy_status == "BAD":
+            logger.error(f"{wallet} proxy failed pre-flight check ({wallet.proxy_error}) and was not replaced -> skip")
+            return False
+        return await _complete_quests(controller, build_controller)
+
     errors = 0
     while True:
         try:
             await controller.base.browser.get(url="https://api.ipify.org")
             break  # proxy OK
+        except CircuitOpen:
+            # the check service itself is down, the wallet requests will show whether the proxy works
+            break
         except Exception as e:
             errors += 1
             logger.error(f"{controller.wallet} Proxy error: {e}. Retry {errors}/{max_retries}")
 
             if errors < max_retries:
                 logger.info(f"{controller.wallet} sleeping {sleep_s}s before retry")
-                await asyncio.sleep(sleep_s)
+                await cooldown_sleep(sleep_s)
                 continue
 
             if not auto_replace:
                 logger.error(f"{controller.wallet} proxy issue {errors}/{max_retries}; auto-replace disabled -> abort")
-                return
+                return False
 
             logger.warning(f"{controller.wallet} retries exhausted; attempting proxy replacement")
-            rm = ResourceManager()
-            await rm.mark_proxy_as_bad(controller.wallet.id)
-            success, message = await rm.replace_proxy(controller.wallet.id)
-            if not success:
-                logger.error(f"{controller.wallet} failed to replace proxy: {message}")
-                return
-
-            logger.success(f"{controller.wallet} proxy replaced: {message}")
-
-            wallet = get_wallet_by_address(address=controller.wallet.address) or controller.wallet
+            wallet = await _replace_proxy(controller.wallet)
+            if not wallet:
+                return False
 
             controller = build_controller(wallet)
             errors = 0
 
-    return await controller.complete_galxe_quests()
+    return await _complete_quests(controller, build_controller)
+
+
+async def _replace_proxy(wallet):
+    """Mark the wallet proxy as bad and give the wallet another one, returns the updated wallet or None"""
+    rm = ResourceManager()
+    await rm.mark_proxy_as_bad(wallet.id)
+    success, message = await rm.replace_proxy(wallet.id)
+    if not success:
+        logger.error(f"{wallet} failed to replace proxy: {message}")
+        return None
+
+    logger.success(f"{wallet} proxy replaced: {message}")
+    return await async_wallet_api.get_wallet_by_address(address=wallet.address) or wallet
+
+
+async def _complete_quests(controller, build_controller):
+    """Run the quests, a proxy failing mid-run is replaced once and the run continues from the checkpoints"""
+    try:
+        return await controller.complete_galxe_quests()
+    except ProxyRotationRequired as e:
+        if not Settings().auto_replace_proxy:
+            logger.error(f"{controller.wallet} proxy failed during the run ({e}); auto-replace disabled -> abort")
+            return False
+
+        logger.warning(f"{controller.wallet} proxy failed during the run ({e}); attempting proxy replacement")
+        wallet = await _replace_proxy(controller.wallet)
+        if not wallet:
+            return False
+        return await build_controller(wallet).complete_galxe_quests()
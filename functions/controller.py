@@ -9,7 +9,9 @@ from libs.eth_async.data.models import Networks
 from modules.quests_client import Quests
 
 from utils.db_api.models import Wallet
+from utils.circuit_breaker import CircuitOpen
 from utils.galxe.galxe_client import GalxeClient
+from utils.retry import ProxyRotationRequired
 from utils.twitter.twitter_client import TwitterClient
 
 
@@ -37,6 +39,8 @@ class Controller:
         for func in functions:
             try:
                 await func(galxe_client)
+            except (ProxyRotationRequired, CircuitOpen):
+                raise
             except Exception as e:
                 logger.error(f"{self.wallet} wrong with galxe quest: {e}")
                 continue
@@ -0,0 +1,130 @@
+# must be called before any other imports, worker processes start from this module
+from utils.pyarmor_bootstrap import ensure_pyarmor_runtime_on_path
+
+ensure_pyarmor_runtime_on_path()
+import asyncio
+import multiprocessing
+import platform
+import queue
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from loguru import logger
+
+from data import config
+
+_STOP = None
+
+
+def split_wallets(wallets: list, shards: int) -> list[list]:
+    """Round-robin split, so every shard gets the same share of early and late wallets"""
+    return [wallets[i::shards] for i in range(shards) if wallets[i::shards]]
+
+
+def _forward_logs(log_queue: multiprocessing.Queue) -> None:
+    while True:
+        item = log_queue.get()
+        if item is _STOP:
+            return
+        shard, level, message = item
+        logger.log(level, f"[shard {shard}] {message}")
+
+
+def _worker_main(
+    shard: int,
+    wallets: list[tuple[int, datetime | None]],
+    pause_min: int,
+    pause_max: int,
+    cipher_key: bytes | None,
+    log_queue: multiprocessing.Queue,
+    result_queue: multiprocessing.Queue,
+) -> None:
+    from data.settings import Settings
+    from functions.activity import execute, start_main_action
+    from utils.encryption import restore_cipher_suite
+
+    logger.remove()
+    logger.add(lambda msg: log_queue.put((shard, msg.record["level"].name, msg.record["message"])), level=Settings().log_level)
+
+    restore_cipher_suite(cipher_key)
+
+    if platform.system() == "Windows":
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    stats = Counter()
+    try:
+        stats = asyncio.run(execute(wallets, start_main_action, pause_min, pause_max, shard=shard))
+    except Exception as e:
+        logger.exception(f"shard crashed: {e}")
+    finally:
+        result_queue.put((shard, dict(stats)))
+
+
+async def run_sharded(wallets: list[tuple[int, datetime | None]], workers: int, pause_min: int = 0, pause_max: int = 0) -> Counter:
+    """
+    Run wallets in several processes, each with its own event loop and DB connection
+
+    Args:
+        wallets: (wallet_id, next_action_time) rows to run
+        workers: number of processes
+        pause_min: minimal pause before a wallet is due again
+        pause_max: maximal pause before a wallet is due again
+
+    Returns:
+        Summary counters of all shards
+    """
+    shards = split_wallets(wallets, workers)
+    if not shards:
+        logger.info("Found 0 wallets for action")
+        return Counter()
+
+    ctx = multiprocessing.get_context("spawn")
+    log_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+
+    forwarder = threading.Thread(target=_forward_logs, args=(log_queue,), daemon=True)
+    forwarder.start()
+
+    processes = [
+        ctx.Process(
+            target=_worker_main,
+            args=(shard, shard_wallets, pause_min, pause_max, config.CIPHER_KEY, log_queue, result_queue),
+            name=f"shard-{shard}",
+        )
+        for shard, shard_wallets in enumerate(shards, start=1)
+    ]
+
+    logger.info(f"Starting {len(processes)} worker processes for {len(wallets)} wallets")
+    started = time.monotonic()
+    loop = asyncio.get_running_loop()
+    try:
+        for process in processes:
+            process.start()
+        for process in processes:
+            await loop.run_in_executor(None, process.join)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        log_queue.put(_STOP)
+        forwarder.join()
+
+    summary = Counter()
+    for _ in processes:
+        try:
+            shard, stats = result_queue.get(timeout=1)
+        except queue.Empty:
+            break
+        summary.update(stats)
+        logger.info(f"[shard {shard}] done: {stats}")
+
+    elapsed = time.monotonic() - started
+    total = sum(summary.values())
+    per_hour = total / elapsed * 3600 if elapsed else 0
+    logger.success(
+        f"All shards finished in {elapsed:.0f}s | wallets: {total} | completed: {summary['completed']} | "
+        f"skipped: {summary['skipped']} | failed: {summary['failed']} | {per_hour:.0f} wallets/hour"
+    )
+    return summary
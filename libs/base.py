@@ -15,6 +15,7 @@ from libs.eth_async.client import Client
 from libs.eth_async.data.models import Networks, TokenAmount, TxArgs
 from utils.browser import Browser
 from utils.db_api.models import Wallet
+from utils.metrics import measure_stage
 from utils.retry import async_retry
 
 
@@ -209,7 +210,8 @@ class Base:
 
         return balance
 
-    @async_retry()
+    @measure_stage("tx")
+    @async_retry(policy="tx")
     async def execute_transaction(
         self,
         tx_params: TxParams,
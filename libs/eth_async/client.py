@@ -1,13 +1,16 @@
 import random
 import re
+import time
 
 import requests
 from eth_account.signers.local import LocalAccount
 from fake_useragent import UserAgent
-from web3 import Web3
+from web3 import AsyncHTTPProvider, Web3
 from web3.eth import AsyncEth
 
 from utils.encryption import get_private_key
+from utils.host_limiter import AdaptiveLimiter
+from utils.metrics import Metrics
 
 from . import exceptions
 from .contracts import Contracts
@@ -16,6 +19,27 @@ from .transactions import Transactions
 from .wallet import Wallet
 
 
+class LimitedAsyncHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider that goes through the per-host adaptive concurrency limiter"""
+
+    def __init__(self, *args, network: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.network_name = network
+
+    async def make_request(self, method, params):
+        started = time.monotonic()
+        result = "error"
+        try:
+            async with AdaptiveLimiter.request(self.endpoint_uri) as outcome:
+                response = await super().make_request(method, params)
+                outcome.status = 200
+            result = "error" if isinstance(response, dict) and response.get("error") else "ok"
+            return response
+        finally:
+            Metrics.observe("rpc_request_duration_seconds", time.monotonic() - started, network=self.network_name, method=method)
+            Metrics.inc("rpc_requests_total", network=self.network_name, method=method, result=result)
+
+
 class Client:
     network: Network
     account: LocalAccount
@@ -43,8 +67,10 @@ class Client:
                     raise exceptions.InvalidProxy(f"Proxy doesn't work! Your IP is {your_ip}.")
 
         self.w3 = Web3(
-            provider=Web3.AsyncHTTPProvider(
-                endpoint_uri=self.network.rpc, request_kwargs={"proxy": self.proxy, "headers": self.headers, "timeout": 360}
+            provider=LimitedAsyncHTTPProvider(
+                endpoint_uri=self.network.rpc,
+                request_kwargs={"proxy": self.proxy, "headers": self.headers, "timeout": 360},
+                network=self.network.name,
             ),
             modules={"eth": (AsyncEth,)},
             middlewares=[],
@@ -71,7 +97,9 @@ class Client:
         self.network = new_network
 
         self.w3 = Web3(
-            provider=Web3.AsyncHTTPProvider(endpoint_uri=self.network.rpc, request_kwargs={"proxy": self.proxy, "headers": self.headers}),
+            provider=LimitedAsyncHTTPProvider(
+                endpoint_uri=self.network.rpc, request_kwargs={"proxy": self.proxy, "headers": self.headers}, network=self.network.name
+            ),
             modules={"eth": (AsyncEth,)},
             middlewares=[],
         )
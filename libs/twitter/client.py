@@ -9,6 +9,10 @@ from curl_cffi import requests
 from loguru import logger
 from yarl import URL
 
+from utils.circuit_breaker import CircuitBreakers
+from utils.host_limiter import AdaptiveLimiter
+from utils.rate_limiter import RateLimits
+
 from ._capsolver.fun_captcha import FunCaptcha, FunCaptchaTypeEnm
 from .account import Account, AccountStatus
 from .base import BaseHTTPClient
@@ -140,8 +144,12 @@ class Client(BaseHTTPClient):
         logger.debug(log_message)
         # fmt: on
 
+        CircuitBreakers.check(url.host)
+        await RateLimits.acquire(host=url.host)
         try:
-            response = await self._session.request(method, str(url), **kwargs)
+            async with AdaptiveLimiter.request(url) as outcome:
+                response = await self._session.request(method, str(url), **kwargs)
+                outcome.status = response.status_code
         except requests.errors.RequestsError as exc:
             if exc.code == 35:
                 msg = "The IP address may have been blocked by Twitter. Blocked countries: Russia. " + str(exc)
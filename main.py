@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import platform
 
@@ -16,6 +17,7 @@ from functions.activity import activity
 from utils.create_files import create_files, reset_folder
 from utils.db_api.migrate import migrate
 from utils.db_import_export_sync import Export, Import, Sync
+from utils.fleet_report import show_fleet_report
 from utils.git_version import check_for_updates
 from utils.output import show_channel_info
 
@@ -29,7 +31,7 @@ PROJECT_ACTIONS = [
 UTILS_ACTIONS = ["1. Reset files Folder", "Back"]
 
 
-async def choose_action():
+async def choose_action(workers: int = 1):
     cat_question = [
         inquirer.List(
             "category",
@@ -46,7 +48,7 @@ async def choose_action():
         raise SystemExit(0)
 
     if category == "DB Actions":
-        actions = ["Import wallets to Database", "Sync wallets with tokens and proxies", "Export Database to CSV", "Back"]
+        actions = ["Import wallets to Database", "Sync wallets with tokens and proxies", "Export Database", "Show fleet report", "Back"]
 
     if category == PROJECT_NAME:
         actions = PROJECT_ACTIONS
@@ -71,12 +73,14 @@ async def choose_action():
     elif action == "Sync wallets with tokens and proxies":
         console.print(f"[bold blue]Starting sync data in DB[/bold blue]")
         await Sync.sync_wallets_with_tokens_and_proxies()
-    elif action == "Export Database to CSV":
-        console.print(f"[bold blue]Starting Export Database to CSV[/bold blue]")
-        await Export.data_to_csv()
+    elif action == "Export Database":
+        console.print(f"[bold blue]Starting Export Database[/bold blue]")
+        await Export.data()
+    elif action == "Show fleet report":
+        show_fleet_report()
 
     elif action == "1. Run All Activities":
-        await activity(action=1)
+        await activity(action=1, workers=workers)
 
     elif action == "1. Reset files Folder":
         console.print("This action will delete the files folder and reset it.")
@@ -89,22 +93,29 @@ async def choose_action():
         console.print(f"[bold red]Exiting {PROJECT_NAME}...[/bold red]")
         raise SystemExit(0)
 
-    await choose_action()
+    await choose_action(workers=workers)
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=PROJECT_NAME)
+    parser.add_argument("--workers", type=int, default=1, help="number of processes to split wallets between (default: 1)")
+    return parser.parse_args()
+
+
+async def main(workers: int = 1):
     check_python_version()
     create_files()
     migrate()
 
     await check_for_updates(repo_name=PROJECT_NAME)
-    await choose_action()
+    await choose_action(workers=workers)
 
 
 if __name__ == "__main__":
+    args = parse_args()
     show_channel_info(PROJECT_NAME)
 
     if platform.system() == "Windows":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-    asyncio.run(main())
+    asyncio.run(main(workers=args.workers))
@@ -9,54 +9,80 @@ from data.constants import EXT_WORLD_LIST
 from data.settings import Settings
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import Network, Networks
-from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import (
-    get_random_invite_code,
-    mark_complete_pioner_galxe,
-    twitter_creation_at,
-    update_points,
-    update_rank,
-    update_ref_code,
-    update_twitter_followers,
-)
+from utils.cooldown import cooldown_sleep
+from utils.db_api import async_wallet_api
+from utils.db_api.checkpoint_api import CAMPAIGN_CHECKPOINT
+from utils.db_api.models import QuestCheckpoint, Wallet
+from utils.event_log import EventLog
 from utils.galxe.galxe_client import GalxeClient
+from utils.metrics import Metrics, measure_stage
 from utils.resource_manager import ResourceManager
-from utils.retry import async_retry
+from utils.retry import async_retry, retry_budget
 from utils.twitter.twitter_client import TwitterClient
 
 
 class Quests:
+    CAMPAIGN_IDS = ["GCpict6X7N", "GC5mTt8px6", "GCoUVt8dHz"]
+
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
         self.proxy_errors = 0
+        self.checkpoints = {}
         self.twitter_client = TwitterClient(user=self.wallet)
 
     async def update_points(self, galxe_client):
         points, rank = await galxe_client.update_points_and_rank(campaign_id=81173)
-        update_points(address=self.wallet.address, points=points)
-        update_rank(address=self.wallet.address, rank=rank)
+        await async_wallet_api.update_points(address=self.wallet.address, points=points)
+        await async_wallet_api.update_rank(address=self.wallet.address, rank=rank)
         logger.info(f"{self.wallet} have {self.wallet.points} points and rank {self.wallet.rank} in Galxe")
 
     async def complete_quests(self, galxe_client: GalxeClient):
-        campaign_ids = ["GCpict6X7N", "GC5mTt8px6", "GCoUVt8dHz"]
-
-        for campaign_id in campaign_ids:
-            data = await self._get_campaign_data(galxe_client, campaign_id)
-            await self._save_ref_code(campaign_id=campaign_id, ref_code=data["referralCode"])
-            data = data["taskConfig"]
-            participate_tiers = self._parse_participate_tiers(data)
-            reward_tiers = self._parse_reward_tiers(data)
-            reward_claimed = reward_tiers[0]["rewardCount"]
-            logger.debug(f"{self.wallet} Rewards Claimed For campaign ({campaign_id}): {reward_claimed}")
-            referral_tiers = self._parse_referral_tiers(data)
-
-            await self._process_rewards(galxe_client, campaign_id, reward_tiers)
-            await self._ensure_participation(galxe_client, participate_tiers)
-            await self._referral_sync(galxe_client, referral_tiers)
+        self.checkpoints = await async_wallet_api.get_checkpoints(wallet_id=self.wallet.id)
 
-            await self._try_claim_points(galxe_client, campaign_id, reward_claimed)
+        for campaign_id in self.CAMPAIGN_IDS:
+            if self._is_claimed(campaign_id):
+                logger.debug(f"{self.wallet} campaign {campaign_id} already completed, skip")
+                continue
 
+            with EventLog.context(campaign_id=campaign_id):
+                data = await self._get_campaign_data(galxe_client, campaign_id)
+                await self._save_ref_code(campaign_id=campaign_id, ref_code=data["referralCode"])
+                data = data["taskConfig"]
+                participate_tiers = self._parse_participate_tiers(data)
+                reward_tiers = self._parse_reward_tiers(data)
+                reward_claimed = reward_tiers[0]["rewardCount"]
+                logger.debug(f"{self.wallet} Rewards Claimed For campaign ({campaign_id}): {reward_claimed}")
+                referral_tiers = self._parse_referral_tiers(data)
+
+                await self._process_rewards(galxe_client, campaign_id, reward_tiers)
+                await self._ensure_participation(galxe_client, campaign_id, participate_tiers)
+                await self._referral_sync(galxe_client, referral_tiers)
+
+                claimed = await self._try_claim_points(galxe_client, campaign_id, reward_claimed)
+                if claimed and all(self._is_synced(campaign_id, tier["cred_id"]) for tier in reward_tiers):
+                    await async_wallet_api.mark_campaign_claimed(wallet_id=self.wallet.id, campaign_id=campaign_id)
+                    self.checkpoints[(campaign_id, CAMPAIGN_CHECKPOINT)] = QuestCheckpoint(
+                        campaign_id=campaign_id, cred_id=CAMPAIGN_CHECKPOINT, synced=True, claimed=True
+                    )
+
+        if not self.wallet.completed and all(self._is_claimed(campaign_id) for campaign_id in self.CAMPAIGN_IDS):
+            # nothing is left to do for the wallet, activity runs don't select it anymore
+            await async_wallet_api.mark_completed(id=self.wallet.id)
+
+    def _is_synced(self, campaign_id: str, cred_id: int) -> bool:
+        checkpoint = self.checkpoints.get((campaign_id, cred_id))
+        return bool(checkpoint and checkpoint.synced)
+
+    def _is_claimed(self, campaign_id: str) -> bool:
+        checkpoint = self.checkpoints.get((campaign_id, CAMPAIGN_CHECKPOINT))
+        return bool(checkpoint and checkpoint.claimed)
+
+    async def _mark_synced(self, campaign_id: str, cred_id: int):
+        await async_wallet_api.mark_tier_synced(wallet_id=self.wallet.id, campaign_id=campaign_id, cred_id=cred_id)
+        self.checkpoints[(campaign_id, cred_id)] = QuestCheckpoint(campaign_id=campaign_id, cred_id=cred_id, synced=True)
+
+    @measure_stage("campaign_fetch")
     @async_retry()
     async def _get_campaign_data(self, galxe_client, campaign_id: str):
         info = await galxe_client.get_quest_cred_list(campaign_id=campaign_id)
@@ -69,7 +95,7 @@ class Quests:
             return True
         elif campaign_id == "GCoUVt8dHz" and self.wallet.third_quest_invite:
             return True
-        return update_ref_code(id=self.wallet.id, quest=campaign_id, ref_code=ref_code)
+        return await async_wallet_api.update_ref_code(id=self.wallet.id, quest=campaign_id, ref_code=ref_code)
 
     def _parse_participate_tiers(self, task_config):
         return [
@@ -111,19 +137,29 @@ class Quests:
 
     async def _process_rewards(self, galxe_client, campaign_id, reward_tiers):
         for tier in reward_tiers:
+            if self._is_synced(campaign_id, tier["cred_id"]):
+                continue
             if tier["eligible"]:
+                await self._mark_synced(campaign_id, tier["cred_id"])
                 continue
 
-            for attempt in range(Settings().retry):
-                success = await self._handle_tier(galxe_client, campaign_id, tier)
-                if success:
-                    logger.success(f"{self.wallet} success sync quest for {tier['name']} on Galxe. Sleep 60s")
-                    await asyncio.sleep(60)
-                    break
-                else:
+            # the attempts here and the retries of _handle_tier and its requests share one budget
+            with retry_budget() as budget:
+                for attempt in range(Settings().retry):
+                    with EventLog.context(cred_id=tier["cred_id"]):
+                        success = await self._handle_tier(galxe_client, campaign_id, tier)
+                    if success:
+                        await self._mark_synced(campaign_id, tier["cred_id"])
+                        logger.success(f"{self.wallet} success sync quest for {tier['name']} on Galxe. Sleep 60s")
+                        await cooldown_sleep(60)
+                        break
                     logger.warning(f"{self.wallet} can't sync quest for {tier['name']}, attempt {attempt + 1}")
-                    await asyncio.sleep(30)
+                    if not budget.take():
+                        logger.warning(f"{self.wallet} retry budget for {tier['name']} is spent, moving on")
+                        break
+                    await cooldown_sleep(30)
 
+    @measure_stage("sync_quest")
     @async_retry()
     async def _handle_tier(self, galxe_client, campaign_id, tier):
         name = tier["name"]
@@ -155,58 +191,69 @@ class Quests:
             return False
 
         logger.info(f"{self.wallet} sleep 30s after tweet post")
-        await asyncio.sleep(30)
+        await cooldown_sleep(30)
         for attempt in range(Settings().retry):
             sync = await galxe_client.sync_quest(cred_id=tier["cred_id"])
             if sync:
                 await self.twitter_client.delete_tweet(tweet=tweet.id)
                 return True
             logger.warning(f"{self.wallet} sync failed, retry {attempt + 1}")
-            await asyncio.sleep(30)
+            await cooldown_sleep(30)
         return False
 
-    async def _ensure_participation(self, galxe_client, participate_tiers):
+    async def _ensure_participation(self, galxe_client, campaign_id, participate_tiers):
         if self.wallet.pioner_galxe_completed:
             return
         tier = participate_tiers[0]
-        if not tier["eligible"]:
+        if self._is_synced(campaign_id, tier["cred_id"]):
+            return
+        if tier["eligible"]:
+            await self._mark_synced(campaign_id, tier["cred_id"])
+        else:
             for t in tier["attrs"]:
                 if "__typename" in t:
                     del t["__typename"]
 
             for _ in range(2):
-                sync = await galxe_client.sync_credit_value(attrs=tier["attrs"], cred_id=str(tier["cred_id"]))
+                with EventLog.context(cred_id=tier["cred_id"]):
+                    async with Metrics.stage("sync_quest") as outcome:
+                        sync = await galxe_client.sync_credit_value(attrs=tier["attrs"], cred_id=str(tier["cred_id"]))
+                        outcome["result"] = "ok" if sync else "fail"
                 if sync:
+                    await self._mark_synced(campaign_id, tier["cred_id"])
                     logger.success(f"{self.wallet} success sync requirements criteria on Galxe. Sleep 60s")
-                    await asyncio.sleep(60)
+                    await cooldown_sleep(60)
                     return
 
                 random_sleep = random.randint(80, 100)
                 logger.debug(f"{self.wallet} sync delayed. Auto retry in {random_sleep}s. ({_ + 1}/{Settings().retry}). No action needed")
-                await asyncio.sleep(random_sleep)
+                await cooldown_sleep(random_sleep)
 
     async def _referral_sync(self, galxe_client, referral_tiers):
         tier = referral_tiers[0]
         sync = await galxe_client.sync_credit_value(attrs=tier["attrs"], cred_id=str(tier["cred_id"]))
         if sync:
             logger.success(f"{self.wallet} success sync Referral quest on Galxe. Sleep 60s")
-            await asyncio.sleep(60)
+            await cooldown_sleep(60)
             return
         else:
             logger.debug(f"{self.wallet} can't sync for Referral quest on Galxe.")
             return
 
+    @measure_stage("claim_points")
     @async_retry()
-    async def _try_claim_points(self, galxe_client, campaign_id, reward_claimed: int):
+    async def _try_claim_points(self, galxe_client, campaign_id, reward_claimed: int) -> bool:
         if await galxe_client.get_subscription() or await self.check_available_claim():
-            ref_code = get_random_invite_code(id=self.wallet.id, quest=campaign_id) if reward_claimed == 0 else None
+            ref_code = await async_wallet_api.get_random_invite_code(id=self.wallet.id, quest=campaign_id) if reward_claimed == 0 else None
             logger.debug(f"{self.wallet} choose ref code: {ref_code}. For complete quest: {campaign_id}")
             if await galxe_client.claim_points(campaign_id=campaign_id, ref_code=ref_code):
                 if campaign_id == "GCoUVt8dHz":
                     logger.success(f"{self.wallet} success complete Pioneer Stone Campaign!. Sleep for 2m")
-                    mark_complete_pioner_galxe(address=self.wallet.address)
-                    await asyncio.sleep(120)
-                await asyncio.sleep(15)
+                    await async_wallet_api.mark_complete_pioner_galxe(address=self.wallet.address)
+                    await cooldown_sleep(120)
+                await cooldown_sleep(15)
+                return True
+        return False
 
     async def get_tweet_url(self, id: str):
         text = f"Verifying my Twitter account for my #GalxeID gid:{id} @Galxe "
@@ -214,7 +261,8 @@ class Quests:
         if tweet:
             return f"https://x.com/{self.twitter_client.twitter_account.username}/status/{tweet.id}"
 
-    @async_retry(delay=60)
+    @measure_stage("twitter_connect")
+    @async_retry(policy="twitter_connect")
     async def check_twitter_connect(self, galxe_client):
         self.twitter_client = TwitterClient(user=self.wallet)
         if self.wallet.twitter_status != "OK" and not Settings().auto_replace_twitter:
@@ -238,19 +286,19 @@ class Quests:
         if not follow_numbers:
             follow_numbers = 0
         logger.debug(f"{self.wallet} follow numbers: {follow_numbers}")
-        update_twitter_followers(address=self.wallet.address, followers=follow_numbers)
+        await async_wallet_api.update_twitter_followers(address=self.wallet.address, followers=follow_numbers)
         created_at_twitter = self.twitter_client.twitter_account.created_at
         logger.debug(f"{self.wallet} created_at_twitter: {created_at_twitter}")
         if created_at_twitter:
-            twitter_creation_at(address=self.wallet.address, creation_at=created_at_twitter)
+            await async_wallet_api.twitter_creation_at(address=self.wallet.address, creation_at=created_at_twitter)
         if follow_numbers and follow_numbers < 28 or created_at_twitter and datetime.now() - created_at_twitter < timedelta(days=91):
             logger.warning(
                 f"{self.wallet} can't complete Forto Galxe Campaign with this twitter account. Followers count: {follow_numbers}. Minimum need followers 28. Twitter created at: {created_at_twitter}. Need twitter > 3 months age. Please replace or upgrade this twitter token"
             )
             return False
 
-        session = await galxe_client.session()
-        twitter_connect_id = session["data"]["addressInfo"]["twitterUserID"]
+        user_info = await galxe_client.user_info()
+        twitter_connect_id = user_info.twitter_user_id
         twitter_id = self.twitter_client.twitter_account.id
 
         if twitter_connect_id and int(twitter_connect_id) != int(twitter_id):
@@ -261,8 +309,7 @@ class Quests:
             await asyncio.sleep(5)
 
         if not twitter_connect_id:
-            id = session["data"]["addressInfo"]["id"]
-            tweet_url = await self.get_tweet_url(id=id)
+            tweet_url = await self.get_tweet_url(id=user_info.id)
             if not tweet_url:
                 logger.error(f"{self.wallet} can't post tweets")
                 return False
@@ -1,43 +1,130 @@
 from typing import Optional
 
-from libs.baseAsyncSession import BaseAsyncSession
+from loguru import logger
+
+from data.settings import Settings
+from libs.baseAsyncSession import FINGERPRINT_DEFAULT, BaseAsyncSession
+from utils.circuit_breaker import CircuitBreakers
 from utils.db_api.models import Wallet
+from utils.host_limiter import AdaptiveLimiter
+from utils.rate_limiter import RateLimits
+
+
+class SessionPool:
+    """
+    Long-lived keep-alive sessions shared per (wallet, proxy, fingerprint)
+
+    The stats count sessions, not connections: a session sets up one connection per host it talks to
+    and keeps it alive, so `created` is an upper bound of the runs that paid for new handshakes.
+    """
+
+    _sessions: dict[tuple, BaseAsyncSession] = {}
+    created: int = 0
+    reused: int = 0
+
+    @staticmethod
+    def _key(wallet: Optional[Wallet], proxy: Optional[str], fingerprint: dict) -> tuple:
+        wallet_id = wallet.id if wallet else None
+        user_agent = fingerprint.get("headers", {}).get("user-agent") or fingerprint.get("user-agent")
+        return wallet_id, proxy, fingerprint.get("impersonate"), user_agent
+
+    @classmethod
+    def acquire(cls, wallet: Optional[Wallet], proxy: Optional[str], fingerprint: dict) -> BaseAsyncSession:
+        key = cls._key(wallet=wallet, proxy=proxy, fingerprint=fingerprint)
+        session = cls._sessions.get(key)
+        if session is not None:
+            cls.reused += 1
+            return session
+
+        session = BaseAsyncSession(proxy=proxy, fingerprint=fingerprint)
+        cls._sessions[key] = session
+        cls.created += 1
+        return session
+
+    @classmethod
+    async def release_wallet(cls, wallet: Wallet) -> None:
+        for key in [key for key in cls._sessions if key[0] == wallet.id]:
+            session = cls._sessions.pop(key)
+            try:
+                await session.close()
+            except Exception as e:
+                logger.debug(f"{wallet} failed to close pooled session: {e}")
+
+    @classmethod
+    async def close_all(cls) -> None:
+        sessions, cls._sessions = list(cls._sessions.values()), {}
+        for session in sessions:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.debug(f"failed to close pooled session: {e}")
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {"active": len(cls._sessions), "created": cls.created, "reused": cls.reused}
+
+    @classmethod
+    def log_stats(cls) -> None:
+        stats = cls.stats()
+        if stats["created"]:
+            logger.info(f"Session pool | created {stats['created']} sessions | reused them {stats['reused']} times | active {stats['active']}")
 
 
 class Browser:
     __module__ = "Browser"
 
-    def __init__(self, wallet: Optional[Wallet] = None):
+    def __init__(self, wallet: Optional[Wallet] = None, fingerprint: dict = FINGERPRINT_DEFAULT):
         self.wallet: Optional[Wallet] = wallet
+        self.fingerprint: dict = fingerprint
+        # only wallet sessions are pooled, release_wallet closes them at the end of the wallet run
+        self.pooled: bool = Settings().session_pool and wallet is not None
         self.async_session: Optional[BaseAsyncSession] = None
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._close_session()
+
     async def _ensure_session(self):
-        if self.async_session is None:
-            proxy = self.wallet.proxy if self.wallet else None
-            self.async_session = BaseAsyncSession(proxy=proxy)
+        proxy = self.wallet.proxy if self.wallet else None
+        if self.pooled:
+            # the proxy may have been replaced mid-run, so the pool is asked every time
+            self.async_session = SessionPool.acquire(wallet=self.wallet, proxy=proxy, fingerprint=self.fingerprint)
+        elif self.async_session is None:
+            self.async_session = BaseAsyncSession(proxy=proxy, fingerprint=self.fingerprint)
 
     async def _close_session(self):
+        if self.pooled:
+            self.async_session = None
+            return
         if self.async_session:
             await self.async_session.close()
             self.async_session = None
 
-    async def get(self, **kwargs):
+    async def _request(self, method: str, operation: Optional[str] = None, **kwargs):
+        url = kwargs.get("url")
+        payload = kwargs.get("json")
+        if operation is None and isinstance(payload, dict):
+            operation = payload.get("operationName")
+        host = AdaptiveLimiter.host_of(url)
+        CircuitBreakers.check(host)
+        await RateLimits.acquire(host=host, operation=operation)
+
         await self._ensure_session()
         try:
-            return await self.async_session.get(**kwargs)
+            async with AdaptiveLimiter.request(url) as outcome:
+                response = await self.async_session.request(method=method, **kwargs)
+                outcome.status = response.status_code
+                return response
         finally:
             await self._close_session()
 
+    async def get(self, **kwargs):
+        return await self._request("GET", **kwargs)
+
     async def post(self, **kwargs):
-        await self._ensure_session()
-        try:
-            return await self.async_session.post(**kwargs)
-        finally:
-            await self._close_session()
+        return await self._request("POST", **kwargs)
 
     async def put(self, **kwargs):
-        await self._ensure_session()
-        try:
-            return await self.async_session.put(**kwargs)
-        finally:
-            await self._close_session()
+        return await self._request("PUT", **kwargs)
@@ -8,6 +8,7 @@ from loguru import logger
 
 from utils.browser import Browser
 from utils.db_api.models import Wallet
+from utils.metrics import measure_captcha
 from data.settings import Settings
 
 
@@ -185,6 +186,7 @@ class CaptchaHandler:
         logger.error(f"{self.browser.wallet} exceeded wait time for CapMonster solution")
         return None
 
+    @measure_captcha("capmonster")
     async def recaptcha_handle(self, websiteURL: str, captcha_id: str, challenge: str) -> dict:
         max_retry = 10
         captcha_token = None
@@ -220,6 +222,7 @@ class CaptchaHandler:
 
         return captcha_token
 
+    @measure_captcha("capmonster")
     async def cloudflare_token(self, websiteURL:str, websiterKey: str):
         max_retry = 10
         captcha_token = None
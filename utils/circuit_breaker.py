@@ -0,0 +1,177 @@
+import time
+from typing import Optional
+
+from loguru import logger
+
+from data.settings import Settings
+from utils.metrics import Metrics
+from utils.retry import ROTATE_PROXY, FatalError, classify
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# circuit_breaker_state gauge values
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpen(FatalError):
+    """The upstream host is down, requests to it fail fast until its breaker lets a probe through"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"{host} is unavailable (circuit open), retry in {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single upstream host, shared by all wallets
+
+    `failures` consecutive failed requests (transport errors or 5xx) open it. While open, requests
+    raise CircuitOpen without reaching the host. After `open_seconds` one probe request is let through
+    (half-open): its success closes the breaker, its failure opens it again.
+    """
+
+    def __init__(self, host: str, failures: int, open_seconds: float):
+        self.host = host
+        self.failures = max(1, failures)
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def _transition(self, state: str, reason: str) -> None:
+        previous, self.state = self.state, state
+        Metrics.inc("circuit_breaker_transitions_total", host=self.host, state=state)
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            logger.warning(f"Circuit breaker | {self.host} {previous} -> open ({reason}), failing requests fast for {self.open_seconds}s")
+        elif state == HALF_OPEN:
+            logger.info(f"Circuit breaker | {self.host} open -> half-open, sending a probe request")
+        else:
+            logger.success(f"Circuit breaker | {self.host} {previous} -> closed ({reason})")
+
+    def retry_after(self) -> float:
+        return max(1.0, self.opened_at + self.open_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Let a request through or raise CircuitOpen
+
+        Returns:
+            True if the request is the half-open probe
+        """
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN, reason="open timeout")
+
+        if self.state == CLOSED:
+            return False
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self._reject()
+
+    def check(self) -> None:
+        """Raise CircuitOpen if a request would be rejected now, without taking the probe"""
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN and time.monotonic() - self.opened_at < self.open_seconds or self.state == HALF_OPEN and self._probe_in_flight:
+            self._reject()
+
+    def _reject(self) -> None:
+        self.rejected += 1
+        Metrics.inc("circuit_breaker_rejected_total", host=self.host)
+        raise CircuitOpen(host=self.host, retry_after=self.retry_after())
+
+    def record(self, status: Optional[int], error: Optional[BaseException], probe: bool) -> None:
+        """
+        Update the breaker with the outcome of one request
+
+        Args:
+            status: HTTP status code, None if no response was received
+            error: transport error raised by the request
+            probe: the request was the half-open probe
+        """
+        if probe:
+            self._probe_in_flight = False
+
+        if status is None and error is not None:
+            # a dead wallet proxy says nothing about the host
+            if classify(error) == ROTATE_PROXY:
+                return
+            failed, reason = True, error.__class__.__name__
+        elif status is not None and status >= 500:
+            failed, reason = True, f"http {status}"
+        elif status is None:
+            # cancelled request, the next one probes again
+            return
+        else:
+            failed, reason = False, f"http {status}"
+
+        if not failed:
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                self._transition(CLOSED, reason=f"request answered {reason}")
+            return
+
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN and probe:
+            self._transition(OPEN, reason=f"probe failed: {reason}")
+        elif self.state == CLOSED and self.consecutive_failures >= self.failures:
+            self._transition(OPEN, reason=f"{self.consecutive_failures} failures in a row, last: {reason}")
+
+    def stats(self) -> dict:
+        return {"state": self.state, "trips": self.trips, "rejected": self.rejected, "failures": self.consecutive_failures}
+
+
+class CircuitBreakers:
+    """Registry of per-host circuit breakers shared by Browser, web3 providers and the Twitter client"""
+
+    _hosts: dict[str, CircuitBreaker] = {}
+    _enabled: Optional[bool] = None
+
+    @classmethod
+    def get(cls, host: str) -> Optional[CircuitBreaker]:
+        """Breaker of the host, None if circuit breakers are disabled"""
+        if cls._enabled is None:
+            cls._enabled = Settings().circuit_breaker
+        if not cls._enabled:
+            return None
+
+        breaker = cls._hosts.get(host)
+        if breaker is None:
+            settings = Settings()
+            breaker = CircuitBreaker(host=host, failures=settings.circuit_breaker_failures, open_seconds=settings.circuit_breaker_open_seconds)
+            cls._hosts[host] = breaker
+        return breaker
+
+    @classmethod
+    def check(cls, host: str) -> None:
+        """Fail fast before waiting in rate limit queues, the probe itself is taken in AdaptiveLimiter.request"""
+        breaker = cls.get(host)
+        if breaker:
+            breaker.check()
+
+    @classmethod
+    def stats(cls) -> dict[str, dict]:
+        return {host: breaker.stats() for host, breaker in cls._hosts.items()}
+
+    @classmethod
+    def collect_metrics(cls) -> None:
+        for host, breaker in cls._hosts.items():
+            Metrics.set("circuit_breaker_state", STATE_VALUES[breaker.state], host=host)
+
+    @classmethod
+    def log_stats(cls) -> None:
+        for host, stats in cls.stats().items():
+            if stats["trips"]:
+                logger.info(f"Circuit breaker | {host} | {stats['state']} | opened {stats['trips']} times | rejected {stats['rejected']} requests")
+
+
+Metrics.add_collector(CircuitBreakers.collect_metrics)
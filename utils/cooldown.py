@@ -0,0 +1,80 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from data.settings import Settings
+
+
+@dataclass
+class _Slot:
+    task: Optional[asyncio.Task]
+    held: bool = False
+
+
+_current_slot: ContextVar[Optional[_Slot]] = ContextVar("current_slot", default=None)
+
+
+class ActiveSlots:
+    """Limits how many wallets are actively working, as opposed to sleeping out a cooldown"""
+
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _limit: int = 0
+
+    @classmethod
+    def configure(cls, limit: Optional[int] = None) -> None:
+        cls._limit = max(1, limit or Settings().threads)
+        cls._semaphore = asyncio.Semaphore(cls._limit)
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        if cls._semaphore is None:
+            cls.configure()
+        return cls._semaphore
+
+    @classmethod
+    def in_use(cls) -> int:
+        if cls._semaphore is None:
+            return 0
+        return cls._limit - cls._semaphore._value
+
+    @classmethod
+    @asynccontextmanager
+    async def hold(cls):
+        """Occupy an active slot for the current task until the block exits"""
+        semaphore = cls._get_semaphore()
+        slot = _Slot(task=asyncio.current_task())
+        await semaphore.acquire()
+        slot.held = True
+        token = _current_slot.set(slot)
+        try:
+            yield slot
+        finally:
+            _current_slot.reset(token)
+            if slot.held:
+                slot.held = False
+                semaphore.release()
+
+
+async def cooldown_sleep(seconds: float) -> None:
+    """
+    Sleep without occupying an active slot
+
+    The slot of the current wallet task is given back for the duration of the sleep
+    and taken again afterwards, so other wallets can work in the meantime.
+    Outside of ActiveSlots.hold() this is a plain asyncio.sleep.
+    """
+    slot = _current_slot.get()
+    if not slot or not slot.held or slot.task is not asyncio.current_task():
+        await asyncio.sleep(seconds)
+        return
+
+    semaphore = ActiveSlots._get_semaphore()
+    slot.held = False
+    semaphore.release()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        await semaphore.acquire()
+        slot.held = True
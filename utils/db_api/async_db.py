@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
+
+from data.settings import Settings
+from utils.db_api.wallet_api import db
+
+
+class AsyncDB:
+    """
+    Runs blocking DB calls off the event loop.
+
+    Writes go through a single writer thread, so they are applied one by one in submit order and
+    never fight each other for the SQLite lock. Reads run in a separate thread on their own connection,
+    with WAL enabled they are not blocked by a commit in progress. Every thread works with its own
+    session, objects returned from a read are detached but keep their loaded attributes.
+    """
+
+    _writer: Optional[ThreadPoolExecutor] = None
+    _reader: Optional[ThreadPoolExecutor] = None
+    _enabled: Optional[bool] = None
+
+    @classmethod
+    def enabled(cls) -> bool:
+        if cls._enabled is None:
+            cls._enabled = Settings().async_db
+        return cls._enabled
+
+    @staticmethod
+    def _call(func: Callable, args: tuple, kwargs: dict) -> Any:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            db.s.remove()
+
+    @classmethod
+    async def write(cls, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a function from wallet_api that changes data in the writer thread
+
+        Args:
+            func: blocking function working with `db`
+            args, kwargs: its arguments
+
+        Returns:
+            Whatever the function returns
+        """
+        if not cls.enabled():
+            return func(*args, **kwargs)
+        if cls._writer is None:
+            cls._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        return await asyncio.get_running_loop().run_in_executor(cls._writer, partial(cls._call, func, args, kwargs))
+
+    @classmethod
+    async def read(cls, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a read-only function from wallet_api in the reader thread
+
+        Args:
+            func: blocking function working with `db`
+            args, kwargs: its arguments
+
+        Returns:
+            Whatever the function returns
+        """
+        if not cls.enabled():
+            return func(*args, **kwargs)
+        if cls._reader is None:
+            cls._reader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db-reader")
+        return await asyncio.get_running_loop().run_in_executor(cls._reader, partial(cls._call, func, args, kwargs))
+
+    @classmethod
+    def refresh(cls, model, values: dict, **match) -> None:
+        """
+        Put values written by the writer thread into matching objects already loaded by the event loop session,
+        so code holding such an object sees its own writes without another query
+
+        Args:
+            model: ORM class of the objects
+            values: column -> new value
+            match: column -> value the object must have to be updated
+        """
+        if cls.enabled():
+            apply_to_loaded(model, values, **match)
+
+
+def apply_to_loaded(model, values: dict, **match) -> None:
+    """Set values on objects of the event loop session matching all columns in match, without marking them dirty"""
+    for obj in list(db.s.identity_map.values()):
+        if not isinstance(obj, model):
+            continue
+        # expired objects are skipped, they reload the fresh row on the next attribute access anyway
+        loaded = inspect(obj).dict
+        if all(key in loaded and loaded[key] == value for key, value in match.items()):
+            for key, value in values.items():
+                set_committed_value(obj, key, value)
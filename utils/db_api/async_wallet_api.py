@@ -0,0 +1,144 @@
+"""
+Awaitable versions of the wallet_api / checkpoint_api functions used while wallets are running.
+Same arguments and results as the blocking ones, the work itself is done by AsyncDB threads.
+Field updates of a single wallet go to the WriteBuffer when it is enabled, set-based queries
+flush it first so they see those values.
+"""
+
+from datetime import datetime
+
+from utils.db_api import checkpoint_api, wallet_api
+from utils.db_api.async_db import AsyncDB
+from utils.db_api.models import QuestCheckpoint, Wallet
+from utils.db_api.write_buffer import WriteBuffer
+from utils.invite_pool import InvitePool
+
+
+async def _update_wallet(func, values: dict, match: dict, **kwargs) -> bool:
+    if WriteBuffer.enabled():
+        # a missing wallet is found out only on flush, the update of it is a no-op there
+        WriteBuffer.update(values, **match)
+        return True
+
+    updated = await AsyncDB.write(func, **kwargs)
+    if updated:
+        AsyncDB.refresh(Wallet, values, **match)
+    return updated
+
+
+async def update_twitter_token(address: str, updated_token: str | None) -> bool:
+    if not updated_token:
+        return False
+    return await _update_wallet(
+        wallet_api.update_twitter_token, {"twitter_token": updated_token}, {"address": address}, address=address, updated_token=updated_token
+    )
+
+
+async def update_next_action_time(address: str, next_action_time) -> bool:
+    return await _update_wallet(
+        wallet_api.update_next_action_time,
+        {"next_action_time": next_action_time},
+        {"address": address},
+        address=address,
+        next_action_time=next_action_time,
+    )
+
+
+async def mark_galxe_account_banned(id: int) -> bool:
+    return await _update_wallet(wallet_api.mark_galxe_account_banned, {"galxe_account_banned": True}, {"id": id}, id=id)
+
+
+async def mark_complete_pioner_galxe(address: str) -> bool:
+    return await _update_wallet(wallet_api.mark_complete_pioner_galxe, {"pioner_galxe_completed": True}, {"address": address}, address=address)
+
+
+async def mark_completed(id: int) -> bool:
+    return await _update_wallet(wallet_api.mark_completed, {"completed": True}, {"id": id}, id=id)
+
+
+async def update_rank(address: str, rank: int) -> bool:
+    return await _update_wallet(wallet_api.update_rank, {"rank": rank}, {"address": address}, address=address, rank=rank)
+
+
+async def update_points(address: str, points: int) -> bool:
+    return await _update_wallet(wallet_api.update_points, {"points": points}, {"address": address}, address=address, points=points)
+
+
+async def update_twitter_followers(address: str, followers: int) -> bool:
+    return await _update_wallet(
+        wallet_api.update_twitter_followers, {"twitter_follow_count": followers}, {"address": address}, address=address, followers=followers
+    )
+
+
+async def twitter_creation_at(address: str, creation_at) -> bool:
+    return await _update_wallet(
+        wallet_api.twitter_creation_at, {"twitter_creation_at": creation_at}, {"address": address}, address=address, creation_at=creation_at
+    )
+
+
+async def mark_twitter_status(id: int, status: str) -> bool:
+    return await _update_wallet(wallet_api.mark_twitter_status, {"twitter_status": status}, {"id": id}, id=id, status=status)
+
+
+async def replace_bad_proxy(id: int, new_proxy: str) -> bool:
+    return await _update_wallet(
+        wallet_api.replace_bad_proxy,
+        {"proxy": new_proxy, "proxy_status": "OK", **wallet_api.PROXY_CHECK_RESET},
+        {"id": id},
+        id=id,
+        new_proxy=new_proxy,
+    )
+
+
+async def update_ref_code(id: int, quest: str, ref_code: str) -> bool:
+    column = wallet_api.INVITE_COLUMNS.get(quest, "third_quest_invite")
+    updated = await _update_wallet(wallet_api.update_ref_code, {column: ref_code}, {"id": id}, id=id, quest=quest, ref_code=ref_code)
+    if updated:
+        InvitePool.add(wallet_id=id, campaign_id=quest, code=ref_code)
+    return updated
+
+
+async def save_proxy_check(proxy: str, ok: bool, latency_ms: int | None, exit_ip: str | None, error: str | None) -> int:
+    await WriteBuffer.flush()
+    return await AsyncDB.write(wallet_api.save_proxy_check, proxy=proxy, ok=ok, latency_ms=latency_ms, exit_ip=exit_ip, error=error)
+
+
+async def get_proxies_to_check(checked_before: datetime) -> list[str]:
+    await WriteBuffer.flush()
+    return await AsyncDB.read(wallet_api.get_proxies_to_check, checked_before=checked_before)
+
+
+async def get_wallet_ids_by_proxy(proxy: str) -> list[int]:
+    await WriteBuffer.flush()
+    return await AsyncDB.read(wallet_api.get_wallet_ids_by_proxy, proxy=proxy)
+
+
+def _attach(wallet: Wallet | None) -> Wallet | None:
+    # rows from the reader thread are detached, in the event loop session they get AsyncDB.refresh and WriteBuffer values
+    if wallet is None or not AsyncDB.enabled():
+        return wallet
+    return wallet_api.db.s.merge(wallet, load=False)
+
+
+async def get_wallet(id: int) -> Wallet | None:
+    return _attach(await AsyncDB.read(wallet_api.get_wallet_by_id, id=id))
+
+
+async def get_wallet_by_address(address: str) -> Wallet | None:
+    return _attach(await AsyncDB.read(wallet_api.get_wallet_by_address, address=address))
+
+
+async def get_random_invite_code(id: int, quest: str) -> str | None:
+    return await InvitePool.pick(wallet_id=id, campaign_id=quest)
+
+
+async def get_checkpoints(wallet_id: int) -> dict[tuple[str, int], QuestCheckpoint]:
+    return await AsyncDB.read(checkpoint_api.get_checkpoints, wallet_id=wallet_id)
+
+
+async def mark_tier_synced(wallet_id: int, campaign_id: str, cred_id: int) -> None:
+    await AsyncDB.write(checkpoint_api.mark_tier_synced, wallet_id=wallet_id, campaign_id=campaign_id, cred_id=cred_id)
+
+
+async def mark_campaign_claimed(wallet_id: int, campaign_id: str) -> None:
+    await AsyncDB.write(checkpoint_api.mark_campaign_claimed, wallet_id=wallet_id, campaign_id=campaign_id)
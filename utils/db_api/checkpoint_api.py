@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.sqlite import insert
+
+from utils.db_api.models import QuestCheckpoint
+from utils.db_api.wallet_api import db
+
+CAMPAIGN_CHECKPOINT = 0
+
+
+def get_checkpoints(wallet_id: int) -> dict[tuple[str, int], QuestCheckpoint]:
+    rows = db.all(QuestCheckpoint, QuestCheckpoint.wallet_id == wallet_id)
+    return {(row.campaign_id, row.cred_id): row for row in rows}
+
+
+def _upsert_checkpoint(wallet_id: int, campaign_id: str, cred_id: int, **values) -> None:
+    stmt = insert(QuestCheckpoint).values(wallet_id=wallet_id, campaign_id=campaign_id, cred_id=cred_id, **values)
+    stmt = stmt.on_conflict_do_update(index_elements=["wallet_id", "campaign_id", "cred_id"], set_=values)
+    db.s.execute(stmt)
+    db.commit()
+
+
+def mark_tier_synced(wallet_id: int, campaign_id: str, cred_id: int) -> None:
+    _upsert_checkpoint(wallet_id=wallet_id, campaign_id=campaign_id, cred_id=cred_id, synced=True, synced_at=datetime.now())
+
+
+def mark_campaign_claimed(wallet_id: int, campaign_id: str) -> None:
+    now = datetime.now()
+    _upsert_checkpoint(
+        wallet_id=wallet_id, campaign_id=campaign_id, cred_id=CAMPAIGN_CHECKPOINT, synced=True, synced_at=now, claimed=True, claimed_at=now
+    )
+
+
+def complete_wallet_ids_stmt(campaign_ids: list[str]) -> Select:
+    """Wallets that have a claimed checkpoint for every campaign, to be used as a subquery"""
+    return (
+        select(QuestCheckpoint.wallet_id)
+        .where(QuestCheckpoint.cred_id == CAMPAIGN_CHECKPOINT, QuestCheckpoint.claimed.is_(True))
+        .where(QuestCheckpoint.campaign_id.in_(campaign_ids))
+        .group_by(QuestCheckpoint.wallet_id)
+        .having(func.count(QuestCheckpoint.campaign_id.distinct()) == len(campaign_ids))
+    )
+
+
+def get_complete_wallet_ids(campaign_ids: list[str]) -> set[int]:
+    """Wallets that have a claimed checkpoint for every campaign"""
+    return set(db.s.scalars(complete_wallet_ids_stmt(campaign_ids)).all())
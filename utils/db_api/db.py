@@ -1,22 +1,34 @@
 from loguru import logger
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.exc import DatabaseError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 
 class DB:
-    def __init__(self, db_url: str, **kwargs):
+    def __init__(self, db_url: str, wal: bool = False, **kwargs):
         """
         Initializes a class.
 
         :param str db_url: a URL containing all the necessary parameters to connect to a DB
+        :param bool wal: switch SQLite to WAL journal, so readers and the writer don't block each other
         """
         self.db_url = db_url
         self.engine = create_engine(self.db_url, **kwargs)
+        if wal and self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", self._set_sqlite_pragmas)
         self.Base = None
-        self.s: Session = Session(bind=self.engine)
+        # every thread gets its own session and connection, the main thread keeps using the same one as before
+        self.s: Session = scoped_session(sessionmaker(bind=self.engine))
         self.conn = self.engine.connect()
 
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=10000")
+        cursor.close()
+
     def create_tables(self, base):
         """
         Creates tables.
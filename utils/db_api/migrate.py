@@ -1,7 +1,95 @@
-from utils.db_api.db import DB
-from utils.db_api.models import Wallet
+from typing import Callable
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from utils.db_api.models import Base, Event, QuestCheckpoint, Wallet
+from utils.db_api.wallet_api import db
+
+
+def _create_tables() -> None:
+    # new DBs get everything here, older ones get their missing tables and columns
+    db.create_tables(Base)
+    for model in (Wallet, QuestCheckpoint):
+        db.ensure_model_columns(model=model)
+
+
+def _create_status_indexes() -> None:
+    # create_all doesn't add indexes to tables that already exist
+    with db.engine.begin() as conn:
+        for column in ("proxy_status", "twitter_status", "galxe_account_banned", "next_action_time"):
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_wallets_{column} ON wallets ({column})"))
+
+
+def _create_events() -> None:
+    Event.__table__.create(db.engine, checkfirst=True)
+    with db.engine.begin() as conn:
+        # nearest-rank percentiles: the smallest duration with at least p of the stage events at or below it
+        conn.execute(
+            text(
+                """
+                CREATE VIEW IF NOT EXISTS event_stage_latency AS
+                WITH ranked AS (
+                    SELECT stage, duration_ms,
+                           ROW_NUMBER() OVER (PARTITION BY stage ORDER BY duration_ms) AS rn,
+                           COUNT(*) OVER (PARTITION BY stage) AS cnt
+                    FROM events
+                )
+                SELECT stage,
+                       MAX(cnt) AS events,
+                       MIN(CASE WHEN rn >= 0.50 * cnt THEN duration_ms END) AS p50_ms,
+                       MIN(CASE WHEN rn >= 0.90 * cnt THEN duration_ms END) AS p90_ms,
+                       MIN(CASE WHEN rn >= 0.99 * cnt THEN duration_ms END) AS p99_ms,
+                       MAX(duration_ms) AS max_ms
+                FROM ranked
+                GROUP BY stage
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                CREATE VIEW IF NOT EXISTS event_stage_success AS
+                SELECT stage,
+                       COUNT(*) AS events,
+                       SUM(outcome = 'ok') AS ok,
+                       SUM(outcome = 'fail') AS fail,
+                       SUM(outcome = 'error') AS error,
+                       ROUND(100.0 * SUM(outcome = 'ok') / COUNT(*), 2) AS success_rate
+                FROM events
+                GROUP BY stage
+                """
+            )
+        )
+
+
+# (version, description, step), append new steps to the end and never change applied ones.
+# Steps must be safe to run again, a step interrupted before its version is stored is repeated on the next start
+MIGRATIONS: list[tuple[int, str, Callable[[], None]]] = [
+    (1, "tables and columns of the models", _create_tables),
+    (2, "indexes on wallet status columns", _create_status_indexes),
+    (3, "events table and its stage views", _create_events),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: Connection) -> int:
+    conn.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)"))
+    return conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar() or 0
 
 
 def migrate():
-    db = DB("sqlite:///files/wallets.db")
-    db.ensure_model_columns(model=Wallet)
+    """Bring the wallets DB to SCHEMA_VERSION, a DB that is already there costs a single query"""
+    with db.engine.begin() as conn:
+        version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        return
+
+    for step_version, description, step in MIGRATIONS:
+        if step_version <= version:
+            continue
+        logger.info(f"[schema] migration {step_version}: {description}")
+        step()
+        with db.engine.begin() as conn:
+            conn.execute(text("INSERT INTO schema_version (version) VALUES (:version)"), {"version": step_version})
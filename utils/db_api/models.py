@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from data.constants import PROJECT_SHORT_NAME
@@ -16,17 +17,22 @@ class Wallet(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     private_key: Mapped[str] = mapped_column(unique=True, index=True)
     address: Mapped[str] = mapped_column(unique=True)
-    proxy_status: Mapped[str] = mapped_column(default="OK", nullable=True)
+    proxy_status: Mapped[str] = mapped_column(default="OK", nullable=True, index=True)
     proxy: Mapped[str] = mapped_column(default=None, nullable=True)
-    galxe_account_banned: Mapped[bool] = mapped_column(default=False)
+    proxy_latency_ms: Mapped[int | None] = mapped_column(default=None)
+    proxy_exit_ip: Mapped[str | None] = mapped_column(default=None)
+    proxy_error: Mapped[str | None] = mapped_column(default=None)
+    proxy_checked_at: Mapped[datetime | None] = mapped_column(default=None)
+    galxe_account_banned: Mapped[bool] = mapped_column(default=False, index=True)
     twitter_token: Mapped[str] = mapped_column(default=None, nullable=True)
-    twitter_status: Mapped[str] = mapped_column(default="OK", nullable=True)
+    twitter_status: Mapped[str] = mapped_column(default="OK", nullable=True, index=True)
     twitter_follow_count: Mapped[int] = mapped_column(default=0, nullable=False)
     twitter_creation_at: Mapped[datetime | None] = mapped_column(default=None)
     points: Mapped[int] = mapped_column(nullable=True, default=None)
     rank: Mapped[int] = mapped_column(nullable=True, default=None)
     pioner_galxe_completed: Mapped[bool] = mapped_column(default=False)
     completed: Mapped[bool] = mapped_column(default=False)
+    next_action_time: Mapped[datetime | None] = mapped_column(default=None, index=True)
     first_quest_invite: Mapped[str] = mapped_column(default=None, nullable=True)
     second_quest_invite: Mapped[str] = mapped_column(default=None, nullable=True)
     third_quest_invite: Mapped[str] = mapped_column(default=None, nullable=True)
@@ -35,3 +41,37 @@ class Wallet(Base):
         if Settings().show_wallet_address_logs:
             return f"[{PROJECT_SHORT_NAME} | {self.id} | {self.address}]"
         return f"[{PROJECT_SHORT_NAME} | {self.id}]"
+
+
+class QuestCheckpoint(Base):
+    __tablename__ = "quest_checkpoints"
+    __table_args__ = (UniqueConstraint("wallet_id", "campaign_id", "cred_id"),)
+
+    # cred_id 0 is the checkpoint of the whole campaign
+    id: Mapped[int] = mapped_column(primary_key=True)
+    wallet_id: Mapped[int] = mapped_column(ForeignKey("wallets.id"), index=True)
+    campaign_id: Mapped[str]
+    cred_id: Mapped[int] = mapped_column(default=0)
+    synced: Mapped[bool] = mapped_column(default=False)
+    claimed: Mapped[bool] = mapped_column(default=False)
+    synced_at: Mapped[datetime | None] = mapped_column(default=None)
+    claimed_at: Mapped[datetime | None] = mapped_column(default=None)
+
+
+class Event(Base):
+    """Append-only history of wallet pipeline stages"""
+
+    __tablename__ = "events"
+    __table_args__ = (Index("ix_events_stage_started_at", "stage", "started_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    wallet_id: Mapped[int | None] = mapped_column(default=None, index=True)
+    stage: Mapped[str]
+    campaign_id: Mapped[str | None] = mapped_column(default=None)
+    cred_id: Mapped[int | None] = mapped_column(default=None)
+    started_at: Mapped[datetime]
+    finished_at: Mapped[datetime]
+    duration_ms: Mapped[int]
+    # ok, fail (the stage returned an unsuccessful result) or error (exception, its class is in error)
+    outcome: Mapped[str]
+    error: Mapped[str | None] = mapped_column(default=None)
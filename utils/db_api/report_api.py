@@ -0,0 +1,157 @@
+from sqlalchemy import and_, case, distinct, func, select, text
+
+from utils.db_api.checkpoint_api import CAMPAIGN_CHECKPOINT
+from utils.db_api.models import Event, QuestCheckpoint, Wallet
+from utils.db_api.wallet_api import db
+
+# (label, lowest points) of the points buckets, a wallet goes to the last bucket it reaches
+POINTS_BUCKETS = [("0", 0), ("1-49", 1), ("50-99", 50), ("100-199", 100), ("200-499", 200), ("500+", 500)]
+
+# the step where a wallet tops itself up, its last failure means the wallet can't pay for the subscription
+FUNDING_STAGE = "bridge"
+
+
+def fleet_summary() -> dict:
+    row = db.s.execute(
+        select(
+            func.count(Wallet.id).label("wallets"),
+            func.count(Wallet.points).label("with_points"),
+            func.coalesce(func.sum(Wallet.points), 0).label("points_total"),
+            func.avg(Wallet.points).label("points_avg"),
+            func.max(Wallet.points).label("points_max"),
+            func.min(Wallet.rank).label("best_rank"),
+            func.count(case((Wallet.pioner_galxe_completed.is_(True), 1))).label("pioneer_completed"),
+            func.count(case((Wallet.galxe_account_banned.is_(True), 1))).label("galxe_banned"),
+        )
+    ).one()
+    return row._asdict()
+
+
+def points_distribution() -> list[dict]:
+    """Wallets, points and rank range per points bucket"""
+    points = func.coalesce(Wallet.points, 0)
+    bucket = case(*[(points >= low, label) for label, low in reversed(POINTS_BUCKETS)], else_=POINTS_BUCKETS[0][0]).label("bucket")
+    rows = db.s.execute(
+        select(
+            bucket,
+            func.count(Wallet.id).label("wallets"),
+            func.sum(points).label("points"),
+            func.min(Wallet.rank).label("best_rank"),
+            func.max(Wallet.rank).label("worst_rank"),
+        ).group_by(bucket)
+    ).all()
+    by_label = {row.bucket: row._asdict() for row in rows}
+    return [by_label[label] for label, _ in POINTS_BUCKETS if label in by_label]
+
+
+def twitter_breakdown() -> list[dict]:
+    """Wallets per Twitter status, wallets without a token are counted separately"""
+    status = case((Wallet.twitter_token.is_(None), "NO TOKEN"), else_=func.coalesce(Wallet.twitter_status, "OK")).label("status")
+    rows = db.s.execute(
+        select(
+            status,
+            func.count(Wallet.id).label("wallets"),
+            func.avg(Wallet.twitter_follow_count).label("followers_avg"),
+        )
+        .group_by(status)
+        .order_by(func.count(Wallet.id).desc())
+    ).all()
+    return [row._asdict() for row in rows]
+
+
+def proxy_health() -> list[dict]:
+    """Wallets per proxy status with the preflight latency and how many proxies were checked"""
+    status = case((Wallet.proxy.is_(None), "NO PROXY"), else_=func.coalesce(Wallet.proxy_status, "OK")).label("status")
+    rows = db.s.execute(
+        select(
+            status,
+            func.count(Wallet.id).label("wallets"),
+            func.count(distinct(Wallet.proxy)).label("proxies"),
+            func.count(Wallet.proxy_checked_at).label("checked"),
+            func.avg(Wallet.proxy_latency_ms).label("latency_avg_ms"),
+            func.max(Wallet.proxy_latency_ms).label("latency_max_ms"),
+        )
+        .group_by(status)
+        .order_by(func.count(Wallet.id).desc())
+    ).all()
+    return [row._asdict() for row in rows]
+
+
+def campaign_funnel(campaign_ids: list[str]) -> list[dict]:
+    """
+    Per campaign: wallets that started it, synced every tier seen so far, and claimed it
+
+    Args:
+        campaign_ids: campaigns in the order to show them
+
+    Returns:
+        one dict per campaign, campaigns without checkpoints have zeros
+    """
+    tiers = (
+        select(
+            QuestCheckpoint.campaign_id,
+            QuestCheckpoint.wallet_id,
+            func.count(case((QuestCheckpoint.cred_id != CAMPAIGN_CHECKPOINT, 1))).label("tiers"),
+            func.count(case((and_(QuestCheckpoint.cred_id != CAMPAIGN_CHECKPOINT, QuestCheckpoint.synced.is_(True)), 1))).label("synced"),
+            func.max(case((and_(QuestCheckpoint.cred_id == CAMPAIGN_CHECKPOINT, QuestCheckpoint.claimed.is_(True)), 1), else_=0)).label("claimed"),
+        )
+        .where(QuestCheckpoint.campaign_id.in_(campaign_ids))
+        .group_by(QuestCheckpoint.campaign_id, QuestCheckpoint.wallet_id)
+        .subquery()
+    )
+    rows = db.s.execute(
+        select(
+            tiers.c.campaign_id,
+            func.count().label("started"),
+            func.count(case((and_(tiers.c.tiers > 0, tiers.c.synced == tiers.c.tiers), 1))).label("synced"),
+            func.sum(tiers.c.claimed).label("claimed"),
+        ).group_by(tiers.c.campaign_id)
+    ).all()
+    by_campaign = {row.campaign_id: row._asdict() for row in rows}
+    return [by_campaign.get(campaign_id, {"campaign_id": campaign_id, "started": 0, "synced": 0, "claimed": 0}) for campaign_id in campaign_ids]
+
+
+def blocked_on_funding() -> list[dict]:
+    """
+    Wallets without the Pioneer campaign whose last funding attempt failed, grouped by the error
+
+    Returns:
+        (error, wallets, last attempt) rows, empty if there is no event history
+    """
+    attempts = (
+        select(
+            Event.wallet_id,
+            Event.outcome,
+            Event.error,
+            Event.started_at,
+            func.row_number().over(partition_by=Event.wallet_id, order_by=Event.started_at.desc()).label("rn"),
+        )
+        .where(Event.stage == FUNDING_STAGE, Event.wallet_id.is_not(None))
+        .subquery()
+    )
+    error = func.coalesce(attempts.c.error, attempts.c.outcome).label("error")
+    rows = db.s.execute(
+        select(error, func.count().label("wallets"), func.max(attempts.c.started_at).label("last_attempt"))
+        .select_from(attempts)
+        .join(Wallet, Wallet.id == attempts.c.wallet_id)
+        .where(attempts.c.rn == 1, attempts.c.outcome != "ok")
+        .where(Wallet.pioner_galxe_completed.is_not(True))
+        .group_by(error)
+        .order_by(func.count().desc())
+    ).all()
+    return [row._asdict() for row in rows]
+
+
+def stage_history() -> list[dict]:
+    """Per stage outcomes and latency percentiles from the event views, empty if there is no event history"""
+    rows = db.s.execute(
+        text(
+            """
+            SELECT s.stage, s.events, s.ok, s.fail, s.error, s.success_rate, l.p50_ms, l.p90_ms, l.p99_ms, l.max_ms
+            FROM event_stage_success AS s
+            JOIN event_stage_latency AS l ON l.stage = s.stage
+            ORDER BY s.events DESC
+            """
+        )
+    ).all()
+    return [row._asdict() for row in rows]
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import func, or_, select
+
+from utils.db_api.checkpoint_api import complete_wallet_ids_stmt
+from utils.db_api.models import Wallet
+from utils.db_api.wallet_api import db
+
+
+def select_wallets_to_run(
+    range_wallets: Optional[list[int]] = None,
+    exact_wallets: Optional[list[int]] = None,
+    skip_complete_campaigns: Optional[list[str]] = None,
+    skip_completed: bool = False,
+    skip_banned: bool = False,
+    skip_bad_proxy: bool = False,
+    min_points: int = 0,
+    batch_size: int = 1000,
+) -> Iterator[tuple[int, datetime | None]]:
+    """
+    Stream (wallet_id, next_action_time) rows of wallets to run, all filtering is done by SQLite
+
+    Args:
+        range_wallets: [start, end] positions of wallets in the DB (1-based, ordered by id), [0, 0] - all
+        exact_wallets: positions of wallets, used when no range is set
+        skip_complete_campaigns: skip wallets with a claimed checkpoint for every campaign of the list
+        skip_completed: skip wallets marked as completed (every campaign claimed)
+        skip_banned: skip wallets with a banned Galxe account
+        skip_bad_proxy: skip wallets whose proxy is marked as bad
+        min_points: skip wallets with less Galxe points
+        batch_size: rows fetched from the DB at a time
+
+    Returns:
+        Iterator over the rows in id order
+    """
+    stmt = select(Wallet.id, Wallet.next_action_time)
+
+    # positions are counted over the whole table, before any other filter, same as the wallet numbers in logs
+    positions = None
+    if range_wallets and range_wallets != [0, 0]:
+        start, end = max(range_wallets[0], 1), range_wallets[1]
+        positions = Wallet.id.in_(select(Wallet.id).order_by(Wallet.id).offset(start - 1).limit(max(end - start + 1, 0)))
+    elif exact_wallets:
+        numbered = select(Wallet.id, func.row_number().over(order_by=Wallet.id).label("position")).subquery()
+        positions = Wallet.id.in_(select(numbered.c.id).where(numbered.c.position.in_(exact_wallets)))
+    if positions is not None:
+        stmt = stmt.where(positions)
+
+    if skip_complete_campaigns:
+        stmt = stmt.where(Wallet.id.not_in(complete_wallet_ids_stmt(skip_complete_campaigns)))
+    if skip_completed:
+        stmt = stmt.where(Wallet.completed.is_not(True))
+    if skip_banned:
+        stmt = stmt.where(or_(Wallet.galxe_account_banned.is_(None), Wallet.galxe_account_banned.is_(False)))
+    if skip_bad_proxy:
+        stmt = stmt.where(or_(Wallet.proxy_status.is_(None), Wallet.proxy_status != "BAD"))
+    if min_points:
+        stmt = stmt.where(func.coalesce(Wallet.points, 0) >= min_points)
+
+    rows = db.s.execute(stmt.order_by(Wallet.id).execution_options(yield_per=batch_size))
+    for row in rows:
+        yield row.id, row.next_action_time
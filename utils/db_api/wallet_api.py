@@ -1,9 +1,18 @@
 import random
+from datetime import datetime
+
+from sqlalchemy import select, update
 
 from data.config import WALLETS_DB
 from data.settings import Settings
 from utils.db_api.db import DB
-from utils.db_api.models import Base, Wallet
+from utils.db_api.models import Wallet
+
+# wallet column with the own invite code per campaign, the third campaign is the default
+INVITE_COLUMNS = {"GCpict6X7N": "first_quest_invite", "GC5mTt8px6": "second_quest_invite", "GCoUVt8dHz": "third_quest_invite"}
+
+# pre-flight result of the wallet proxy, cleared whenever the proxy changes so the new one gets checked
+PROXY_CHECK_RESET = {"proxy_latency_ms": None, "proxy_exit_ip": None, "proxy_error": None, "proxy_checked_at": None}
 
 
 def get_wallets(sqlite_query: bool = False) -> list[Wallet]:
@@ -13,6 +22,10 @@ def get_wallets(sqlite_query: bool = False) -> list[Wallet]:
     return db.all(entities=Wallet)
 
 
+def get_wallet_by_id(id: int) -> Wallet | None:
+    return db.one(Wallet, Wallet.id == id)
+
+
 def get_wallet_by_private_key(private_key: str, sqlite_query: bool = False) -> Wallet | None:
     if sqlite_query:
         return db.execute("SELECT * FROM wallets WHERE private_key = ?", (private_key,), True)
@@ -68,6 +81,15 @@ def mark_galxe_account_banned(id: int) -> bool:
     return True
 
 
+def mark_completed(id: int) -> bool:
+    wallet = db.one(Wallet, Wallet.id == id)
+    if not wallet:
+        return False
+    wallet.completed = True
+    db.commit()
+    return True
+
+
 def mark_complete_pioner_galxe(address: str):
     wallet = db.one(Wallet, Wallet.address == address)
     if not wallet:
@@ -125,6 +147,8 @@ def replace_bad_proxy(id: int, new_proxy: str) -> bool:
         return False
     wallet.proxy = new_proxy
     wallet.proxy_status = "OK"
+    for column, value in PROXY_CHECK_RESET.items():
+        setattr(wallet, column, value)
     db.commit()
     return True
 
@@ -148,6 +172,36 @@ def mark_proxy_as_bad(id: int) -> bool:
     return True
 
 
+def get_proxies_to_check(checked_before: datetime) -> list[str]:
+    stmt = (
+        select(Wallet.proxy)
+        .where(Wallet.proxy.isnot(None))
+        .where((Wallet.proxy_checked_at.is_(None)) | (Wallet.proxy_checked_at < checked_before))
+        .distinct()
+    )
+    return list(db.s.scalars(stmt).all())
+
+
+def save_proxy_check(proxy: str, ok: bool, latency_ms: int | None, exit_ip: str | None, error: str | None) -> int:
+    result = db.s.execute(
+        update(Wallet)
+        .where(Wallet.proxy == proxy)
+        .values(
+            proxy_status="OK" if ok else "BAD",
+            proxy_latency_ms=latency_ms,
+            proxy_exit_ip=exit_ip,
+            proxy_error=error,
+            proxy_checked_at=datetime.now(),
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def get_wallet_ids_by_proxy(proxy: str) -> list[int]:
+    return list(db.s.scalars(select(Wallet.id).where(Wallet.proxy == proxy)).all())
+
+
 def mark_twitter_status(id: int, status: str) -> bool:
     wallet = db.one(Wallet, Wallet.id == id)
     if not wallet:
@@ -230,5 +284,5 @@ def update_ref_code(id: int, quest: str, ref_code: str) -> bool:
     return True
 
 
-db = DB(f"sqlite:///{WALLETS_DB}", echo=False, pool_recycle=3600, connect_args={"check_same_thread": False})
-db.create_tables(Base)
+# tables are created and upgraded by utils.db_api.migrate.migrate() at startup
+db = DB(f"sqlite:///{WALLETS_DB}", wal=Settings().async_db, echo=False, pool_recycle=3600, connect_args={"check_same_thread": False})
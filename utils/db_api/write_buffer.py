@@ -0,0 +1,164 @@
+import asyncio
+import atexit
+import time
+from collections import defaultdict
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import bindparam, event, inspect
+from sqlalchemy.orm.attributes import set_committed_value
+
+from data.settings import Settings
+from utils.db_api.async_db import AsyncDB, apply_to_loaded
+from utils.db_api.models import Wallet
+from utils.db_api.wallet_api import db
+from utils.metrics import Metrics
+
+
+class WriteBuffer:
+    """
+    Write-behind buffer for wallet field updates.
+
+    Updates are merged per wallet in memory (the last value of a field wins) and written as one
+    transaction every `write_buffer_interval` seconds and on stop. Until then they are visible
+    to the process: loaded Wallet objects get the new values at once and rows loaded later are
+    patched with the pending ones, so the code always reads its own writes.
+    """
+
+    _pending: dict[tuple[str, object], dict] = {}
+    _flushing: dict[tuple[str, object], dict] = {}
+    _lock: Optional[asyncio.Lock] = None
+    _task: Optional[asyncio.Task] = None
+    _interval: Optional[float] = None
+
+    @classmethod
+    def enabled(cls) -> bool:
+        if cls._interval is None:
+            cls._interval = Settings().write_buffer_interval or 0
+        return cls._interval > 0
+
+    @staticmethod
+    def _key(id: Optional[int], address: Optional[str]) -> tuple[str, object]:
+        if id is not None:
+            return "id", id
+        # the same wallet updated by id and by address must end up in one entry, otherwise the order of writes is lost
+        for obj in list(db.s.identity_map.values()):
+            if isinstance(obj, Wallet):
+                loaded = inspect(obj).dict
+                if loaded.get("address") == address and "id" in loaded:
+                    return "id", loaded["id"]
+        return "address", address
+
+    @classmethod
+    def update(cls, values: dict, id: Optional[int] = None, address: Optional[str] = None) -> None:
+        """
+        Queue new field values of a wallet
+
+        Args:
+            values: column -> new value
+            id: wallet id
+            address: wallet address, used when the id is not known
+        """
+        column, key = cls._key(id, address)
+        # entries are replaced, not changed in place, rows may be loaded by the reader thread meanwhile
+        cls._pending[(column, key)] = {**cls._pending.get((column, key), {}), **values}
+        apply_to_loaded(Wallet, values, **{column: key})
+        Metrics.inc("db_buffered_updates_total")
+
+    @classmethod
+    def pending_for(cls, id: Optional[int], address: Optional[str]) -> dict:
+        values = {}
+        for entries in (cls._flushing, cls._pending):
+            values.update(entries.get(("address", address), {}))
+            values.update(entries.get(("id", id), {}))
+        return values
+
+    @staticmethod
+    def _write(batch: dict[tuple[str, object], dict]) -> None:
+        groups = defaultdict(list)
+        for (column, key), values in batch.items():
+            groups[(column, tuple(sorted(values)))].append({"k": key, **{f"v_{field}": value for field, value in values.items()}})
+
+        table = Wallet.__table__
+        try:
+            for (column, fields), params in groups.items():
+                stmt = table.update().where(table.c[column] == bindparam("k")).values({field: bindparam(f"v_{field}") for field in fields})
+                db.s.execute(stmt, params)
+            db.s.commit()
+        except Exception:
+            db.s.rollback()
+            raise
+
+    @classmethod
+    async def flush(cls) -> int:
+        """
+        Write everything queued so far in one transaction
+
+        Returns:
+            Number of wallets written
+        """
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if not cls._pending:
+                return 0
+            batch, cls._pending = cls._pending, {}
+            cls._flushing = batch
+            started = time.monotonic()
+            try:
+                await AsyncDB.write(cls._write, batch)
+            except Exception:
+                # keep the batch, values queued meanwhile are newer and win
+                for key, values in batch.items():
+                    cls._pending[key] = {**values, **cls._pending.get(key, {})}
+                raise
+            finally:
+                cls._flushing = {}
+            Metrics.observe("db_flush_duration_seconds", time.monotonic() - started)
+            logger.debug(f"DB write buffer | flushed {len(batch)} wallets")
+            return len(batch)
+
+    @classmethod
+    def flush_sync(cls) -> None:
+        """Last resort at interpreter exit for values queued outside of a started buffer"""
+        if cls._pending:
+            batch, cls._pending = cls._pending, {}
+            cls._write(batch)
+
+    @classmethod
+    async def _flush_loop(cls) -> None:
+        while True:
+            await asyncio.sleep(cls._interval)
+            try:
+                await cls.flush()
+            except Exception as e:
+                logger.error(f"DB write buffer | flush failed, will retry: {e}")
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls.enabled() and cls._task is None:
+            cls._task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        await cls.flush()
+        # the next run may happen in another event loop
+        cls._lock = None
+
+
+def _apply_pending(target, *args) -> None:
+    loaded = inspect(target).dict
+    for field, value in WriteBuffer.pending_for(loaded.get("id"), loaded.get("address")).items():
+        set_committed_value(target, field, value)
+
+
+event.listen(Wallet, "load", _apply_pending)
+event.listen(Wallet, "refresh", _apply_pending)
+atexit.register(WriteBuffer.flush_sync)
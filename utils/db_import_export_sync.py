@@ -1,17 +1,19 @@
-import csv
 import os
 import sys
-from types import SimpleNamespace
 from typing import Dict, List, Optional
 
 from loguru import logger
+from sqlalchemy import case, select, update
+from sqlalchemy.dialects.sqlite import insert
 
+from data import config
 from data.config import FILES_DIR
-from libs.eth_async.client import Client
-from libs.eth_async.data.models import Networks
+from data.settings import Settings
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db, get_wallet_by_address
-from utils.encryption import check_encrypt_param, get_private_key, prk_encrypt
+from utils.db_api.wallet_api import PROXY_CHECK_RESET, db
+from utils.encryption import check_encrypt_param, get_private_key
+from utils.key_derivation import derive_wallets
+from utils.wallet_export import export_wallets
 
 
 def parse_proxy(proxy: str | None) -> Optional[str]:
@@ -59,6 +61,28 @@ def remove_line_from_file(value: str, filename: str) -> bool:
     return True
 
 
+def remove_lines_from_file(values: set[str], filename: str) -> int:
+    """remove_line_from_file for many values with a single rewrite of the file"""
+    file_path = os.path.join(FILES_DIR, filename)
+
+    if not values or not os.path.isfile(file_path):
+        return 0
+
+    values = {value.strip() for value in values}
+    with open(file_path, encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f]
+
+    keep = [line for line in lines if line.strip() not in values]
+
+    if len(keep) == len(lines):
+        return 0
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        for line in keep:
+            f.write(line + "\n")
+    return len(lines) - len(keep)
+
+
 def read_lines(path: str) -> List[str]:
     file_path = os.path.join(FILES_DIR, path)
     if not os.path.isfile(file_path):
@@ -99,68 +123,62 @@ class Import:
 
         logger.success("Wallet import to the database is in progress…")
 
-        wallets = [SimpleNamespace(**w) for w in raw_wallets]
-
-        imported: list[Wallet] = []
-        edited: list[Wallet] = []
-        total = len(wallets)
-
-        check_wallets = db.all(Wallet)
+        total = len(raw_wallets)
 
-        if len(check_wallets) > 0:
+        check_wallet = db.one(stmt=select(Wallet).limit(1))
+        if check_wallet:
             # Check pwd1
             try:
-                check_wallet = check_wallets[0]
                 get_private_key(check_wallet.private_key)
 
             except Exception as e:
                 sys.exit(f"Database not empty | You must use same password for new wallets | {e}")
 
-        for wl in wallets:
-            decoded_private_key = get_private_key(wl.private_key)
-
-            client = Client(private_key=decoded_private_key, network=Networks.Ethereum)
-
-            wallet_instance = get_wallet_by_address(address=client.account.address)
-
-            if wallet_instance:
-                changed = False
-
-                if wallet_instance.address == client.account.address:
-                    wallet_instance.private_key = prk_encrypt(decoded_private_key) if not "gAAAA" in wl.private_key else wl.private_key
-                    changed = True
-
-                if wallet_instance.proxy != wl.proxy:
-                    wallet_instance.proxy = wl.proxy
-                    changed = True
-
-                if hasattr(wallet_instance, "twitter_token") and wallet_instance.twitter_token != wl.twitter_token:
-                    wallet_instance.twitter_token = wl.twitter_token
-                    changed = True
-
-                if changed:
-                    db.commit()
-                    edited.append(wallet_instance)
-                    remove_line_from_file(wl.private_key, "private_keys.txt")
+        cipher_key = config.CIPHER_KEY if Settings().private_key_encryption else None
+        derived = derive_wallets([wl["private_key"] for wl in raw_wallets], cipher_key=cipher_key)
 
+        rows: Dict[str, dict] = {}
+        broken: list[str] = []
+        for wl, result in zip(raw_wallets, derived):
+            if result is None:
+                broken.append(wl["private_key"])
                 continue
-
-            wallet_instance = Wallet(
-                private_key=prk_encrypt(wl.private_key) if not "gAAAA" in wl.private_key else wl.private_key,
-                address=client.account.address,
-                proxy=wl.proxy,
-                twitter_token=wl.twitter_token,
+            _, address, private_key = result
+            # the same key listed twice is imported once, the last line wins like with one by one import
+            rows[address] = {"private_key": private_key, "address": address, "proxy": wl["proxy"], "twitter_token": wl["twitter_token"]}
+
+        existing = set(db.s.scalars(select(Wallet.address)).all())
+
+        if rows:
+            table = Wallet.__table__
+            stmt = insert(table)
+            # a changed proxy drops the pre-flight result of the old one
+            proxy_changed = table.c.proxy.is_distinct_from(stmt.excluded.proxy)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.address],
+                set_={
+                    "private_key": stmt.excluded.private_key,
+                    "proxy": stmt.excluded.proxy,
+                    "twitter_token": stmt.excluded.twitter_token,
+                    **{column: case((proxy_changed, None), else_=table.c[column]) for column in PROXY_CHECK_RESET},
+                },
             )
+            db.s.execute(stmt, list(rows.values()))
+            db.commit()
 
-            remove_line_from_file(wl.private_key, "private_keys.txt")
+        # broken keys stay in the file, everything else is in the DB now
+        remove_lines_from_file({wl["private_key"] for wl in raw_wallets} - set(broken), "private_keys.txt")
 
-            if not wallet_instance.twitter_token:
-                logger.warning(f"{wallet_instance.id} | {wallet_instance.address} | Twitter Token not found, Twitter Action will be skipped")
+        for value in broken:
+            logger.error(f"Can't import private key {value[:6]}… | broken key or wrong password, it is left in private_keys.txt")
 
-            db.insert(wallet_instance)
-            imported.append(wallet_instance)
+        without_twitter = sum(1 for row in rows.values() if not row["twitter_token"])
+        if without_twitter:
+            logger.warning(f"{without_twitter} wallets have no Twitter Token, Twitter Action will be skipped for them")
 
-        logger.success(f"Done! imported wallets: {len(imported)}/{total}; edited wallets: {len(edited)}/{total}; total: {total}")
+        imported = len(rows.keys() - existing)
+        edited = len(rows.keys() & existing)
+        logger.success(f"Done! imported wallets: {imported}/{total}; edited wallets: {edited}/{total}; total: {total}")
 
 
 class Sync:
@@ -184,55 +202,34 @@ class Sync:
 
     @staticmethod
     async def sync_wallets_with_tokens_and_proxies():
-        if not check_encrypt_param():
-            logger.error(f"Decryption Failed | Wrong Password")
-            return
-
-        wallets = db.all(Wallet)
+        # wallet N (in id order) gets line N of twitter_tokens.txt and a proxy picked the same way as on import
+        wallets = db.s.execute(select(Wallet.id, Wallet.proxy, Wallet.twitter_token).order_by(Wallet.id)).all()
 
         if len(wallets) <= 0:
             logger.warning("No wallets in DB, nothing to update")
             return
 
-        wallet_auxiliary_data_raw = Sync.parse_tokens_and_proxies_from_txt(wallets)
-
-        wallet_auxiliary_data = [SimpleNamespace(**w) for w in wallet_auxiliary_data_raw]
-
-        if len(wallet_auxiliary_data) != len(wallets):
-            logger.warning("Mismatch between wallet data and tokens/proxies data. Exiting sync.")
-            return
+        wallet_auxiliary_data = Sync.parse_tokens_and_proxies_from_txt(wallets)
 
         total = len(wallets)
 
         logger.info(f"Start syncing wallets: {total}")
 
-        edited: list[Wallet] = []
-        for wl in wallets:
-            decoded_private_key = get_private_key(wl.private_key)
-
-            client = Client(private_key=decoded_private_key, network=Networks.Ethereum)
-
-            wallet_instance = get_wallet_by_address(address=client.account.address)
-
-            if wallet_instance:
-                changed = False
+        changes: list[dict] = []
+        for wl, wallet_data in zip(wallets, wallet_auxiliary_data):
+            values = {}
+            if wl.proxy != wallet_data["proxy"]:
+                values.update(proxy=wallet_data["proxy"], proxy_status="OK", **PROXY_CHECK_RESET)
+            if wl.twitter_token != wallet_data["twitter_token"]:
+                values.update(twitter_token=wallet_data["twitter_token"], twitter_status="OK")
+            if values:
+                changes.append({"id": wl.id, **values})
 
-                wallet_data = wallet_auxiliary_data[wallet_instance.id - 1]
-                if wallet_instance.proxy != wallet_data.proxy:
-                    wallet_instance.proxy = wallet_data.proxy
-                    wallet_instance.proxy_status = "OK"
-                    changed = True
+        if changes:
+            db.s.execute(update(Wallet), changes)
+            db.commit()
 
-                if hasattr(wallet_instance, "twitter_token") and wallet_instance.twitter_token != wallet_data.twitter_token:
-                    wallet_instance.twitter_token = wallet_data.twitter_token
-                    wallet_instance.twitter_status = "OK"
-                    changed = True
-
-                if changed:
-                    db.commit()
-                    edited.append(wallet_instance)
-
-        logger.success(f"Done! edited wallets: {len(edited)}/{total}; total: {total}")
+        logger.success(f"Done! edited wallets: {len(changes)}/{total}; total: {total}")
 
 
 class Export:
@@ -243,41 +240,28 @@ class Export:
     }
 
     @staticmethod
-    async def data_to_csv() -> None:
-        if not check_encrypt_param():
+    async def data() -> None:
+        settings = Settings()
+        decrypt = settings.private_key_encryption and settings.export_decrypt_keys
+        if decrypt and not check_encrypt_param():
             logger.error(f"Decryption Failed | Wrong Password")
             return
 
-        wallets: List[Wallet] = db.all(Wallet)
+        fmt = settings.export_format
+        path = os.path.join(FILES_DIR, f"export_data.{fmt}")
+        try:
+            exported = export_wallets(
+                path=path,
+                fmt=fmt,
+                columns=settings.export_columns,
+                filters=settings.export_filters,
+                cipher_key=config.CIPHER_KEY if decrypt else None,
+            )
+        except (ValueError, RuntimeError) as e:
+            logger.error(f"Export: {e}")
+            return
 
-        if not wallets:
+        if not exported:
             logger.warning("Export: no wallets in db, skip....")
             return
-
-        keys_set = set()
-        for w in wallets:
-            for k in getattr(w, "__dict__", {}).keys():
-                if not k.startswith("_"):
-                    keys_set.add(k)
-
-        preferred = [
-            "id",
-            "address",
-            "private_key",
-            "proxy",
-            "twitter_token",
-        ]
-
-        fieldnames = [k for k in preferred if k in keys_set] + sorted(k for k in keys_set if k not in preferred)
-
-        path = os.path.join(FILES_DIR, "export_data.csv")
-
-        with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-
-            for w in wallets:
-                row = {k: v for k, v in getattr(w, "__dict__", {}).items() if not k.startswith("_")}
-                writer.writerow(row)
-
-        logger.success(f"Export: Database to CSV | Wallets exported: {len(wallets)} | Path: {path}")
+        logger.success(f"Export: Database to {fmt.upper()} | Wallets exported: {exported} | Path: {path}")
@@ -34,19 +34,23 @@ def _derive_fernet_key(password: bytes, salt=None) -> bytes:
 
 def set_cipher_suite(password) -> None:
     if Settings().private_key_encryption:
-        cipher = Fernet(_derive_fernet_key(password))
-
         if not os.path.exists(SALT_PATH):
-            cipher = Fernet(_derive_fernet_key(password))
-
-            config.CIPHER_SUITE = cipher
+            key = _derive_fernet_key(password)
 
         else:
             with open(SALT_PATH, "rb") as f:
                 salt = f.read()
 
-            cipher = Fernet(_derive_fernet_key(password, salt))
-            config.CIPHER_SUITE = cipher
+            key = _derive_fernet_key(password, salt)
+
+        restore_cipher_suite(key)
+
+
+def restore_cipher_suite(key: bytes | None) -> None:
+    """Install an already derived Fernet key, e.g. in a worker process that can't prompt for the password"""
+    if key:
+        config.CIPHER_KEY = key
+        config.CIPHER_SUITE = Fernet(key)
 
 
 def get_private_key(enc_value: str) -> str:
@@ -0,0 +1,130 @@
+import asyncio
+import atexit
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import insert
+
+from data.settings import Settings
+from utils.db_api.async_db import AsyncDB
+from utils.db_api.models import Event
+from utils.db_api.wallet_api import db
+from utils.metrics import Metrics
+
+# wallet_id / campaign_id / cred_id of the stages started in the current task
+_context: ContextVar[dict] = ContextVar("event_context", default={})
+
+
+class EventLog:
+    """
+    Writes every finished pipeline stage (see Metrics.stage) to the events table.
+
+    Recording only appends to a list, rows are inserted in batches by a background task
+    through the DB writer thread, so stages never wait for the DB.
+    """
+
+    BATCH_SIZE = 500
+    INTERVAL = 5
+
+    _rows: list[dict] = []
+    _task: Optional[asyncio.Task] = None
+    _wake: Optional[asyncio.Event] = None
+    _enabled: Optional[bool] = None
+
+    @classmethod
+    def enabled(cls) -> bool:
+        if cls._enabled is None:
+            cls._enabled = Settings().event_log
+        return cls._enabled
+
+    @staticmethod
+    @contextmanager
+    def context(**fields):
+        """Attach wallet_id, campaign_id or cred_id to the events of the stages run inside the block"""
+        token = _context.set({**_context.get(), **fields})
+        try:
+            yield
+        finally:
+            _context.reset(token)
+
+    @classmethod
+    def record(cls, stage: str, started_at: datetime, finished_at: datetime, outcome: str, error: Optional[str] = None) -> None:
+        if not cls.enabled():
+            return
+        context = _context.get()
+        cls._rows.append(
+            {
+                "wallet_id": context.get("wallet_id"),
+                "stage": stage,
+                "campaign_id": context.get("campaign_id"),
+                "cred_id": context.get("cred_id"),
+                "started_at": started_at,
+                "finished_at": finished_at,
+                "duration_ms": int((finished_at - started_at).total_seconds() * 1000),
+                "outcome": outcome,
+                "error": error,
+            }
+        )
+        if len(cls._rows) >= cls.BATCH_SIZE and cls._wake is not None:
+            cls._wake.set()
+
+    @staticmethod
+    def _insert(rows: list[dict]) -> None:
+        try:
+            db.s.execute(insert(Event.__table__), rows)
+            db.s.commit()
+        except Exception:
+            db.s.rollback()
+            raise
+
+    @classmethod
+    async def flush(cls) -> None:
+        if not cls._rows:
+            return
+        rows, cls._rows = cls._rows, []
+        try:
+            await AsyncDB.write(cls._insert, rows)
+        except Exception as e:
+            # history is best effort, a broken batch must not grow the buffer forever
+            logger.error(f"Event log | {len(rows)} events lost: {e}")
+
+    @classmethod
+    def flush_sync(cls) -> None:
+        if cls._rows:
+            rows, cls._rows = cls._rows, []
+            cls._insert(rows)
+
+    @classmethod
+    async def _flush_loop(cls) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(cls._wake.wait(), timeout=cls.INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            cls._wake.clear()
+            await cls.flush()
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls.enabled() and cls._task is None:
+            cls._wake = asyncio.Event()
+            cls._task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+            cls._wake = None
+        await cls.flush()
+
+
+Metrics.add_stage_listener(EventLog.record)
+atexit.register(EventLog.flush_sync)
@@ -0,0 +1,114 @@
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from utils.db_api import report_api
+from utils.db_api.wallet_api import INVITE_COLUMNS
+
+CAMPAIGN_NAMES = {"GCpict6X7N": "First quest", "GC5mTt8px6": "Second quest", "GCoUVt8dHz": "Pioneer Stone"}
+
+
+def _fmt(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def _pct(part: int | None, total: int | None) -> str:
+    return f"{(part or 0) / total * 100:.1f}%" if total else "-"
+
+
+def _table(title: str, columns: list[str], rows: list[list]) -> Table:
+    table = Table(title=title, box=box.SIMPLE_HEAVY, title_style="bold orange3", header_style="bold")
+    for i, column in enumerate(columns):
+        table.add_column(column, justify="left" if i == 0 else "right")
+    for row in rows:
+        table.add_row(*[_fmt(value) for value in row])
+    return table
+
+
+def show_fleet_report() -> None:
+    """Print the state of all wallets in the DB, every number is an aggregate query"""
+    console = Console()
+
+    summary = report_api.fleet_summary()
+    total = summary["wallets"]
+    if not total:
+        console.print("[yellow]Fleet report: no wallets in db[/yellow]")
+        return
+
+    console.print(
+        f"[bold]{total:,} wallets[/bold] | {summary['points_total']:,} points, avg {_fmt(summary['points_avg'])}, max {_fmt(summary['points_max'])} "
+        f"| best rank {_fmt(summary['best_rank'])} | Pioneer completed {_fmt(summary['pioneer_completed'])} "
+        f"| Galxe banned {_fmt(summary['galxe_banned'])}"
+    )
+
+    console.print(
+        _table(
+            "Points distribution",
+            ["points", "wallets", "share", "points total", "best rank", "worst rank"],
+            [
+                [row["bucket"], row["wallets"], _pct(row["wallets"], total), row["points"], row["best_rank"], row["worst_rank"]]
+                for row in report_api.points_distribution()
+            ],
+        )
+    )
+    console.print(
+        _table(
+            "Twitter",
+            ["status", "wallets", "share", "followers avg"],
+            [[row["status"], row["wallets"], _pct(row["wallets"], total), row["followers_avg"]] for row in report_api.twitter_breakdown()],
+        )
+    )
+    console.print(
+        _table(
+            "Proxies",
+            ["status", "wallets", "proxies", "checked", "latency avg ms", "latency max ms"],
+            [
+                [row["status"], row["wallets"], row["proxies"], row["checked"], row["latency_avg_ms"], row["latency_max_ms"]]
+                for row in report_api.proxy_health()
+            ],
+        )
+    )
+    console.print(
+        _table(
+            "Campaign funnel",
+            ["campaign", "started", "all tiers synced", "claimed", "claimed of fleet"],
+            [
+                [
+                    CAMPAIGN_NAMES.get(row["campaign_id"], row["campaign_id"]),
+                    row["started"],
+                    row["synced"],
+                    row["claimed"],
+                    _pct(row["claimed"], total),
+                ]
+                for row in report_api.campaign_funnel(list(INVITE_COLUMNS))
+            ],
+        )
+    )
+
+    blocked = report_api.blocked_on_funding()
+    if blocked:
+        console.print(
+            _table(
+                "Blocked on funding (last bridge failed)",
+                ["error", "wallets", "last attempt"],
+                [[row["error"], row["wallets"], row["last_attempt"]] for row in blocked],
+            )
+        )
+    else:
+        console.print("[dim]Blocked on funding: no failed bridges in the event history[/dim]")
+
+    history = report_api.stage_history()
+    if history:
+        console.print(
+            _table(
+                "Stage history",
+                ["stage", "events", "ok", "fail", "error", "success %", "p50 ms", "p90 ms", "p99 ms", "max ms"],
+                [list(row.values()) for row in history],
+            )
+        )
@@ -0,0 +1,73 @@
+import asyncio
+import copy
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from data.settings import Settings
+from utils.metrics import Metrics
+
+
+class CampaignCache:
+    """
+    Campaign-level Galxe responses shared by all wallets of the run, each kept for campaign_cache_ttl seconds.
+
+    A missing entry is fetched once, wallets asking for it meanwhile wait for the same request (single-flight).
+    Values are returned as deep copies, callers may change them freely.
+    """
+
+    _entries: dict[Hashable, tuple[float, Any]] = {}
+    _inflight: dict[Hashable, asyncio.Future] = {}
+    _ttl: Optional[int] = None
+
+    @classmethod
+    def ttl(cls) -> int:
+        if cls._ttl is None:
+            cls._ttl = Settings().campaign_cache_ttl
+        return cls._ttl
+
+    @classmethod
+    async def get(cls, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """
+        Args:
+            key: what the value is, e.g. ("quest_cred_list", campaign_id)
+            fetch: coroutine function getting the value, it must raise on a response not worth caching
+
+        Returns:
+            (value, True if this call fetched it)
+        """
+        if not cls.ttl():
+            return await fetch(), True
+
+        entry = cls._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            Metrics.inc("galxe_cache_requests_total", result="hit")
+            return copy.deepcopy(entry[1]), False
+
+        inflight = cls._inflight.get(key)
+        if inflight is not None:
+            Metrics.inc("galxe_cache_requests_total", result="shared")
+            await asyncio.wait([inflight])
+            if inflight.cancelled() or inflight.exception() is not None:
+                # the fetch may have failed because of that wallet (proxy, auth), the next one tries its own
+                return await cls.get(key, fetch)
+            return copy.deepcopy(inflight.result()), False
+
+        Metrics.inc("galxe_cache_requests_total", result="miss")
+        future = asyncio.get_running_loop().create_future()
+        cls._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # marks the error as retrieved, waiters only check that there is one
+            future.exception()
+            raise
+        else:
+            cls._entries[key] = (time.monotonic() + cls.ttl(), copy.deepcopy(value))
+            future.set_result(cls._entries[key][1])
+            return value, True
+        finally:
+            cls._inflight.pop(key, None)
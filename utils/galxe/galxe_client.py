@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import math
 import random
 import time
@@ -14,13 +13,68 @@ from libs.eth_async.client import Client
 from libs.eth_async.data.models import Network, Networks, TokenAmount
 from modules.encoder.galxe_utils import generate_ga_cookie_value, get_captcha, make_x_unique_link_id
 from utils.browser import Browser
+from utils.cooldown import cooldown_sleep
+from utils.db_api import async_wallet_api
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import mark_galxe_account_banned
 from utils.exchanger.okx import OKXActions
+from utils.metrics import measure_captcha, measure_stage
 from utils.retry import async_retry
 
+from . import operations as ops
+from .campaign_cache import CampaignCache
 from .galxe_auth import AuthClient
 from .galxe_onchain import GalxeOnchain
+from .operations import PreparedOperation, loads
+from .responses import LoyaltyPoints, UserInfo, sync_allowed
+
+
+def _merge_configs(configs: list, states: list) -> None:
+    if len(configs) != len(states):
+        raise ValueError("configs changed")
+    for config, state in zip(configs, states):
+        if config.get("id") != state.get("id"):
+            raise ValueError("configs changed")
+        config["eligible"] = state["eligible"]
+        _merge_conditions(config["conditions"], state["conditions"])
+        for reward, reward_state in zip(config.get("rewards") or [], state.get("rewards") or []):
+            reward.update(reward_state)
+
+
+def _merge_conditions(conditions: list, states: list) -> None:
+    if len(conditions) != len(states):
+        raise ValueError("conditions changed")
+    for condition, state in zip(conditions, states):
+        if condition["cred"]["id"] != state["cred"]["id"]:
+            raise ValueError("conditions changed")
+        condition["eligible"] = state["eligible"]
+        condition["eligibleAddress"] = state["eligibleAddress"]
+        condition["cred"]["eligible"] = state["cred"]["eligible"]
+
+
+def _merge_quest_cred_state(info: dict, state: dict) -> dict | None:
+    """
+    Put the wallet fields of a QuestCredState response into a cached QuestCredList one
+
+    Returns:
+        QuestCredList response of the wallet, None if the state doesn't fit the cached campaign
+    """
+    try:
+        campaign = info["data"]["campaign"]
+        campaign_state = state["data"]["campaign"]
+        task_config, task_state = campaign["taskConfig"], campaign_state["taskConfig"]
+        campaign["referralCode"] = campaign_state["referralCode"]
+        task_config["participateCondition"]["eligible"] = task_state["participateCondition"]["eligible"]
+        _merge_conditions(task_config["participateCondition"]["conditions"], task_state["participateCondition"]["conditions"])
+        _merge_configs(task_config["rewardConfigs"], task_state["rewardConfigs"])
+        _merge_configs([task_config["referralConfig"]], [task_state["referralConfig"]])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return info
+
+
+@measure_captcha("galxe_geetest")
+async def solve_captcha(action: str, **kwargs):
+    return await get_captcha(action, **kwargs)
 
 
 class GalxeClient:
@@ -38,6 +92,8 @@ class GalxeClient:
         self.galxe_id = ""
         self.client_id = ""
         self.headers = {}
+        # responses are only formatted for the log when it would show them
+        self.debug = Settings().log_level == "DEBUG"
 
     def update_headers(self, suffix: str = ""):
         return self.headers.update(
@@ -61,15 +117,17 @@ class GalxeClient:
             }
         )
 
-    @async_retry()
-    async def request(self, json_data, use_save: bool = False, suffix: str = ""):
+    @async_retry(policy="galxe")
+    async def request(self, json_data: PreparedOperation | dict, use_save: bool = False, suffix: str = ""):
         self.update_headers(suffix)
-        if use_save:
-            response = await self.browser.post(url=self.SAVE_LINK, json=json_data, headers=self.headers)
+        url = self.SAVE_LINK if use_save else self.BASE_LINK
+        if isinstance(json_data, PreparedOperation):
+            response = await self.browser.post(url=url, data=json_data.body, headers=self.headers, operation=json_data.name)
         else:
-            response = await self.browser.post(url=self.BASE_LINK, json=json_data, headers=self.headers)
-        data = response.json()
-        logger.debug(data)
+            response = await self.browser.post(url=url, json=json_data, headers=self.headers)
+        data = loads(response.content)
+        if self.debug:
+            logger.debug(data)
         return data
 
     async def choose_client_for_subscription(self):
@@ -132,67 +190,58 @@ class GalxeClient:
                     continue
 
     async def update_points_and_rank(self, campaign_id: int):
-        data = await self.get_points_and_rank(campaign_id=campaign_id)
-        points = data["data"]["space"]["addressLoyaltyPoints"]["points"]
-        rank = data["data"]["space"]["addressLoyaltyPoints"]["rank"]
-        return points, rank
+        loyalty = LoyaltyPoints.from_response(await self.get_points_and_rank(campaign_id=campaign_id))
+        return loyalty.points, loyalty.rank
 
     async def delete_social_account(self, social: str):
-        json_data = {
-            "operationName": "DeleteSocialAccount",
-            "variables": {
+        json_data = ops.DELETE_SOCIAL_ACCOUNT.prepare(
+            {
                 "input": {
                     "address": f"EVM:{self.client.account.address}",
                     "type": f"{social.upper()}",
                 },
-            },
-            "query": "mutation DeleteSocialAccount($input: DeleteSocialAccountInput!) {\n  deleteSocialAccount(input: $input) {\n    code\n    message\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def connect_twitter(self, tweet_url: str):
-        json_data = {
-            "operationName": "checkTwitterAccount",
-            "variables": {
+        json_data = ops.CHECK_TWITTER_ACCOUNT.prepare(
+            {
                 "input": {
                     "address": f"EVM:{self.client.account.address}",
                     "tweetURL": f"{tweet_url}",
                 },
-            },
-            "query": "mutation checkTwitterAccount($input: VerifyTwitterAccountInput!) {\n  checkTwitterAccount(input: $input) {\n    address\n    twitterUserID\n    twitterUserName\n    __typename\n  }\n}",
-        }
+            }
+        )
 
         await self.request(json_data=json_data)
-        json_data = {
-            "operationName": "VerifyTwitterAccount",
-            "variables": {
+        json_data = ops.VERIFY_TWITTER_ACCOUNT.prepare(
+            {
                 "input": {
                     "address": f"EVM:{self.client.account.address}",
                     "tweetURL": f"{tweet_url}",
                 },
-            },
-            "query": "mutation VerifyTwitterAccount($input: VerifyTwitterAccountInput!) {\n  verifyTwitterAccount(input: $input) {\n    address\n    twitterUserID\n    twitterUserName\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def get_points_and_rank(self, campaign_id: int):
-        json_data = {
-            "operationName": "SpaceLoyaltyPoints",
-            "variables": {
+        json_data = ops.SPACE_LOYALTY_POINTS.prepare(
+            {
                 "id": campaign_id,
                 "address": f"EVM:{self.client.account.address}",
-            },
-            "query": "query SpaceLoyaltyPoints($id: Int, $address: String!, $seasonId: Int) {\n  space(id: $id) {\n    id\n    addressLoyaltyPoints(address: $address, sprintId: $seasonId) {\n      id\n      points\n      rank\n      __typename\n    }\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
+    @measure_stage("bridge")
     async def handle_bridge_subscribe(self):
         base_client = await self.choose_subscribe_client()
         if not base_client:
             logger.warning(f"{self.wallet} no one Network can be choisen for bridge. Try withdraw from OKX")
             withdraw_from_okx = await self.withdraw_from_okx()
             if withdraw_from_okx:
-                await asyncio.sleep(10)
+                await cooldown_sleep(10)
                 return await self.handle_bridge_subscribe()
             return False
         network_values = [Networks.Arbitrum, Networks.Base, Networks.Polygon, Networks.BSC]
@@ -308,6 +357,7 @@ class GalxeClient:
                     logger.warning(f"{self.wallet} can't check network {network.name} error: {e}")
                     continue
 
+    @measure_stage("bridge")
     async def handle_bridge_gravity(self):
         base_client = await self.choose_available_client()
         if not base_client:
@@ -337,7 +387,7 @@ class GalxeClient:
                 logger.info(f"{self.wallet} deposit detected")
                 return True
 
-            await asyncio.sleep(5)
+            await cooldown_sleep(5)
 
     async def claim_points(self, campaign_id: str, ref_code: str | None = None):
         info = await self.get_campaign_info(campaign_id=campaign_id)
@@ -347,7 +397,7 @@ class GalxeClient:
         params = self._get_claim_params(info)
         if not params:
             return False
-        captcha = await get_captcha("PrepareParticipate", use_encrypted_data=True, proxy=self.wallet.proxy)
+        captcha = await solve_captcha("PrepareParticipate", use_encrypted_data=True, proxy=self.wallet.proxy)
         if params["pointMintAmount"] > 0 and params["mintCount"] > 0:
             params["pointMintAmount"] = 0
         prepare = await self.prepare_participate(
@@ -405,19 +455,16 @@ class GalxeClient:
             )
 
     async def get_payment_task_info(self, task_id):
-        json_data = {
-            "operationName": "paymentTaskInfo",
-            "variables": {
+        json_data = ops.PAYMENT_TASK_INFO.prepare(
+            {
                 "task_id": task_id,
-            },
-            "query": "query paymentTaskInfo($task_id: Int64!) {\n  paymentTaskInfo(taskID: $task_id) {\n    status\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def register_payment_task(self, campaign_id, verify_ids, distribut_address, loyalty_point_address, points, amounts, signature):
-        json_data = {
-            "operationName": "registerSSPaymentTask",
-            "variables": {
+        json_data = ops.REGISTER_SS_PAYMENT_TASK.prepare(
+            {
                 "input": {
                     "taskDetail": {
                         "questTask": {
@@ -438,66 +485,60 @@ class GalxeClient:
                         },
                     },
                 },
-            },
-            "query": "mutation registerSSPaymentTask($input: RegisterSSPaymentTaskInput!) {\n  registerSSPaymentTask(input: $input) {\n    taskId\n    success\n    failureReason\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def pre_check_claim(self, campaign_id: str, mint_count: int):
-        json_data = {
-            "operationName": "ssPreCheckCampaign",
-            "variables": {
+        json_data = ops.SS_PRE_CHECK_CAMPAIGN.prepare(
+            {
                 "id": campaign_id,
                 "mintCount": mint_count,
                 "chain": "GRAVITY_ALPHA",
-            },
-            "query": "query ssPreCheckCampaign($id: ID!, $mintCount: Int!, $chain: Chain) {\n  campaign(id: $id) {\n    id\n    ssPaymentPreCheck(mintCount: $mintCount) {\n      checkRes\n      permitTokens {\n        tokenAddr\n        minimumTokenAmount\n        spenderAddr\n        __typename\n      }\n      __typename\n    }\n    ssPaymentPreCheckClaimPoints(chain: $chain) {\n      checkRes\n      permitTokens {\n        tokenAddr\n        minimumTokenAmount\n        spenderAddr\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
+    @measure_stage("auth")
     async def auth(self):
         bearer_token = await self.auth_client.login()
         self.bearer_token = bearer_token
-        session = await self.session()
-        self.galxe_id = session["data"]["addressInfo"]["id"]
+        user_info = await self.user_info()
+        self.galxe_id = user_info.id
         self.client_id = generate_ga_cookie_value()
 
     async def is_account_banned(self):
-        session = await self.session()
-        if session["data"]["addressInfo"]["isBot"]:
+        user_info = await self.user_info()
+        if user_info.is_bot:
             logger.error(f"{self.wallet} Galxe account is banned!")
-            mark_galxe_account_banned(id=self.wallet.id)
+            await async_wallet_api.mark_galxe_account_banned(id=self.wallet.id)
             return True
         return False
 
-    async def session(self):
+    async def user_info(self) -> UserInfo:
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "BasicUserInfo",
-            "variables": {
+        json_data = ops.BASIC_USER_INFO.prepare(
+            {
                 "address": f"EVM:{self.wallet.address}",
-            },
-            "query": "query BasicUserInfo($address: String!) {\n  addressInfo(address: $address) {\n    id\n    username\n    avatar\n    address\n    evmAddressSecondary {\n      address\n      __typename\n    }\n    userLevel {\n      level {\n        name\n        logo\n        minExp\n        maxExp\n        value\n        __typename\n      }\n      exp\n      gold\n      ggRecall\n      __typename\n    }\n    ggInviteeInfo {\n      questCount\n      ggCount\n      __typename\n    }\n    ggInviteCode\n    ggInviter {\n      id\n      username\n      __typename\n    }\n    isBot\n    hasEmail\n    solanaAddress\n    aptosAddress\n    seiAddress\n    injectiveAddress\n    flowAddress\n    starknetAddress\n    bitcoinAddress\n    suiAddress\n    stacksAddress\n    azeroAddress\n    archwayAddress\n    bitcoinSignetAddress\n    xrplAddress\n    algorandAddress\n    tonAddress\n    kadenaAddress\n    hasEvmAddress\n    hasSolanaAddress\n    hasAptosAddress\n    hasInjectiveAddress\n    hasFlowAddress\n    hasStarknetAddress\n    hasBitcoinAddress\n    hasSuiAddress\n    hasStacksAddress\n    hasAzeroAddress\n    hasArchwayAddress\n    hasBitcoinSignetAddress\n    hasXrplAddress\n    hasAlgorandAddress\n    hasTonAddress\n    hasKadenaAddress\n    hasTwitter\n    hasGithub\n    hasDiscord\n    hasTelegram\n    hasWorldcoin\n    displayEmail\n    displayTwitter\n    displayGithub\n    displayDiscord\n    displayTelegram\n    displayWorldcoin\n    displayNamePref\n    email\n    twitterUserID\n    twitterUserName\n    githubUserID\n    githubUserName\n    discordUserID\n    discordUserName\n    telegramUserID\n    telegramUserName\n    worldcoinID\n    enableEmailSubs\n    subscriptions\n    isWhitelisted\n    isInvited\n    isAdmin\n    accessToken\n    humanityType\n    __typename\n  }\n}",
-        }
-        data = await self.request(json_data=json_data)
-        return data
+            }
+        )
+        return UserInfo.from_response(await self.request(json_data=json_data))
 
     async def read_quiz(self, cred_id):
-        json_data = {
-            "operationName": "readQuiz",
-            "variables": {
+        return await self.request(json_data=self._read_quiz_operation(cred_id))
+
+    @staticmethod
+    def _read_quiz_operation(cred_id) -> PreparedOperation:
+        return ops.READ_QUIZ.prepare(
+            {
                 "id": f"{cred_id}",
-            },
-            "query": "query readQuiz($id: ID!) {\n  credential(id: $id) {\n    ...CredQuizFrag\n    __typename\n  }\n}\n\nfragment CredQuizFrag on Cred {\n  metadata {\n    quiz {\n      material\n      quizzes {\n        title\n        type\n        alvaHints\n        items {\n          value\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  __typename\n}",
-        }
-        return await self.request(json_data=json_data)
+            }
+        )
 
     async def sync_quiz(self, cred_id, answers: list):
-        await self.read_quiz(cred_id=cred_id)
-        json_data = {
-            "operationName": "SyncCredentialValue",
-            "variables": {
+        json_data = ops.SYNC_CREDENTIAL_VALUE.prepare(
+            {
                 "input": {
                     "syncOptions": {
                         "credId": f"{cred_id}",
@@ -505,26 +546,24 @@ class GalxeClient:
                         "quiz": {"answers": answers},
                     },
                 },
-            },
-            "query": "mutation SyncCredentialValue($input: SyncCredentialValueInput!) {\n  syncCredentialValue(input: $input) {\n    value {\n      address\n      spaceUsers {\n        follow\n        points\n        participations\n        __typename\n      }\n      campaignReferral {\n        count\n        __typename\n      }\n      galxePassport {\n        eligible\n        lastSelfieTimestamp\n        __typename\n      }\n      spacePoint {\n        points\n        __typename\n      }\n      spaceParticipation {\n        participations\n        __typename\n      }\n      gitcoinPassport {\n        score\n        lastScoreTimestamp\n        __typename\n      }\n      walletBalance {\n        balance\n        __typename\n      }\n      multiDimension {\n        value\n        __typename\n      }\n      allow\n      survey {\n        answers\n        __typename\n      }\n      quiz {\n        allow\n        correct\n        __typename\n      }\n      prediction {\n        isCorrect\n        __typename\n      }\n      spaceFollower {\n        follow\n        __typename\n      }\n      __typename\n    }\n    message\n    __typename\n  }\n}",
-        }
+            }
+        )
+        await self.read_quiz(cred_id=cred_id)
         return await self.request(json_data=json_data)
 
     async def open_mystery_box(self, box_id: str = "1003", count: int = 1):
         if not self.bearer_token:
             await self.auth()
-        captcha = await get_captcha(action="OpenMysteryBox", proxy=self.wallet.proxy, use_encrypted_data=True)
-        json_data = {
-            "operationName": "OpenMysteryBox",
-            "variables": {
+        captcha = await solve_captcha(action="OpenMysteryBox", proxy=self.wallet.proxy, use_encrypted_data=True)
+        json_data = ops.OPEN_MYSTERY_BOX.prepare(
+            {
                 "input": {
                     "id": box_id,
                     "count": count,
                     "captcha": captcha,
                 },
-            },
-            "query": "mutation OpenMysteryBox($input: OpenMysteryBoxInput!) {\n  openMysteryBox(input: $input) {\n    description\n    rewards {\n      rewardCount\n      rewardIndex\n      rewardId\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data)
         if "errors" in data:
             logger.warning(f"{self.wallet} can't open mystery box {data['errors']}")
@@ -532,10 +571,12 @@ class GalxeClient:
         return data["data"]["openMysteryBox"]["rewards"][0]
 
     async def add_type(self, cred_id, campaign_id):
-        captcha = await get_captcha("AddTypedCredentialItems", proxy=self.wallet.proxy)
-        json_data = {
-            "operationName": "AddTypedCredentialItems",
-            "variables": {
+        captcha = await solve_captcha("AddTypedCredentialItems", proxy=self.wallet.proxy)
+        await self.request(json_data=self._add_type_operation(cred_id=cred_id, campaign_id=campaign_id, captcha=captcha))
+
+    def _add_type_operation(self, cred_id, campaign_id, captcha) -> PreparedOperation:
+        return ops.ADD_TYPED_CREDENTIAL_ITEMS.prepare(
+            {
                 "input": {
                     "credId": f"{cred_id}",
                     "campaignId": f"{campaign_id}",
@@ -545,19 +586,17 @@ class GalxeClient:
                     ],
                     "captcha": captcha,
                 },
-            },
-            "query": "mutation AddTypedCredentialItems($input: MutateTypedCredItemInput!) {\n  typedCredentialItems(input: $input) {\n    id\n    __typename\n  }\n}",
-        }
-        await self.request(json_data=json_data)
+            }
+        )
 
     async def sync_twitter_quest(self, cred_id, campaign_id):
-        await self.add_type(cred_id=cred_id, campaign_id=campaign_id)
-        json_data = {
-            "operationName": "TwitterOauth2Status",
-            "variables": {},
-            "query": "query TwitterOauth2Status {\n  twitterOauth2Status {\n    oauthRateLimited\n    __typename\n  }\n}",
-        }
-        await self.request(json_data=json_data)
+        # both captchas are solved at the same time, the operations themselves depend on each other
+        add_type_captcha, captcha = await asyncio.gather(
+            solve_captcha("AddTypedCredentialItems", proxy=self.wallet.proxy),
+            solve_captcha("SyncCredentialValue", proxy=self.wallet.proxy),
+        )
+        await self.request(json_data=self._add_type_operation(cred_id=cred_id, campaign_id=campaign_id, captcha=add_type_captcha))
+        await self.request(json_data=ops.TWITTER_OAUTH2_STATUS.prepare({}))
         # json_data = {
         #     "operationName": "OauthAddress",
         #     "variables": {
@@ -567,10 +606,8 @@ class GalxeClient:
         # }
         # await self.request(json_data=json_data)
 
-        captcha = await get_captcha("SyncCredentialValue", proxy=self.wallet.proxy)
-        json_data = {
-            "operationName": "SyncCredentialValue",
-            "variables": {
+        json_data = ops.SYNC_CREDENTIAL_VALUE.prepare(
+            {
                 "input": {
                     "syncOptions": {
                         "credId": f"{cred_id}",
@@ -578,35 +615,31 @@ class GalxeClient:
                         "twitter": {"campaignID": f"{campaign_id}", "captcha": captcha},
                     },
                 },
-            },
-            "query": "mutation SyncCredentialValue($input: SyncCredentialValueInput!) {\n  syncCredentialValue(input: $input) {\n    value {\n      address\n      spaceUsers {\n        follow\n        points\n        participations\n        __typename\n      }\n      campaignReferral {\n        count\n        __typename\n      }\n      galxePassport {\n        eligible\n        lastSelfieTimestamp\n        __typename\n      }\n      spacePoint {\n        points\n        __typename\n      }\n      spaceParticipation {\n        participations\n        __typename\n      }\n      gitcoinPassport {\n        score\n        lastScoreTimestamp\n        __typename\n      }\n      walletBalance {\n        balance\n        __typename\n      }\n      multiDimension {\n        value\n        __typename\n      }\n      allow\n      survey {\n        answers\n        __typename\n      }\n      quiz {\n        allow\n        correct\n        __typename\n      }\n      prediction {\n        isCorrect\n        __typename\n      }\n      spaceFollower {\n        follow\n        __typename\n      }\n      __typename\n    }\n    message\n    __typename\n  }\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data)
-        return data["data"]["syncCredentialValue"]["value"]["allow"]
+        return sync_allowed(data)
 
     async def sync_quest(self, cred_id: str):
         if not self.bearer_token:
             await self.auth()
 
-        json_data = {
-            "operationName": "SyncCredentialValue",
-            "variables": {
+        json_data = ops.SYNC_CREDENTIAL_VALUE.prepare(
+            {
                 "input": {
                     "syncOptions": {
                         "credId": f"{cred_id}",
                         "address": f"EVM:{self.client.account.address}",
                     },
                 },
-            },
-            "query": "mutation SyncCredentialValue($input: SyncCredentialValueInput!) {\n  syncCredentialValue(input: $input) {\n    value {\n      address\n      spaceUsers {\n        follow\n        points\n        participations\n        __typename\n      }\n      campaignReferral {\n        count\n        __typename\n      }\n      galxePassport {\n        eligible\n        lastSelfieTimestamp\n        __typename\n      }\n      spacePoint {\n        points\n        __typename\n      }\n      spaceParticipation {\n        participations\n        __typename\n      }\n      gitcoinPassport {\n        score\n        lastScoreTimestamp\n        __typename\n      }\n      walletBalance {\n        balance\n        __typename\n      }\n      multiDimension {\n        value\n        __typename\n      }\n      allow\n      survey {\n        answers\n        __typename\n      }\n      quiz {\n        allow\n        correct\n        __typename\n      }\n      prediction {\n        isCorrect\n        __typename\n      }\n      spaceFollower {\n        follow\n        __typename\n      }\n      __typename\n    }\n    message\n    __typename\n  }\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data)
-        return data["data"]["syncCredentialValue"]["value"]["allow"]
+        return sync_allowed(data)
 
     async def sync_credit_value(self, attrs: list, cred_id: str):
-        json_data = {
-            "operationName": "syncEvaluateCredentialValue",
-            "variables": {
+        json_data = ops.SYNC_EVALUATE_CREDENTIAL_VALUE.prepare(
+            {
                 "input": {
                     "syncOptions": {
                         "address": f"EVM:{self.wallet.address}",
@@ -622,61 +655,79 @@ class GalxeClient:
                         },
                     },
                 },
-            },
-            "query": "mutation syncEvaluateCredentialValue($input: SyncEvaluateCredentialValueInput!) {\n  syncEvaluateCredentialValue(input: $input) {\n    result\n    value {\n      allow\n      survey {\n        answers\n        __typename\n      }\n      quiz {\n        allow\n        correct\n        __typename\n      }\n      __typename\n    }\n    message\n    __typename\n  }\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data)
         if "data" not in data:
             return False
         return data["data"]["syncEvaluateCredentialValue"]["result"]
 
     async def quest_claim_section(self, campaign_id):
-        json_data = {
-            "operationName": "QuestClaimSection",
-            "variables": {
+        json_data = ops.QUEST_CLAIM_SECTION.prepare(
+            {
                 "isParent": False,
                 "id": f"{campaign_id}",
                 "address": f"{self.wallet.address}",
                 "withAddress": True,
-            },
-            "query": "query QuestClaimSection($id: ID!, $address: String!, $withAddress: Boolean!, $isParent: Boolean = false) {\n  campaign(id: $id) {\n    ...QuestClaimFragment\n    boost(address: $address) {\n      golden\n      boost\n      boostedGold\n      reason\n      __typename\n    }\n    numNFTMinted\n    participants @skip(if: $isParent) {\n      participantsCount\n      __typename\n    }\n    userParticipants(address: $address, first: 1) @include(if: $withAddress) {\n      list {\n        status\n        __typename\n      }\n      __typename\n    }\n    name\n    description\n    userAgreement\n    airdrop {\n      rewardType\n      rewardAmount\n      rewardInfo {\n        custom {\n          name\n          icon\n          __typename\n        }\n        token {\n          address\n          decimals\n          symbol\n          icon\n          __typename\n        }\n        __typename\n      }\n      claimDetail(address: $address) {\n        amount\n        __typename\n      }\n      __typename\n    }\n    space {\n      isFollowing @include(if: $withAddress)\n      isVerified\n      __typename\n    }\n    inWatchList\n    __typename\n  }\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment QuestClaimFragment on Campaign {\n  id\n  numberID\n  type\n  chain\n  status\n  distributionType\n  startTime\n  endTime\n  claimEndTime\n  cap\n  recurringType\n  loyaltyPoints\n  rewardName\n  rewardType\n  gasType\n  ...CampaignForGetImage\n  ...CampaignForTokenObject\n  space {\n    id\n    alias\n    discordGuildID\n    name\n    thumbnail\n    loyaltyPointContractList {\n      address\n      chain\n      status\n      __typename\n    }\n    __typename\n  }\n  ...WhitelistInfoFrag\n  ...WhitelistSubgraphFrag\n  rewardInfo {\n    discordRole {\n      roleName\n      guildName\n      inviteLink\n      __typename\n    }\n    gasConfig {\n      rewardEntity\n      gasType\n      __typename\n    }\n    __typename\n  }\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  credentialGroups(address: $address) {\n    id\n    rewards {\n      rewardType\n      rewardCount\n      __typename\n    }\n    __typename\n  }\n  tokenReward {\n    raffleContractAddress\n    __typename\n  }\n  spaceStation {\n    address\n    __typename\n  }\n  parentCampaign {\n    id\n    __typename\n  }\n  taskConfig(address: $address) {\n    rewardConfigs {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    requiredInfo {\n      socialInfos {\n        email\n        discordUserID\n        twitterUserID\n        telegramUserID\n        githubUserID\n        googleUserID\n        worldcoinID\n        __typename\n      }\n      addressInfos {\n        ...AddressInfosFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  nftTemplates {\n    id\n    animationURL\n    category\n    image\n    name\n    treasureBack\n    __typename\n  }\n  nftCore {\n    id\n    contractAddress\n    chain\n    transferable\n    createdAt\n    __typename\n  }\n  tokenReward {\n    userTokenAmount\n    tokenAddress\n    depositedTokenAmount\n    tokenRewardContract\n    tokenDecimal\n    tokenLogo\n    tokenSymbol\n    raffleContractAddress\n    suiTableId\n    suiCampaignId\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistInfoFrag on Campaign {\n  id\n  whitelistInfo(address: $address) {\n    address\n    maxCount\n    usedCount\n    claimedLoyaltyPoints\n    currentPeriodClaimedLoyaltyPoints\n    currentPeriodMaxLoyaltyPoints\n    xrplLinks\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistSubgraphFrag on Campaign {\n  id\n  whitelistSubgraph {\n    query\n    endpoint\n    expression\n    variable\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignForGetImage on Campaign {\n  ...GetImageCommon\n  nftTemplates {\n    image\n    __typename\n  }\n  __typename\n}\n\nfragment GetImageCommon on Campaign {\n  ...CampaignForTokenObject\n  id\n  type\n  thumbnail\n  __typename\n}\n\nfragment CampaignForTokenObject on Campaign {\n  type\n  chain\n  cap\n  rewardInfo {\n    luckBasedToken {\n      totalAmount\n      userAvailableMaxAmount\n      tokenAddress\n      tokenDecimal\n      tokenLogo\n      tokenSymbol\n      withdrawnTokenAmount\n      hasDeposited\n      raffleContractAddress\n      luckBasedTokenRewardContract\n      __typename\n    }\n    __typename\n  }\n  tokenReward {\n    tokenAddress\n    tokenSymbol\n    tokenDecimal\n    tokenLogo\n    userTokenAmount\n    __typename\n  }\n  tokenRewardContract {\n    id\n    chain\n    address\n    __typename\n  }\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}\n\nfragment AddressInfosFrag on AddressInfos {\n  address\n  evmAddressSecondary\n  solanaAddress\n  aptosAddress\n  seiAddress\n  injectiveAddress\n  flowAddress\n  starknetAddress\n  suiAddress\n  bitcoinAddress\n  stacksAddress\n  azeroAddress\n  archwayAddress\n  xrplAddress\n  bitcoinSignetAddress\n  tonAddress\n  algorandAddress\n  kadenaAddress\n  __typename\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def quest_collection(self, campaign_id):
-        json_data = {
-            "operationName": "QuestCollection",
-            "variables": {
+        json_data = ops.QUEST_COLLECTION.prepare(
+            {
                 "id": f"{campaign_id}",
                 "address": f"{self.wallet.address}",
                 "withAddress": True,
-            },
-            "query": 'query QuestCollection($id: ID!, $address: String!, $withAddress: Boolean!) {\n  campaign(id: $id) {\n    id\n    childrenCampaigns {\n      ...ChildrenCampaignsForCampaignDetailAll\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment CampaignDetailFrag on Campaign {\n  id\n  ...CampaignMedia\n  ...CampaignForCampaignParticipantsBox\n  nftCore {\n    ...NftCoreInfoFrag\n    __typename\n  }\n  name\n  numberID\n  type\n  inWatchList\n  cap\n  info\n  useCred\n  smartbalancePreCheck(mintCount: 1)\n  smartbalancePreCheckClaimPoints\n  smartbalanceDeposited\n  formula\n  status\n  seoImage\n  creator\n  tags\n  thumbnail\n  gasType\n  isPrivate\n  createdAt\n  requirementInfo\n  description\n  enableWhitelist\n  chain\n  startTime\n  endTime\n  requireEmail\n  requireUsername\n  blacklistCountryCodes\n  whitelistRegions\n  rewardType\n  distributionType\n  rewardName\n  claimEndTime\n  loyaltyPoints\n  previousIsPrivate\n  tokenRewardContract {\n    id\n    address\n    chain\n    __typename\n  }\n  tokenReward {\n    userTokenAmount\n    tokenAddress\n    depositedTokenAmount\n    tokenRewardContract\n    tokenDecimal\n    tokenLogo\n    tokenSymbol\n    raffleContractAddress\n    suiTableId\n    suiCampaignId\n    __typename\n  }\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  spaceStation {\n    id\n    address\n    chain\n    __typename\n  }\n  ...WhitelistInfoFrag\n  ...WhitelistSubgraphFrag\n  rewardInfo {\n    discordRole {\n      guildId\n      guildName\n      roleId\n      roleName\n      inviteLink\n      __typename\n    }\n    premint {\n      startTime\n      endTime\n      chain\n      price\n      totalSupply\n      contractAddress\n      banner\n      __typename\n    }\n    loyaltyPoints {\n      points\n      __typename\n    }\n    loyaltyPointsMysteryBox {\n      points\n      weight\n      __typename\n    }\n    gasConfig {\n      rewardEntity\n      gasType\n      __typename\n    }\n    luckBasedToken {\n      totalAmount\n      userAvailableMaxAmount\n      tokenAddress\n      tokenDecimal\n      tokenLogo\n      tokenSymbol\n      withdrawnTokenAmount\n      hasDeposited\n      raffleContractAddress\n      luckBasedTokenRewardContract\n      __typename\n    }\n    __typename\n  }\n  participants {\n    participantsCount\n    bountyWinnersCount\n    __typename\n  }\n  taskConfig(address: $address) {\n    participateCondition {\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      eligible\n      __typename\n    }\n    requiredInfo {\n      socialInfos {\n        email\n        discordUserID\n        twitterUserID\n        telegramUserID\n        githubUserID\n        googleUserID\n        worldcoinID\n        __typename\n      }\n      addressInfos {\n        ...AddressInfosFrag\n        __typename\n      }\n      __typename\n    }\n    rewardConfigs {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    referralConfig {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  referralCode(address: $address)\n  recurringType\n  latestRecurringTime\n  nftTemplates {\n    id\n    animationURL\n    category\n    image\n    name\n    treasureBack\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignMedia on Campaign {\n  thumbnail\n  rewardName\n  type\n  gamification {\n    id\n    type\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignForCampaignParticipantsBox on Campaign {\n  ...CampaignForParticipantsDialog\n  id\n  chain\n  space {\n    id\n    isAdmin(address: $address)\n    __typename\n  }\n  participants {\n    participants(first: 10, after: "-1", download: false) {\n      list {\n        address {\n          id\n          avatar\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    participantsCount\n    bountyWinners(first: 10, after: "-1", download: false) {\n      list {\n        createdTime\n        address {\n          id\n          avatar\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    bountyWinnersCount\n    __typename\n  }\n  __typename\n}\n\nfragment ChildrenCampaignsForCampaignDetailAll on Campaign {\n  id\n  boost(address: $address) {\n    golden\n    boost\n    boostedGold\n    reason\n    __typename\n  }\n  space {\n    ...SpaceDetail\n    isAdmin(address: $address) @include(if: $withAddress)\n    isFollowing @include(if: $withAddress)\n    followersCount\n    categories\n    showAskAlva\n    __typename\n  }\n  ...CampaignDetailFrag\n  claimedLoyaltyPoints(address: $address) @include(if: $withAddress)\n  userParticipants(address: $address, first: 1) @include(if: $withAddress) {\n    list {\n      id\n      status\n      __typename\n    }\n    __typename\n  }\n  parentCampaign {\n    id\n    isSequencial\n    __typename\n  }\n  credentialGroups(address: $address) {\n    ...CredentialGroupForAddress\n    __typename\n  }\n  __typename\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment NftCoreInfoFrag on NFTCore {\n  id\n  capable\n  chain\n  contractAddress\n  name\n  symbol\n  transferable\n  __typename\n}\n\nfragment CampaignForParticipantsDialog on Campaign {\n  id\n  name\n  type\n  rewardType\n  chain\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  space {\n    isAdmin(address: $address)\n    __typename\n  }\n  rewardInfo {\n    discordRole {\n      guildName\n      roleName\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistInfoFrag on Campaign {\n  id\n  whitelistInfo(address: $address) {\n    address\n    maxCount\n    usedCount\n    claimedLoyaltyPoints\n    currentPeriodClaimedLoyaltyPoints\n    currentPeriodMaxLoyaltyPoints\n    xrplLinks\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistSubgraphFrag on Campaign {\n  id\n  whitelistSubgraph {\n    query\n    endpoint\n    expression\n    variable\n    __typename\n  }\n  __typename\n}\n\nfragment CredDiscordMetaData on CredMetadata {\n  discord {\n    discordAma {\n      LinkIsInvalid\n      __typename\n    }\n    discordMember {\n      LinkIsInvalid\n      __typename\n    }\n    discordMessage {\n      LinkIsInvalid\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nfragment CredForAddressWithDiscordMetadata on Cred {\n  ...CredForAddressWithoutMetadata\n  metadata {\n    ...CredDiscordMetaData\n    __typename\n  }\n  __typename\n}\n\nfragment CredForAddressWithoutMetadata on Cred {\n  id\n  name\n  type\n  credType\n  credSource\n  referenceLink\n  description\n  lastUpdate\n  lastSync\n  syncStatus\n  credContractNFTHolder {\n    timestamp\n    __typename\n  }\n  chain\n  eligible(address: $address)\n  subgraph {\n    endpoint\n    query\n    expression\n    __typename\n  }\n  dimensionConfig\n  value {\n    gitcoinPassport {\n      score\n      lastScoreTimestamp\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nfragment CredentialGroupForAddress on CredentialGroup {\n  id\n  description\n  credentials {\n    ...CredForAddressWithDiscordMetadata\n    __typename\n  }\n  conditionRelation\n  conditions {\n    expression\n    eligible\n    ...CredentialGroupConditionForVerifyButton\n    __typename\n  }\n  rewards {\n    expression\n    eligible\n    rewardCount\n    rewardType\n    __typename\n  }\n  rewardAttrVals {\n    attrName\n    attrTitle\n    attrVal\n    __typename\n  }\n  claimedLoyaltyPoints\n  __typename\n}\n\nfragment CredentialGroupConditionForVerifyButton on CredentialGroupCondition {\n  expression\n  eligibleAddress\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}\n\nfragment SpaceDetail on Space {\n  id\n  name\n  info\n  thumbnail\n  alias\n  status\n  links\n  isVerified\n  discordGuildID\n  followersCount\n  loyaltyPointContractList {\n    id\n    status\n    chain\n    __typename\n  }\n  __typename\n}\n\nfragment AddressInfosFrag on AddressInfos {\n  address\n  evmAddressSecondary\n  solanaAddress\n  aptosAddress\n  seiAddress\n  injectiveAddress\n  flowAddress\n  starknetAddress\n  suiAddress\n  bitcoinAddress\n  stacksAddress\n  azeroAddress\n  archwayAddress\n  xrplAddress\n  bitcoinSignetAddress\n  tonAddress\n  algorandAddress\n  kadenaAddress\n  __typename\n}',
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def get_quest_cred_list(self, campaign_id: str):
+        """QuestCredList of the campaign for this wallet, the campaign structure comes from CampaignCache"""
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "QuestCredList",
-            "variables": {
+        key = ("quest_cred_list", campaign_id)
+        info, fetched = await CampaignCache.get(key, lambda: self._fetch_quest_cred_list(campaign_id))
+        if fetched:
+            return info
+
+        state = await self._get_quest_cred_state(campaign_id)
+        merged = _merge_quest_cred_state(info, state)
+        if merged is None:
+            # the shared entry stays, one odd state response shouldn't cost every other wallet a full refetch
+            logger.debug(f"{self.wallet} campaign {campaign_id} doesn't match the cached quest list, requesting the full one")
+            return await self._fetch_quest_cred_list(campaign_id)
+        return merged
+
+    async def _fetch_quest_cred_list(self, campaign_id: str):
+        json_data = ops.QUEST_CRED_LIST.prepare(
+            {
                 "id": campaign_id,
                 "address": self.client.account.address,
-            },
-            "query": "query QuestCredList($id: ID!, $address: String!) {\n  campaign(id: $id) {\n    id\n    endTime\n    space {\n      alias\n      id\n      name\n      thumbnail\n      __typename\n    }\n    recurringType\n    latestRecurringTime\n    taskConfig(address: $address) {\n      participateCondition {\n        conditions {\n          ...ExpressionEntity\n          __typename\n        }\n        conditionalFormula\n        eligible\n        __typename\n      }\n      rewardConfigs {\n        id\n        conditions {\n          ...ExpressionEntity\n          __typename\n        }\n        conditionalFormula\n        description\n        rewards {\n          ...ExpressionReward\n          __typename\n        }\n        eligible\n        rewardAttrVals {\n          attrName\n          attrTitle\n          attrVal\n          __typename\n        }\n        __typename\n      }\n      referralConfig {\n        id\n        conditions {\n          ...ExpressionEntity\n          __typename\n        }\n        conditionalFormula\n        description\n        rewards {\n          ...ExpressionReward\n          __typename\n        }\n        eligible\n        rewardAttrVals {\n          attrName\n          attrTitle\n          attrVal\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    referralCode(address: $address)\n    __typename\n  }\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}",
-        }
+            }
+        )
+        data = await self.request(json_data=json_data)
+        if not (data.get("data") or {}).get("campaign"):
+            raise ValueError(f"bad QuestCredList response: {data}")
+        return data
+
+    async def _get_quest_cred_state(self, campaign_id: str):
+        json_data = ops.QUEST_CRED_STATE.prepare(
+            {
+                "id": campaign_id,
+                "address": self.client.account.address,
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def cred_zk_json(self, cred_id, galxe_id):
-        json_data = {
-            "operationName": "credZKJson",
-            "variables": {
+        json_data = ops.CRED_ZK_JSON.prepare(
+            {
                 "id": f"{cred_id}",
                 "eligibleAddress": f"{galxe_id}",
-            },
-            "query": "query credZKJson($id: ID!, $eligibleAddress: String!) {\n  credential(id: $id, eligibleAddress: $eligibleAddress) {\n    identityProtocol {\n      signedCredential\n      __typename\n    }\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def prepare_participate(
@@ -684,26 +735,22 @@ class GalxeClient:
     ):
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "PrepareParticipate",
-            "variables": {
-                "input": {
-                    "signature": "",
-                    "campaignID": campaign_id,
-                    "address": f"EVM:{self.client.account.address}",
-                    "mintCount": mint_count,
-                    "chain": chain,
-                    "claimVersion": "CHARGE_CLAIM_FEE_VERSION",
-                    "pointMintAmount": point_mint_amount,
-                    "captcha": capthca,
-                },
+        variables = {
+            "input": {
+                "signature": "",
+                "campaignID": campaign_id,
+                "address": f"EVM:{self.client.account.address}",
+                "mintCount": mint_count,
+                "chain": chain,
+                "claimVersion": "CHARGE_CLAIM_FEE_VERSION",
+                "pointMintAmount": point_mint_amount,
+                "captcha": capthca,
             },
-            "query": "mutation PrepareParticipate($input: PrepareParticipateInput!) {\n  prepareParticipate(input: $input) {\n    allow\n    disallowReason\n    signature\n    nonce\n    spaceStationInfo {\n      address\n      chain\n      version\n      __typename\n    }\n    mintFuncInfo {\n      funcName\n      nftCoreAddress\n      verifyIDs\n      powahs\n      cap\n      claimFeeAmount\n      __typename\n    }\n    extLinkResp {\n      success\n      data\n      error\n      __typename\n    }\n    metaTxResp {\n      metaSig2\n      autoTaskUrl\n      metaSpaceAddr\n      forwarderAddr\n      metaTxHash\n      reqQueueing\n      __typename\n    }\n    solanaTxResp {\n      mint\n      updateAuthority\n      explorerUrl\n      signedTx\n      verifyID\n      __typename\n    }\n    aptosTxResp {\n      signatureExpiredAt\n      tokenName\n      __typename\n    }\n    spaceStation\n    airdropRewardCampaignTxResp {\n      airdropID\n      verifyID\n      index\n      account\n      amount\n      proof\n      customReward\n      __typename\n    }\n    tokenRewardCampaignTxResp {\n      signatureExpiredAt\n      verifyID\n      encodeAddress\n      weight\n      claimFeeAmount\n      __typename\n    }\n    loyaltyPointsTxResp {\n      TotalClaimedPoints\n      VerifyIDs\n      loyaltyPointDistributionStation\n      signature\n      disallowReason\n      nonce\n      allow\n      loyaltyPointContract\n      Points\n      reqQueueing\n      claimFeeAmount\n      suiTxResp {\n        galxeTableId\n        __typename\n      }\n      __typename\n    }\n    flowTxResp {\n      Name\n      Description\n      Thumbnail\n      __typename\n    }\n    xrplLinks\n    suiTxResp {\n      packageId\n      tableId\n      nftName\n      campaignId\n      verifyID\n      imgUrl\n      signatureExpiredAt\n      __typename\n    }\n    algorandTxResp {\n      algorandArgs {\n        args\n        __typename\n      }\n      algorandBoxes {\n        boxes\n        __typename\n      }\n      __typename\n    }\n    spaceStationProxyResp {\n      target\n      callData\n      __typename\n    }\n    luckBasedTokenCampaignTxResp {\n      cid\n      dummyId\n      expiredAt\n      claimTo\n      index\n      claimAmount\n      proof\n      claimFeeAmount\n      signature\n      encodeAddress\n      weight\n      __typename\n    }\n    __typename\n  }\n}",
         }
         if ref_code:
-            json_data = copy.deepcopy(json_data)
-            json_data["variables"]["input"]["referralCode"] = ref_code
+            variables["input"]["referralCode"] = ref_code
 
+        json_data = ops.PREPARE_PARTICIPATE.prepare(variables)
         return await self.request(json_data=json_data)
 
     def _get_claim_params(self, campaign):
@@ -723,28 +770,22 @@ class GalxeClient:
         }
 
     async def get_campaign_info(self, campaign_id):
-        json_data = {
-            "operationName": "QuestClaimSection",
-            "variables": {
-                "isParent": False,
+        json_data = ops.CAMPAIGN_CLAIM_INFO.prepare(
+            {
                 "id": f"{campaign_id}",
                 "address": f"{self.client.account.address}",
-                "withAddress": True,
-            },
-            "query": "query QuestClaimSection($id: ID!, $address: String!, $withAddress: Boolean!, $isParent: Boolean = false) {\n  campaign(id: $id) {\n    ...QuestClaimFragment\n    boost(address: $address) {\n      golden\n      boost\n      boostedGold\n      reason\n      __typename\n    }\n    numNFTMinted\n    participants @skip(if: $isParent) {\n      participantsCount\n      __typename\n    }\n    userParticipants(address: $address, first: 1) @include(if: $withAddress) {\n      list {\n        status\n        __typename\n      }\n      __typename\n    }\n    name\n    description\n    userAgreement\n    airdrop {\n      rewardType\n      rewardAmount\n      rewardInfo {\n        custom {\n          name\n          icon\n          __typename\n        }\n        token {\n          address\n          decimals\n          symbol\n          icon\n          __typename\n        }\n        __typename\n      }\n      claimDetail(address: $address) {\n        amount\n        __typename\n      }\n      __typename\n    }\n    space {\n      isFollowing @include(if: $withAddress)\n      isVerified\n      __typename\n    }\n    inWatchList\n    __typename\n  }\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment QuestClaimFragment on Campaign {\n  id\n  numberID\n  type\n  chain\n  status\n  distributionType\n  startTime\n  endTime\n  claimEndTime\n  cap\n  recurringType\n  loyaltyPoints\n  rewardName\n  rewardType\n  gasType\n  ...CampaignForGetImage\n  ...CampaignForTokenObject\n  space {\n    id\n    alias\n    discordGuildID\n    name\n    thumbnail\n    loyaltyPointContractList {\n      address\n      chain\n      status\n      __typename\n    }\n    __typename\n  }\n  ...WhitelistInfoFrag\n  ...WhitelistSubgraphFrag\n  rewardInfo {\n    discordRole {\n      roleName\n      guildName\n      inviteLink\n      __typename\n    }\n    gasConfig {\n      rewardEntity\n      gasType\n      __typename\n    }\n    __typename\n  }\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  credentialGroups(address: $address) {\n    id\n    rewards {\n      rewardType\n      rewardCount\n      __typename\n    }\n    __typename\n  }\n  tokenReward {\n    raffleContractAddress\n    __typename\n  }\n  spaceStation {\n    address\n    __typename\n  }\n  parentCampaign {\n    id\n    __typename\n  }\n  taskConfig(address: $address) {\n    rewardConfigs {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    requiredInfo {\n      socialInfos {\n        email\n        discordUserID\n        twitterUserID\n        telegramUserID\n        githubUserID\n        googleUserID\n        worldcoinID\n        __typename\n      }\n      addressInfos {\n        ...AddressInfosFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  nftTemplates {\n    id\n    animationURL\n    category\n    image\n    name\n    treasureBack\n    __typename\n  }\n  nftCore {\n    id\n    contractAddress\n    chain\n    transferable\n    createdAt\n    __typename\n  }\n  tokenReward {\n    userTokenAmount\n    tokenAddress\n    depositedTokenAmount\n    tokenRewardContract\n    tokenDecimal\n    tokenLogo\n    tokenSymbol\n    raffleContractAddress\n    suiTableId\n    suiCampaignId\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistInfoFrag on Campaign {\n  id\n  whitelistInfo(address: $address) {\n    address\n    maxCount\n    usedCount\n    claimedLoyaltyPoints\n    currentPeriodClaimedLoyaltyPoints\n    currentPeriodMaxLoyaltyPoints\n    xrplLinks\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistSubgraphFrag on Campaign {\n  id\n  whitelistSubgraph {\n    query\n    endpoint\n    expression\n    variable\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignForGetImage on Campaign {\n  ...GetImageCommon\n  nftTemplates {\n    image\n    __typename\n  }\n  __typename\n}\n\nfragment GetImageCommon on Campaign {\n  ...CampaignForTokenObject\n  id\n  type\n  thumbnail\n  __typename\n}\n\nfragment CampaignForTokenObject on Campaign {\n  type\n  chain\n  cap\n  rewardInfo {\n    luckBasedToken {\n      totalAmount\n      userAvailableMaxAmount\n      tokenAddress\n      tokenDecimal\n      tokenLogo\n      tokenSymbol\n      withdrawnTokenAmount\n      hasDeposited\n      raffleContractAddress\n      luckBasedTokenRewardContract\n      __typename\n    }\n    __typename\n  }\n  tokenReward {\n    tokenAddress\n    tokenSymbol\n    tokenDecimal\n    tokenLogo\n    userTokenAmount\n    __typename\n  }\n  tokenRewardContract {\n    id\n    chain\n    address\n    __typename\n  }\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}\n\nfragment AddressInfosFrag on AddressInfos {\n  address\n  evmAddressSecondary\n  solanaAddress\n  aptosAddress\n  seiAddress\n  injectiveAddress\n  flowAddress\n  starknetAddress\n  suiAddress\n  bitcoinAddress\n  stacksAddress\n  azeroAddress\n  archwayAddress\n  xrplAddress\n  bitcoinSignetAddress\n  tonAddress\n  algorandAddress\n  kadenaAddress\n  __typename\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def get_smart_saving_balance(self) -> float:
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "GetBalance",
-            "variables": {
+        json_data = ops.GET_BALANCE.prepare(
+            {
                 "address": f"{self.wallet.address}",
-            },
-            "query": "query GetBalance($address: String!) {\n  GetBalance(address: $address) {\n    token\n    balance\n    pendingAmount\n    __typename\n  }\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data, use_save=True)
         if not data["data"]["GetBalance"]:
             return 0.0
@@ -763,9 +804,8 @@ class GalxeClient:
             chain = "MATIC"
         else:
             chain = client.network.name.upper()
-        json_data = {
-            "operationName": "RegisterInstantPaymentTask",
-            "variables": {
+        json_data = ops.REGISTER_INSTANT_PAYMENT_TASK.prepare(
+            {
                 "input": {
                     "taskParams": {
                         "amount": f"{amount.Wei}",
@@ -786,9 +826,8 @@ class GalxeClient:
                         "s": "0x0000000000000000000000000000000000000000000000000000000000000000",
                     },
                 },
-            },
-            "query": "mutation RegisterInstantPaymentTask($input: RegisterInstantPaymentTaskInput!) {\n  registerInstantPaymentTask(input: $input) {\n    taskId\n    taskFee\n    signature\n    ssEncodedData\n    ssVaultDepositSignature\n    depositToken\n    depositAmount\n    depositResponse {\n      messageFee\n      __typename\n    }\n    swapDepositResponse {\n      depositPool\n      messageFee\n      sourceSwap {\n        minOut\n        feeTier\n        __typename\n      }\n      sourceSwapPath\n      __typename\n    }\n    crossChainSwapDepositResponse {\n      targetEndpointId\n      targetToken\n      sourceSwap {\n        minOut\n        feeTier\n        __typename\n      }\n      targetSwap {\n        minOut\n        feeTier\n        __typename\n      }\n      nativeDrop\n      messageFee\n      sourceSwapPath\n      targetSwapPath\n      __typename\n    }\n    contractAddress\n    tokenTransfers {\n      amount\n      treasurer\n      __typename\n    }\n    __typename\n  }\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data)
         if "registerInstantPaymentTask" not in data["data"]:
             logger.warning(f"{self.wallet} can't get transactions details for subscribe data: {data}")
@@ -803,91 +842,80 @@ class GalxeClient:
     async def get_subscription(self):
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "GetUserPlusSubscription",
-            "variables": {},
-            "query": "query GetUserPlusSubscription {\n  userPlusSubscription {\n    active\n    currentPlanType\n    currentPaymentCycle\n    expiresAt\n    beginsAt\n    __typename\n  }\n}",
-        }
+        json_data = ops.GET_USER_PLUS_SUBSCRIPTION.prepare({})
         data = await self.request(json_data=json_data)
         return data["data"]["userPlusSubscription"]["active"]
 
     async def check_available_legend_box(self):
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "MysteryBoxes",
-            "variables": {
+        json_data = ops.MYSTERY_BOXES.prepare(
+            {
                 "address": f"EVM:{self.client.account.address}",
-            },
-            "query": "query MysteryBoxes($address: String!) {\n  mysteryBoxes {\n    id\n    name\n    logo\n    available\n    participateFee {\n      id\n      chain\n      tokenAmount\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    discountParticipateFee {\n      id\n      chain\n      tokenAmount\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    rewardConfig {\n      rewardCount\n      rewardType\n      rewardCap\n      rewardDesc\n      rewardIndex\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    credentialGroups(address: $address) {\n      id\n      name\n      credentials {\n        id\n        name\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
-        }
+            }
+        )
         data = await self.request(json_data=json_data)
         return data["data"]["mysteryBoxes"][-1]["available"]
 
     async def check_rewards(self):
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "UserTokenList",
-            "variables": {
+        json_data = ops.USER_TOKEN_LIST.prepare(
+            {
                 "request": {
                     "afterId": 0,
                     "limit": 10,
                 },
-            },
-            "query": "query UserTokenList($request: ListUserTokensRequest!) {\n  listUserTokens(request: $request) {\n    totalCount\n    pageInfo {\n      startCursor\n      endCursor\n      hasNextPage\n      hasPreviousPage\n      __typename\n    }\n    list {\n      id\n      chain\n      tokenAmount\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data)
 
     async def check_fee_withdraw_reward(self, token_id: int, token_amount):
         if not self.bearer_token:
             await self.auth()
-        json_data = {
-            "operationName": "RedeemTokenEstimation",
-            "variables": {
+        json_data = ops.REDEEM_TOKEN_ESTIMATION.prepare(
+            {
                 "input": {
                     "tokenId": token_id,
                     "tokenAmount": str(token_amount),
                 },
-            },
-            "query": "query RedeemTokenEstimation($input: RedeemTokenEstimationRequest!) {\n  redeemTokenEstimation(request: $input) {\n    gasFeeUSD\n    gasTokens {\n      paymentToken {\n        tokenAmount\n        tokenDetail {\n          ...TokenDetailFrag\n          __typename\n        }\n        __typename\n      }\n      paymentTokenAmount\n      gasTokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      gasTokenAmount\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
-        }
+            }
+        )
 
         return await self.request(json_data=json_data, suffix="__galxe_web")
 
     async def redeem_tokens_rewards(self, token_id: int, token_amount):
         time_for_request = int(time.time())
-        json_data = {
-            "operationName": "redeemToken",
-            "variables": {
+        json_data = ops.REDEEM_TOKEN.prepare(
+            {
                 "input": {
                     "tokenAmount": token_amount,
                     "redeemAddress": f"{self.wallet.address}",
                     "tokenId": token_id,
                     "timestamp": time_for_request,
                 },
-            },
-            "query": "mutation redeemToken($input: RedeemTokenRequest!) {\n  redeemToken(request: $input) {\n    success\n    __typename\n  }\n}",
-        }
+            }
+        )
         return await self.request(json_data=json_data, suffix=f"__galxe_web_{time_for_request}")
 
     async def follow_space(self, space_id: int):
-        json_data = {
-            "operationName": "followSpace",
-            "variables": {
+        json_data = ops.FOLLOW_SPACE.prepare(
+            {
                 "spaceIds": [
                     space_id,
                 ],
-            },
-            "query": "mutation followSpace($spaceIds: [Int!]) {\n  followSpace(spaceIds: $spaceIds)\n}",
-        }
+            }
+        )
 
         return await self.request(json_data=json_data)
 
     async def _get_minimum_deposit(self):
-        json_data = {
-            "operationName": "instantPaymentTaskMinimumDepositAmount",
-            "variables": {
+        data, _ = await CampaignCache.get(("minimum_deposit",), self._fetch_minimum_deposit)
+        return data
+
+    async def _fetch_minimum_deposit(self):
+        json_data = ops.INSTANT_PAYMENT_TASK_MINIMUM_DEPOSIT_AMOUNT.prepare(
+            {
                 "input": {
                     "tokens": [
                         {
@@ -954,7 +982,9 @@ class GalxeClient:
                         },
                     },
                 },
-            },
-            "query": "query instantPaymentTaskMinimumDepositAmount($input: InstantPaymentTaskMinimumDepositAmountInput!) {\n  instantPaymentTaskMinimumDepositAmount(input: $input) {\n    tokens {\n      token\n      chain\n      amount\n      __typename\n    }\n    __typename\n  }\n}",
-        }
-        return await self.request(json_data=json_data)
+            }
+        )
+        data = await self.request(json_data=json_data)
+        if not ((data.get("data") or {}).get("instantPaymentTaskMinimumDepositAmount") or {}).get("tokens"):
+            raise ValueError(f"bad instantPaymentTaskMinimumDepositAmount response: {data}")
+        return data
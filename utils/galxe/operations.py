@@ -0,0 +1,201 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # optional, the standard json module is used without it
+    orjson = None
+
+
+def dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class PreparedOperation:
+    """Request body of one operation call, ready to be sent as is"""
+
+    __slots__ = ("name", "body")
+
+    def __init__(self, name: str, body: bytes):
+        self.name = name
+        self.body = body
+
+
+class Operation:
+    """GraphQL document encoded once, only the variables are serialized per call"""
+
+    __slots__ = ("name", "query", "_prefix")
+
+    def __init__(self, name: str, query: str):
+        self.name = name
+        self.query = query
+        self._prefix = b'{"operationName":' + dumps(name) + b',"query":' + dumps(query) + b',"variables":'
+
+    def prepare(self, variables: dict) -> PreparedOperation:
+        return PreparedOperation(self.name, self._prefix + dumps(variables) + b"}")
+
+
+OPERATIONS: dict[str, Operation] = {}
+
+
+def _register(name: str, query: str) -> Operation:
+    operation = OPERATIONS[name] = Operation(name, query)
+    return operation
+
+
+DELETE_SOCIAL_ACCOUNT = _register(
+    "DeleteSocialAccount",
+    "mutation DeleteSocialAccount($input: DeleteSocialAccountInput!) {\n  deleteSocialAccount(input: $input) {\n    code\n    message\n    __typename\n  }\n}",
+)
+
+CHECK_TWITTER_ACCOUNT = _register(
+    "checkTwitterAccount",
+    "mutation checkTwitterAccount($input: VerifyTwitterAccountInput!) {\n  checkTwitterAccount(input: $input) {\n    address\n    twitterUserID\n    twitterUserName\n    __typename\n  }\n}",
+)
+
+VERIFY_TWITTER_ACCOUNT = _register(
+    "VerifyTwitterAccount",
+    "mutation VerifyTwitterAccount($input: VerifyTwitterAccountInput!) {\n  verifyTwitterAccount(input: $input) {\n    address\n    twitterUserID\n    twitterUserName\n    __typename\n  }\n}",
+)
+
+SPACE_LOYALTY_POINTS = _register(
+    "SpaceLoyaltyPoints",
+    "query SpaceLoyaltyPoints($id: Int, $address: String!, $seasonId: Int) {\n  space(id: $id) {\n    id\n    addressLoyaltyPoints(address: $address, sprintId: $seasonId) {\n      id\n      points\n      rank\n      __typename\n    }\n    __typename\n  }\n}",
+)
+
+PAYMENT_TASK_INFO = _register(
+    "paymentTaskInfo",
+    "query paymentTaskInfo($task_id: Int64!) {\n  paymentTaskInfo(taskID: $task_id) {\n    status\n    __typename\n  }\n}",
+)
+
+REGISTER_SS_PAYMENT_TASK = _register(
+    "registerSSPaymentTask",
+    "mutation registerSSPaymentTask($input: RegisterSSPaymentTaskInput!) {\n  registerSSPaymentTask(input: $input) {\n    taskId\n    success\n    failureReason\n    __typename\n  }\n}",
+)
+
+SS_PRE_CHECK_CAMPAIGN = _register(
+    "ssPreCheckCampaign",
+    "query ssPreCheckCampaign($id: ID!, $mintCount: Int!, $chain: Chain) {\n  campaign(id: $id) {\n    id\n    ssPaymentPreCheck(mintCount: $mintCount) {\n      checkRes\n      permitTokens {\n        tokenAddr\n        minimumTokenAmount\n        spenderAddr\n        __typename\n      }\n      __typename\n    }\n    ssPaymentPreCheckClaimPoints(chain: $chain) {\n      checkRes\n      permitTokens {\n        tokenAddr\n        minimumTokenAmount\n        spenderAddr\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}",
+)
+
+BASIC_USER_INFO = _register(
+    "BasicUserInfo",
+    "query BasicUserInfo($address: String!) {\n  addressInfo(address: $address) {\n    id\n    username\n    avatar\n    address\n    evmAddressSecondary {\n      address\n      __typename\n    }\n    userLevel {\n      level {\n        name\n        logo\n        minExp\n        maxExp\n        value\n        __typename\n      }\n      exp\n      gold\n      ggRecall\n      __typename\n    }\n    ggInviteeInfo {\n      questCount\n      ggCount\n      __typename\n    }\n    ggInviteCode\n    ggInviter {\n      id\n      username\n      __typename\n    }\n    isBot\n    hasEmail\n    solanaAddress\n    aptosAddress\n    seiAddress\n    injectiveAddress\n    flowAddress\n    starknetAddress\n    bitcoinAddress\n    suiAddress\n    stacksAddress\n    azeroAddress\n    archwayAddress\n    bitcoinSignetAddress\n    xrplAddress\n    algorandAddress\n    tonAddress\n    kadenaAddress\n    hasEvmAddress\n    hasSolanaAddress\n    hasAptosAddress\n    hasInjectiveAddress\n    hasFlowAddress\n    hasStarknetAddress\n    hasBitcoinAddress\n    hasSuiAddress\n    hasStacksAddress\n    hasAzeroAddress\n    hasArchwayAddress\n    hasBitcoinSignetAddress\n    hasXrplAddress\n    hasAlgorandAddress\n    hasTonAddress\n    hasKadenaAddress\n    hasTwitter\n    hasGithub\n    hasDiscord\n    hasTelegram\n    hasWorldcoin\n    displayEmail\n    displayTwitter\n    displayGithub\n    displayDiscord\n    displayTelegram\n    displayWorldcoin\n    displayNamePref\n    email\n    twitterUserID\n    twitterUserName\n    githubUserID\n    githubUserName\n    discordUserID\n    discordUserName\n    telegramUserID\n    telegramUserName\n    worldcoinID\n    enableEmailSubs\n    subscriptions\n    isWhitelisted\n    isInvited\n    isAdmin\n    accessToken\n    humanityType\n    __typename\n  }\n}",
+)
+
+READ_QUIZ = _register(
+    "readQuiz",
+    "query readQuiz($id: ID!) {\n  credential(id: $id) {\n    ...CredQuizFrag\n    __typename\n  }\n}\n\nfragment CredQuizFrag on Cred {\n  metadata {\n    quiz {\n      material\n      quizzes {\n        title\n        type\n        alvaHints\n        items {\n          value\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  __typename\n}",
+)
+
+SYNC_CREDENTIAL_VALUE = _register(
+    "SyncCredentialValue",
+    "mutation SyncCredentialValue($input: SyncCredentialValueInput!) {\n  syncCredentialValue(input: $input) {\n    value {\n      address\n      spaceUsers {\n        follow\n        points\n        participations\n        __typename\n      }\n      campaignReferral {\n        count\n        __typename\n      }\n      galxePassport {\n        eligible\n        lastSelfieTimestamp\n        __typename\n      }\n      spacePoint {\n        points\n        __typename\n      }\n      spaceParticipation {\n        participations\n        __typename\n      }\n      gitcoinPassport {\n        score\n        lastScoreTimestamp\n        __typename\n      }\n      walletBalance {\n        balance\n        __typename\n      }\n      multiDimension {\n        value\n        __typename\n      }\n      allow\n      survey {\n        answers\n        __typename\n      }\n      quiz {\n        allow\n        correct\n        __typename\n      }\n      prediction {\n        isCorrect\n        __typename\n      }\n      spaceFollower {\n        follow\n        __typename\n      }\n      __typename\n    }\n    message\n    __typename\n  }\n}",
+)
+
+OPEN_MYSTERY_BOX = _register(
+    "OpenMysteryBox",
+    "mutation OpenMysteryBox($input: OpenMysteryBoxInput!) {\n  openMysteryBox(input: $input) {\n    description\n    rewards {\n      rewardCount\n      rewardIndex\n      rewardId\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
+)
+
+ADD_TYPED_CREDENTIAL_ITEMS = _register(
+    "AddTypedCredentialItems",
+    "mutation AddTypedCredentialItems($input: MutateTypedCredItemInput!) {\n  typedCredentialItems(input: $input) {\n    id\n    __typename\n  }\n}",
+)
+
+TWITTER_OAUTH2_STATUS = _register(
+    "TwitterOauth2Status",
+    "query TwitterOauth2Status {\n  twitterOauth2Status {\n    oauthRateLimited\n    __typename\n  }\n}",
+)
+
+SYNC_EVALUATE_CREDENTIAL_VALUE = _register(
+    "syncEvaluateCredentialValue",
+    "mutation syncEvaluateCredentialValue($input: SyncEvaluateCredentialValueInput!) {\n  syncEvaluateCredentialValue(input: $input) {\n    result\n    value {\n      allow\n      survey {\n        answers\n        __typename\n      }\n      quiz {\n        allow\n        correct\n        __typename\n      }\n      __typename\n    }\n    message\n    __typename\n  }\n}",
+)
+
+QUEST_CLAIM_SECTION = _register(
+    "QuestClaimSection",
+    "query QuestClaimSection($id: ID!, $address: String!, $withAddress: Boolean!, $isParent: Boolean = false) {\n  campaign(id: $id) {\n    ...QuestClaimFragment\n    boost(address: $address) {\n      golden\n      boost\n      boostedGold\n      reason\n      __typename\n    }\n    numNFTMinted\n    participants @skip(if: $isParent) {\n      participantsCount\n      __typename\n    }\n    userParticipants(address: $address, first: 1) @include(if: $withAddress) {\n      list {\n        status\n        __typename\n      }\n      __typename\n    }\n    name\n    description\n    userAgreement\n    airdrop {\n      rewardType\n      rewardAmount\n      rewardInfo {\n        custom {\n          name\n          icon\n          __typename\n        }\n        token {\n          address\n          decimals\n          symbol\n          icon\n          __typename\n        }\n        __typename\n      }\n      claimDetail(address: $address) {\n        amount\n        __typename\n      }\n      __typename\n    }\n    space {\n      isFollowing @include(if: $withAddress)\n      isVerified\n      __typename\n    }\n    inWatchList\n    __typename\n  }\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment QuestClaimFragment on Campaign {\n  id\n  numberID\n  type\n  chain\n  status\n  distributionType\n  startTime\n  endTime\n  claimEndTime\n  cap\n  recurringType\n  loyaltyPoints\n  rewardName\n  rewardType\n  gasType\n  ...CampaignForGetImage\n  ...CampaignForTokenObject\n  space {\n    id\n    alias\n    discordGuildID\n    name\n    thumbnail\n    loyaltyPointContractList {\n      address\n      chain\n      status\n      __typename\n    }\n    __typename\n  }\n  ...WhitelistInfoFrag\n  ...WhitelistSubgraphFrag\n  rewardInfo {\n    discordRole {\n      roleName\n      guildName\n      inviteLink\n      __typename\n    }\n    gasConfig {\n      rewardEntity\n      gasType\n      __typename\n    }\n    __typename\n  }\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  credentialGroups(address: $address) {\n    id\n    rewards {\n      rewardType\n      rewardCount\n      __typename\n    }\n    __typename\n  }\n  tokenReward {\n    raffleContractAddress\n    __typename\n  }\n  spaceStation {\n    address\n    __typename\n  }\n  parentCampaign {\n    id\n    __typename\n  }\n  taskConfig(address: $address) {\n    rewardConfigs {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    requiredInfo {\n      socialInfos {\n        email\n        discordUserID\n        twitterUserID\n        telegramUserID\n        githubUserID\n        googleUserID\n        worldcoinID\n        __typename\n      }\n      addressInfos {\n        ...AddressInfosFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  nftTemplates {\n    id\n    animationURL\n    category\n    image\n    name\n    treasureBack\n    __typename\n  }\n  nftCore {\n    id\n    contractAddress\n    chain\n    transferable\n    createdAt\n    __typename\n  }\n  tokenReward {\n    userTokenAmount\n    tokenAddress\n    depositedTokenAmount\n    tokenRewardContract\n    tokenDecimal\n    tokenLogo\n    tokenSymbol\n    raffleContractAddress\n    suiTableId\n    suiCampaignId\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistInfoFrag on Campaign {\n  id\n  whitelistInfo(address: $address) {\n    address\n    maxCount\n    usedCount\n    claimedLoyaltyPoints\n    currentPeriodClaimedLoyaltyPoints\n    currentPeriodMaxLoyaltyPoints\n    xrplLinks\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistSubgraphFrag on Campaign {\n  id\n  whitelistSubgraph {\n    query\n    endpoint\n    expression\n    variable\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignForGetImage on Campaign {\n  ...GetImageCommon\n  nftTemplates {\n    image\n    __typename\n  }\n  __typename\n}\n\nfragment GetImageCommon on Campaign {\n  ...CampaignForTokenObject\n  id\n  type\n  thumbnail\n  __typename\n}\n\nfragment CampaignForTokenObject on Campaign {\n  type\n  chain\n  cap\n  rewardInfo {\n    luckBasedToken {\n      totalAmount\n      userAvailableMaxAmount\n      tokenAddress\n      tokenDecimal\n      tokenLogo\n      tokenSymbol\n      withdrawnTokenAmount\n      hasDeposited\n      raffleContractAddress\n      luckBasedTokenRewardContract\n      __typename\n    }\n    __typename\n  }\n  tokenReward {\n    tokenAddress\n    tokenSymbol\n    tokenDecimal\n    tokenLogo\n    userTokenAmount\n    __typename\n  }\n  tokenRewardContract {\n    id\n    chain\n    address\n    __typename\n  }\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}\n\nfragment AddressInfosFrag on AddressInfos {\n  address\n  evmAddressSecondary\n  solanaAddress\n  aptosAddress\n  seiAddress\n  injectiveAddress\n  flowAddress\n  starknetAddress\n  suiAddress\n  bitcoinAddress\n  stacksAddress\n  azeroAddress\n  archwayAddress\n  xrplAddress\n  bitcoinSignetAddress\n  tonAddress\n  algorandAddress\n  kadenaAddress\n  __typename\n}",
+)
+
+QUEST_COLLECTION = _register(
+    "QuestCollection",
+    'query QuestCollection($id: ID!, $address: String!, $withAddress: Boolean!) {\n  campaign(id: $id) {\n    id\n    childrenCampaigns {\n      ...ChildrenCampaignsForCampaignDetailAll\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment CampaignDetailFrag on Campaign {\n  id\n  ...CampaignMedia\n  ...CampaignForCampaignParticipantsBox\n  nftCore {\n    ...NftCoreInfoFrag\n    __typename\n  }\n  name\n  numberID\n  type\n  inWatchList\n  cap\n  info\n  useCred\n  smartbalancePreCheck(mintCount: 1)\n  smartbalancePreCheckClaimPoints\n  smartbalanceDeposited\n  formula\n  status\n  seoImage\n  creator\n  tags\n  thumbnail\n  gasType\n  isPrivate\n  createdAt\n  requirementInfo\n  description\n  enableWhitelist\n  chain\n  startTime\n  endTime\n  requireEmail\n  requireUsername\n  blacklistCountryCodes\n  whitelistRegions\n  rewardType\n  distributionType\n  rewardName\n  claimEndTime\n  loyaltyPoints\n  previousIsPrivate\n  tokenRewardContract {\n    id\n    address\n    chain\n    __typename\n  }\n  tokenReward {\n    userTokenAmount\n    tokenAddress\n    depositedTokenAmount\n    tokenRewardContract\n    tokenDecimal\n    tokenLogo\n    tokenSymbol\n    raffleContractAddress\n    suiTableId\n    suiCampaignId\n    __typename\n  }\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  spaceStation {\n    id\n    address\n    chain\n    __typename\n  }\n  ...WhitelistInfoFrag\n  ...WhitelistSubgraphFrag\n  rewardInfo {\n    discordRole {\n      guildId\n      guildName\n      roleId\n      roleName\n      inviteLink\n      __typename\n    }\n    premint {\n      startTime\n      endTime\n      chain\n      price\n      totalSupply\n      contractAddress\n      banner\n      __typename\n    }\n    loyaltyPoints {\n      points\n      __typename\n    }\n    loyaltyPointsMysteryBox {\n      points\n      weight\n      __typename\n    }\n    gasConfig {\n      rewardEntity\n      gasType\n      __typename\n    }\n    luckBasedToken {\n      totalAmount\n      userAvailableMaxAmount\n      tokenAddress\n      tokenDecimal\n      tokenLogo\n      tokenSymbol\n      withdrawnTokenAmount\n      hasDeposited\n      raffleContractAddress\n      luckBasedTokenRewardContract\n      __typename\n    }\n    __typename\n  }\n  participants {\n    participantsCount\n    bountyWinnersCount\n    __typename\n  }\n  taskConfig(address: $address) {\n    participateCondition {\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      eligible\n      __typename\n    }\n    requiredInfo {\n      socialInfos {\n        email\n        discordUserID\n        twitterUserID\n        telegramUserID\n        githubUserID\n        googleUserID\n        worldcoinID\n        __typename\n      }\n      addressInfos {\n        ...AddressInfosFrag\n        __typename\n      }\n      __typename\n    }\n    rewardConfigs {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    referralConfig {\n      id\n      conditions {\n        ...ExpressionEntity\n        __typename\n      }\n      conditionalFormula\n      description\n      rewards {\n        ...ExpressionReward\n        __typename\n      }\n      eligible\n      rewardAttrVals {\n        attrName\n        attrTitle\n        attrVal\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n  referralCode(address: $address)\n  recurringType\n  latestRecurringTime\n  nftTemplates {\n    id\n    animationURL\n    category\n    image\n    name\n    treasureBack\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignMedia on Campaign {\n  thumbnail\n  rewardName\n  type\n  gamification {\n    id\n    type\n    __typename\n  }\n  __typename\n}\n\nfragment CampaignForCampaignParticipantsBox on Campaign {\n  ...CampaignForParticipantsDialog\n  id\n  chain\n  space {\n    id\n    isAdmin(address: $address)\n    __typename\n  }\n  participants {\n    participants(first: 10, after: "-1", download: false) {\n      list {\n        address {\n          id\n          avatar\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    participantsCount\n    bountyWinners(first: 10, after: "-1", download: false) {\n      list {\n        createdTime\n        address {\n          id\n          avatar\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    bountyWinnersCount\n    __typename\n  }\n  __typename\n}\n\nfragment ChildrenCampaignsForCampaignDetailAll on Campaign {\n  id\n  boost(address: $address) {\n    golden\n    boost\n    boostedGold\n    reason\n    __typename\n  }\n  space {\n    ...SpaceDetail\n    isAdmin(address: $address) @include(if: $withAddress)\n    isFollowing @include(if: $withAddress)\n    followersCount\n    categories\n    showAskAlva\n    __typename\n  }\n  ...CampaignDetailFrag\n  claimedLoyaltyPoints(address: $address) @include(if: $withAddress)\n  userParticipants(address: $address, first: 1) @include(if: $withAddress) {\n    list {\n      id\n      status\n      __typename\n    }\n    __typename\n  }\n  parentCampaign {\n    id\n    isSequencial\n    __typename\n  }\n  credentialGroups(address: $address) {\n    ...CredentialGroupForAddress\n    __typename\n  }\n  __typename\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment NftCoreInfoFrag on NFTCore {\n  id\n  capable\n  chain\n  contractAddress\n  name\n  symbol\n  transferable\n  __typename\n}\n\nfragment CampaignForParticipantsDialog on Campaign {\n  id\n  name\n  type\n  rewardType\n  chain\n  nftHolderSnapshot {\n    holderSnapshotBlock\n    __typename\n  }\n  space {\n    isAdmin(address: $address)\n    __typename\n  }\n  rewardInfo {\n    discordRole {\n      guildName\n      roleName\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistInfoFrag on Campaign {\n  id\n  whitelistInfo(address: $address) {\n    address\n    maxCount\n    usedCount\n    claimedLoyaltyPoints\n    currentPeriodClaimedLoyaltyPoints\n    currentPeriodMaxLoyaltyPoints\n    xrplLinks\n    __typename\n  }\n  __typename\n}\n\nfragment WhitelistSubgraphFrag on Campaign {\n  id\n  whitelistSubgraph {\n    query\n    endpoint\n    expression\n    variable\n    __typename\n  }\n  __typename\n}\n\nfragment CredDiscordMetaData on CredMetadata {\n  discord {\n    discordAma {\n      LinkIsInvalid\n      __typename\n    }\n    discordMember {\n      LinkIsInvalid\n      __typename\n    }\n    discordMessage {\n      LinkIsInvalid\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nfragment CredForAddressWithDiscordMetadata on Cred {\n  ...CredForAddressWithoutMetadata\n  metadata {\n    ...CredDiscordMetaData\n    __typename\n  }\n  __typename\n}\n\nfragment CredForAddressWithoutMetadata on Cred {\n  id\n  name\n  type\n  credType\n  credSource\n  referenceLink\n  description\n  lastUpdate\n  lastSync\n  syncStatus\n  credContractNFTHolder {\n    timestamp\n    __typename\n  }\n  chain\n  eligible(address: $address)\n  subgraph {\n    endpoint\n    query\n    expression\n    __typename\n  }\n  dimensionConfig\n  value {\n    gitcoinPassport {\n      score\n      lastScoreTimestamp\n      __typename\n    }\n    __typename\n  }\n  __typename\n}\n\nfragment CredentialGroupForAddress on CredentialGroup {\n  id\n  description\n  credentials {\n    ...CredForAddressWithDiscordMetadata\n    __typename\n  }\n  conditionRelation\n  conditions {\n    expression\n    eligible\n    ...CredentialGroupConditionForVerifyButton\n    __typename\n  }\n  rewards {\n    expression\n    eligible\n    rewardCount\n    rewardType\n    __typename\n  }\n  rewardAttrVals {\n    attrName\n    attrTitle\n    attrVal\n    __typename\n  }\n  claimedLoyaltyPoints\n  __typename\n}\n\nfragment CredentialGroupConditionForVerifyButton on CredentialGroupCondition {\n  expression\n  eligibleAddress\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}\n\nfragment SpaceDetail on Space {\n  id\n  name\n  info\n  thumbnail\n  alias\n  status\n  links\n  isVerified\n  discordGuildID\n  followersCount\n  loyaltyPointContractList {\n    id\n    status\n    chain\n    __typename\n  }\n  __typename\n}\n\nfragment AddressInfosFrag on AddressInfos {\n  address\n  evmAddressSecondary\n  solanaAddress\n  aptosAddress\n  seiAddress\n  injectiveAddress\n  flowAddress\n  starknetAddress\n  suiAddress\n  bitcoinAddress\n  stacksAddress\n  azeroAddress\n  archwayAddress\n  xrplAddress\n  bitcoinSignetAddress\n  tonAddress\n  algorandAddress\n  kadenaAddress\n  __typename\n}',
+)
+
+QUEST_CRED_LIST = _register(
+    "QuestCredList",
+    "query QuestCredList($id: ID!, $address: String!) {\n  campaign(id: $id) {\n    id\n    endTime\n    space {\n      alias\n      id\n      name\n      thumbnail\n      __typename\n    }\n    recurringType\n    latestRecurringTime\n    taskConfig(address: $address) {\n      participateCondition {\n        conditions {\n          ...ExpressionEntity\n          __typename\n        }\n        conditionalFormula\n        eligible\n        __typename\n      }\n      rewardConfigs {\n        id\n        conditions {\n          ...ExpressionEntity\n          __typename\n        }\n        conditionalFormula\n        description\n        rewards {\n          ...ExpressionReward\n          __typename\n        }\n        eligible\n        rewardAttrVals {\n          attrName\n          attrTitle\n          attrVal\n          __typename\n        }\n        __typename\n      }\n      referralConfig {\n        id\n        conditions {\n          ...ExpressionEntity\n          __typename\n        }\n        conditionalFormula\n        description\n        rewards {\n          ...ExpressionReward\n          __typename\n        }\n        eligible\n        rewardAttrVals {\n          attrName\n          attrTitle\n          attrVal\n          __typename\n        }\n        __typename\n      }\n      __typename\n    }\n    referralCode(address: $address)\n    __typename\n  }\n}\n\nfragment ExpressionReward on ExprReward {\n  arithmetics {\n    ...ExpressionEntity\n    __typename\n  }\n  arithmeticFormula\n  rewardType\n  rewardCount\n  rewardVal\n  __typename\n}\n\nfragment ExpressionEntity on ExprEntity {\n  cred {\n    id\n    name\n    credType\n    credSource\n    dimensionConfig\n    referenceLink\n    description\n    lastUpdate\n    lastSync\n    chain\n    curatorSpace {\n      id\n      name\n      thumbnail\n      __typename\n    }\n    eligible(address: $address)\n    metadata {\n      twitter {\n        isAuthentic\n        __typename\n      }\n      worldcoin {\n        dimensions {\n          values {\n            value\n            __typename\n          }\n          __typename\n        }\n        __typename\n      }\n      discord {\n        discordAma {\n          LinkIsInvalid\n          __typename\n        }\n        discordMember {\n          LinkIsInvalid\n          __typename\n        }\n        discordMessage {\n          LinkIsInvalid\n          __typename\n        }\n        __typename\n      }\n      prediction {\n        options {\n          option\n          isCorrect\n          chosenCount\n          __typename\n        }\n        deadlineForVoting\n        deadlineForReveal\n        rule\n        __typename\n      }\n      __typename\n    }\n    commonInfo {\n      participateEndTime\n      modificationInfo\n      __typename\n    }\n    __typename\n  }\n  attrs {\n    attrName\n    operatorSymbol\n    targetValue\n    __typename\n  }\n  attrFormula\n  eligible\n  eligibleAddress\n  __typename\n}",
+)
+
+QUEST_CRED_STATE = _register(
+    "QuestCredState",
+    "query QuestCredState($id: ID!, $address: String!) {\n  campaign(id: $id) {\n    id\n    taskConfig(address: $address) {\n      participateCondition {\n        conditions {\n          ...ExpressionEntityState\n          __typename\n        }\n        eligible\n        __typename\n      }\n      rewardConfigs {\n        id\n        conditions {\n          ...ExpressionEntityState\n          __typename\n        }\n        rewards {\n          rewardCount\n          rewardVal\n          __typename\n        }\n        eligible\n        __typename\n      }\n      referralConfig {\n        id\n        conditions {\n          ...ExpressionEntityState\n          __typename\n        }\n        rewards {\n          rewardCount\n          rewardVal\n          __typename\n        }\n        eligible\n        __typename\n      }\n      __typename\n    }\n    referralCode(address: $address)\n    __typename\n  }\n}\n\nfragment ExpressionEntityState on ExprEntity {\n  cred {\n    id\n    eligible(address: $address)\n    __typename\n  }\n  eligible\n  eligibleAddress\n  __typename\n}",
+)
+
+CRED_ZK_JSON = _register(
+    "credZKJson",
+    "query credZKJson($id: ID!, $eligibleAddress: String!) {\n  credential(id: $id, eligibleAddress: $eligibleAddress) {\n    identityProtocol {\n      signedCredential\n      __typename\n    }\n    __typename\n  }\n}",
+)
+
+PREPARE_PARTICIPATE = _register(
+    "PrepareParticipate",
+    "mutation PrepareParticipate($input: PrepareParticipateInput!) {\n  prepareParticipate(input: $input) {\n    allow\n    disallowReason\n    signature\n    nonce\n    spaceStationInfo {\n      address\n      chain\n      version\n      __typename\n    }\n    mintFuncInfo {\n      funcName\n      nftCoreAddress\n      verifyIDs\n      powahs\n      cap\n      claimFeeAmount\n      __typename\n    }\n    extLinkResp {\n      success\n      data\n      error\n      __typename\n    }\n    metaTxResp {\n      metaSig2\n      autoTaskUrl\n      metaSpaceAddr\n      forwarderAddr\n      metaTxHash\n      reqQueueing\n      __typename\n    }\n    solanaTxResp {\n      mint\n      updateAuthority\n      explorerUrl\n      signedTx\n      verifyID\n      __typename\n    }\n    aptosTxResp {\n      signatureExpiredAt\n      tokenName\n      __typename\n    }\n    spaceStation\n    airdropRewardCampaignTxResp {\n      airdropID\n      verifyID\n      index\n      account\n      amount\n      proof\n      customReward\n      __typename\n    }\n    tokenRewardCampaignTxResp {\n      signatureExpiredAt\n      verifyID\n      encodeAddress\n      weight\n      claimFeeAmount\n      __typename\n    }\n    loyaltyPointsTxResp {\n      TotalClaimedPoints\n      VerifyIDs\n      loyaltyPointDistributionStation\n      signature\n      disallowReason\n      nonce\n      allow\n      loyaltyPointContract\n      Points\n      reqQueueing\n      claimFeeAmount\n      suiTxResp {\n        galxeTableId\n        __typename\n      }\n      __typename\n    }\n    flowTxResp {\n      Name\n      Description\n      Thumbnail\n      __typename\n    }\n    xrplLinks\n    suiTxResp {\n      packageId\n      tableId\n      nftName\n      campaignId\n      verifyID\n      imgUrl\n      signatureExpiredAt\n      __typename\n    }\n    algorandTxResp {\n      algorandArgs {\n        args\n        __typename\n      }\n      algorandBoxes {\n        boxes\n        __typename\n      }\n      __typename\n    }\n    spaceStationProxyResp {\n      target\n      callData\n      __typename\n    }\n    luckBasedTokenCampaignTxResp {\n      cid\n      dummyId\n      expiredAt\n      claimTo\n      index\n      claimAmount\n      proof\n      claimFeeAmount\n      signature\n      encodeAddress\n      weight\n      __typename\n    }\n    __typename\n  }\n}",
+)
+
+CAMPAIGN_CLAIM_INFO = _register(
+    "CampaignClaimInfo",
+    "query CampaignClaimInfo($id: ID!, $address: String!) {\n  campaign(id: $id) {\n    id\n    numberID\n    chain\n    whitelistInfo(address: $address) {\n      address\n      maxCount\n      usedCount\n      claimedLoyaltyPoints\n      currentPeriodClaimedLoyaltyPoints\n      currentPeriodMaxLoyaltyPoints\n      __typename\n    }\n    __typename\n  }\n}",
+)
+
+GET_BALANCE = _register(
+    "GetBalance",
+    "query GetBalance($address: String!) {\n  GetBalance(address: $address) {\n    token\n    balance\n    pendingAmount\n    __typename\n  }\n}",
+)
+
+REGISTER_INSTANT_PAYMENT_TASK = _register(
+    "RegisterInstantPaymentTask",
+    "mutation RegisterInstantPaymentTask($input: RegisterInstantPaymentTaskInput!) {\n  registerInstantPaymentTask(input: $input) {\n    taskId\n    taskFee\n    signature\n    ssEncodedData\n    ssVaultDepositSignature\n    depositToken\n    depositAmount\n    depositResponse {\n      messageFee\n      __typename\n    }\n    swapDepositResponse {\n      depositPool\n      messageFee\n      sourceSwap {\n        minOut\n        feeTier\n        __typename\n      }\n      sourceSwapPath\n      __typename\n    }\n    crossChainSwapDepositResponse {\n      targetEndpointId\n      targetToken\n      sourceSwap {\n        minOut\n        feeTier\n        __typename\n      }\n      targetSwap {\n        minOut\n        feeTier\n        __typename\n      }\n      nativeDrop\n      messageFee\n      sourceSwapPath\n      targetSwapPath\n      __typename\n    }\n    contractAddress\n    tokenTransfers {\n      amount\n      treasurer\n      __typename\n    }\n    __typename\n  }\n}",
+)
+
+GET_USER_PLUS_SUBSCRIPTION = _register(
+    "GetUserPlusSubscription",
+    "query GetUserPlusSubscription {\n  userPlusSubscription {\n    active\n    currentPlanType\n    currentPaymentCycle\n    expiresAt\n    beginsAt\n    __typename\n  }\n}",
+)
+
+MYSTERY_BOXES = _register(
+    "MysteryBoxes",
+    "query MysteryBoxes($address: String!) {\n  mysteryBoxes {\n    id\n    name\n    logo\n    available\n    participateFee {\n      id\n      chain\n      tokenAmount\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    discountParticipateFee {\n      id\n      chain\n      tokenAmount\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    rewardConfig {\n      rewardCount\n      rewardType\n      rewardCap\n      rewardDesc\n      rewardIndex\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    credentialGroups(address: $address) {\n      id\n      name\n      credentials {\n        id\n        name\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
+)
+
+USER_TOKEN_LIST = _register(
+    "UserTokenList",
+    "query UserTokenList($request: ListUserTokensRequest!) {\n  listUserTokens(request: $request) {\n    totalCount\n    pageInfo {\n      startCursor\n      endCursor\n      hasNextPage\n      hasPreviousPage\n      __typename\n    }\n    list {\n      id\n      chain\n      tokenAmount\n      tokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
+)
+
+REDEEM_TOKEN_ESTIMATION = _register(
+    "RedeemTokenEstimation",
+    "query RedeemTokenEstimation($input: RedeemTokenEstimationRequest!) {\n  redeemTokenEstimation(request: $input) {\n    gasFeeUSD\n    gasTokens {\n      paymentToken {\n        tokenAmount\n        tokenDetail {\n          ...TokenDetailFrag\n          __typename\n        }\n        __typename\n      }\n      paymentTokenAmount\n      gasTokenDetail {\n        ...TokenDetailFrag\n        __typename\n      }\n      gasTokenAmount\n      __typename\n    }\n    __typename\n  }\n}\n\nfragment TokenDetailFrag on TokenDetail {\n  id\n  chain\n  tokenDecimal\n  tokenLogo\n  tokenSymbol\n  tokenAddress\n  __typename\n}",
+)
+
+REDEEM_TOKEN = _register(
+    "redeemToken",
+    "mutation redeemToken($input: RedeemTokenRequest!) {\n  redeemToken(request: $input) {\n    success\n    __typename\n  }\n}",
+)
+
+FOLLOW_SPACE = _register(
+    "followSpace",
+    "mutation followSpace($spaceIds: [Int!]) {\n  followSpace(spaceIds: $spaceIds)\n}",
+)
+
+INSTANT_PAYMENT_TASK_MINIMUM_DEPOSIT_AMOUNT = _register(
+    "instantPaymentTaskMinimumDepositAmount",
+    "query instantPaymentTaskMinimumDepositAmount($input: InstantPaymentTaskMinimumDepositAmountInput!) {\n  instantPaymentTaskMinimumDepositAmount(input: $input) {\n    tokens {\n      token\n      chain\n      amount\n      __typename\n    }\n    __typename\n  }\n}",
+)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+
+class UserInfo:
+    """Fields of BasicUserInfo the client reads"""
+
+    __slots__ = ("id", "is_bot", "twitter_user_id")
+
+    def __init__(self, id: str, is_bot: bool, twitter_user_id: Optional[str]):
+        self.id = id
+        self.is_bot = is_bot
+        self.twitter_user_id = twitter_user_id
+
+    @classmethod
+    def from_response(cls, data: dict) -> "UserInfo":
+        info = data["data"]["addressInfo"]
+        return cls(id=info["id"], is_bot=info["isBot"], twitter_user_id=info["twitterUserID"])
+
+
+class LoyaltyPoints:
+    """Points and rank of the wallet in a space (SpaceLoyaltyPoints)"""
+
+    __slots__ = ("points", "rank")
+
+    def __init__(self, points: int, rank: int):
+        self.points = points
+        self.rank = rank
+
+    @classmethod
+    def from_response(cls, data: dict) -> "LoyaltyPoints":
+        loyalty = data["data"]["space"]["addressLoyaltyPoints"]
+        return cls(points=loyalty["points"], rank=loyalty["rank"])
+
+
+def sync_allowed(data: dict) -> bool:
+    """Result of a SyncCredentialValue response"""
+    return data["data"]["syncCredentialValue"]["value"]["allow"]
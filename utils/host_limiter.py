@@ -0,0 +1,242 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from data.settings import Settings
+from utils.circuit_breaker import CircuitBreakers
+from utils.metrics import Metrics
+
+
+class _Outcome:
+    __slots__ = ("status", "error")
+
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+
+
+class HostLimiter:
+    """
+    AIMD concurrency limit of a single upstream host
+
+    The limit grows by one after a full window of healthy responses and is cut
+    by `decrease` on 429, 5xx, transport errors or latency far above the best seen.
+    """
+
+    def __init__(self, host: str, initial: int, min_limit: int, max_limit: int, decrease: float, latency_factor: float):
+        self.host = host
+        self.limit: float = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+
+        self.in_flight = 0
+        self.successes = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.errors = 0
+        self.latency_ewma: Optional[float] = None
+        self.latency_min: Optional[float] = None
+
+        self._healthy_streak = 0
+        self._last_decrease = 0.0
+        self._waiters: list[asyncio.Future] = []
+
+    async def acquire(self) -> None:
+        # queued requests go first, a newcomer doesn't take a slot freed for one of them
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+
+        first = True
+        while first or self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            if first:
+                self._waiters.append(waiter)
+            else:
+                # woken but the limit was cut meanwhile, keep the place at the head of the queue
+                self._waiters.insert(0, waiter)
+            first = False
+            try:
+                await waiter
+            except BaseException:
+                self._waiters.remove(waiter)
+                if waiter.done() and not waiter.cancelled():
+                    # cancelled after being woken, hand the slot to the next waiter
+                    self._wake()
+                raise
+            self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        for waiter in self._waiters[: max(free, 0)]:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _on_healthy(self) -> None:
+        self._healthy_streak += 1
+        if self._healthy_streak >= int(self.limit) and self.limit < self.max_limit:
+            self._healthy_streak = 0
+            self.limit = min(self.max_limit, self.limit + 1)
+            self._wake()
+
+    def _on_congestion(self, reason: str) -> None:
+        self._healthy_streak = 0
+        now = time.monotonic()
+        # requests started before the previous cut report the same congestion, so cut once per latency window
+        if now - self._last_decrease < (self.latency_ewma or 1.0):
+            return
+        self._last_decrease = now
+        previous = int(self.limit)
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+        if int(self.limit) != previous:
+            logger.debug(f"Host limiter | {self.host} {reason}, concurrency {previous} -> {int(self.limit)}")
+
+    def record(self, status: Optional[int], latency: float, error: Optional[BaseException] = None) -> None:
+        """
+        Update the limit with the outcome of one request
+
+        Args:
+            status: HTTP status code, None if no response was received
+            latency: request duration in seconds
+            error: transport error raised by the request
+        """
+        if error is not None and status is None:
+            self.errors += 1
+            self._on_congestion(reason=error.__class__.__name__)
+            return
+
+        if status == 429:
+            self.throttled += 1
+            self._on_congestion(reason="throttled")
+            return
+        if status is not None and status >= 500:
+            self.server_errors += 1
+            self._on_congestion(reason=f"http {status}")
+            return
+
+        self.successes += 1
+        self.latency_ewma = latency if self.latency_ewma is None else self.latency_ewma * 0.8 + latency * 0.2
+        self.latency_min = latency if self.latency_min is None else min(self.latency_min, latency)
+        if self.latency_ewma > self.latency_min * self.latency_factor and self.latency_ewma > 1.0:
+            self._on_congestion(reason=f"latency {self.latency_ewma:.1f}s")
+        else:
+            self._on_healthy()
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "ok": self.successes,
+            "429": self.throttled,
+            "5xx": self.server_errors,
+            "errors": self.errors,
+            "latency_ms": int((self.latency_ewma or 0) * 1000),
+        }
+
+
+class AdaptiveLimiter:
+    """Registry of per-host AIMD limiters shared by Browser, web3 providers and the Twitter client"""
+
+    _hosts: dict[str, HostLimiter] = {}
+    _enabled: Optional[bool] = None
+
+    @staticmethod
+    def host_of(url) -> str:
+        return urlsplit(str(url)).hostname or str(url)
+
+    @staticmethod
+    def _status_of(error: Exception) -> Optional[int]:
+        status = getattr(error, "status", None) or getattr(getattr(error, "response", None), "status_code", None)
+        return status if isinstance(status, int) else None
+
+    @classmethod
+    def get(cls, host: str) -> HostLimiter:
+        limiter = cls._hosts.get(host)
+        if limiter is None:
+            settings = Settings()
+            limiter = HostLimiter(
+                host=host,
+                initial=settings.adaptive_concurrency_initial,
+                min_limit=settings.adaptive_concurrency_min,
+                max_limit=settings.adaptive_concurrency_max,
+                decrease=settings.adaptive_concurrency_decrease,
+                latency_factor=settings.adaptive_concurrency_latency_factor,
+            )
+            cls._hosts[host] = limiter
+        return limiter
+
+    @classmethod
+    @asynccontextmanager
+    async def request(cls, url):
+        """
+        Hold a concurrency slot of the url host for one request
+
+        The caller sets `outcome.status` from the response, errors are recorded automatically.
+        Raises CircuitOpen without waiting for a slot while the circuit breaker of the host is open.
+        """
+        outcome = _Outcome()
+        if cls._enabled is None:
+            cls._enabled = Settings().adaptive_concurrency
+
+        host = cls.host_of(url)
+        breaker = CircuitBreakers.get(host)
+        probe = breaker.allow() if breaker else False
+        limiter = cls.get(host) if cls._enabled else None
+        if limiter:
+            try:
+                await limiter.acquire()
+            except BaseException:
+                if probe:
+                    # the probe never reached the host, let the next request probe
+                    breaker.record(status=None, error=None, probe=True)
+                raise
+        started = time.monotonic()
+        try:
+            yield outcome
+        except Exception as e:
+            outcome.error = e
+            outcome.status = outcome.status or cls._status_of(e)
+            raise
+        finally:
+            # cancelled requests tell nothing about the host
+            if outcome.status is not None or outcome.error is not None:
+                latency = time.monotonic() - started
+                Metrics.observe("http_request_duration_seconds", latency, host=host)
+                Metrics.inc("http_requests_total", host=host, status=outcome.status or "error")
+                if limiter:
+                    limiter.record(status=outcome.status, latency=latency, error=outcome.error)
+            if breaker:
+                breaker.record(status=outcome.status, error=outcome.error, probe=probe)
+            if limiter:
+                limiter.release()
+
+    @classmethod
+    def stats(cls) -> dict[str, dict]:
+        return {host: limiter.stats() for host, limiter in cls._hosts.items()}
+
+    @classmethod
+    def collect_metrics(cls) -> None:
+        for host, limiter in cls._hosts.items():
+            Metrics.set("host_concurrency_limit", int(limiter.limit), host=host)
+
+    @classmethod
+    def log_stats(cls) -> None:
+        for host, stats in cls.stats().items():
+            logger.info(
+                f"Host limiter | {host} | limit {stats['limit']} | ok {stats['ok']} | 429 {stats['429']} | "
+                f"5xx {stats['5xx']} | errors {stats['errors']} | latency {stats['latency_ms']}ms"
+            )
+
+
+Metrics.add_collector(AdaptiveLimiter.collect_metrics)
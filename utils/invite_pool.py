@@ -0,0 +1,134 @@
+import asyncio
+import random
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import select
+
+from data.settings import Settings
+from utils.db_api.async_db import AsyncDB
+from utils.db_api.models import Wallet
+from utils.db_api.wallet_api import INVITE_COLUMNS, db
+from utils.db_api.write_buffer import WriteBuffer
+
+
+class _CampaignPool:
+    """Invite codes of one campaign: a list for O(1) random picks, dicts for O(1) membership and usage"""
+
+    __slots__ = ("campaign_id", "codes", "owners", "usage")
+
+    def __init__(self, campaign_id: str):
+        self.campaign_id = campaign_id
+        self.codes: list[str] = []
+        self.owners: dict[str, Optional[int]] = {}
+        self.usage: dict[str, int] = {}
+
+    def add(self, code: str, owner: Optional[int] = None) -> None:
+        if not code or code in self.owners:
+            return
+        self.codes.append(code)
+        self.owners[code] = owner
+        self.usage[code] = 0
+
+    def _candidate(self, wallet_id: int) -> Optional[str]:
+        # own code of the wallet is the only one to skip, a few random draws find another code
+        for _ in range(4):
+            code = random.choice(self.codes)
+            if self.owners[code] != wallet_id:
+                return code
+        others = [code for code in self.codes if self.owners[code] != wallet_id]
+        return random.choice(others) if others else None
+
+    def pick(self, wallet_id: int, balance: bool) -> Optional[str]:
+        if not self.codes:
+            return None
+        code = self._candidate(wallet_id)
+        if code and balance:
+            # the less used of two random codes, spreads invites evenly without sorting the pool
+            other = self._candidate(wallet_id)
+            if other and self.usage[other] < self.usage[code]:
+                code = other
+        if code:
+            self.usage[code] += 1
+        return code
+
+
+class InvitePool:
+    """
+    Invite codes for quest claims.
+
+    Built once per campaign from the settings codes and the codes stored in the DB,
+    then kept up to date with update_ref_code, so a pick doesn't touch the DB or settings.yaml.
+    """
+
+    _pools: dict[str, _CampaignPool] = {}
+    # codes saved while the pool of their campaign is being read from the DB
+    _backlog: dict[str, list[tuple[Optional[int], str]]] = {}
+    _lock: Optional[asyncio.Lock] = None
+    _balance: bool = False
+    _only_settings: bool = False
+
+    @staticmethod
+    def _stored_codes(campaign_id: str) -> list[tuple[int, str]]:
+        column = getattr(Wallet, INVITE_COLUMNS.get(campaign_id, "third_quest_invite"))
+        return list(db.s.execute(select(Wallet.id, column).where(column.isnot(None))).tuples())
+
+    @classmethod
+    async def _build(cls, campaign_id: str) -> _CampaignPool:
+        settings = Settings()
+        cls._balance = settings.invite_codes_balance
+        cls._only_settings = settings.only_settings_invite_codes
+
+        pool = _CampaignPool(campaign_id)
+        for code in getattr(settings, INVITE_COLUMNS.get(campaign_id, "third_quest_invite")) or []:
+            pool.add(code)
+
+        if not cls._only_settings:
+            cls._backlog[campaign_id] = []
+            try:
+                await WriteBuffer.flush()
+                stored = await AsyncDB.read(cls._stored_codes, campaign_id)
+            finally:
+                backlog = cls._backlog.pop(campaign_id)
+            for wallet_id, code in stored + backlog:
+                pool.add(code, owner=wallet_id)
+
+        logger.debug(f"Invite pool | {campaign_id}: {len(pool.codes)} codes")
+        return pool
+
+    @classmethod
+    async def get(cls, campaign_id: str) -> _CampaignPool:
+        if campaign_id in cls._pools:
+            return cls._pools[campaign_id]
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if campaign_id not in cls._pools:
+                cls._pools[campaign_id] = await cls._build(campaign_id)
+        return cls._pools[campaign_id]
+
+    @classmethod
+    async def pick(cls, wallet_id: int, campaign_id: str) -> Optional[str]:
+        """
+        Random invite code for a claim
+
+        Args:
+            wallet_id: the claiming wallet, its own code is never returned
+            campaign_id: Galxe campaign
+
+        Returns:
+            Invite code or None if there are none
+        """
+        pool = await cls.get(campaign_id)
+        return pool.pick(wallet_id, balance=cls._balance)
+
+    @classmethod
+    def add(cls, wallet_id: int, campaign_id: str, code: str) -> None:
+        """Register a code saved for a wallet, before the pool of the campaign is built it is read from the DB anyway"""
+        if cls._only_settings:
+            return
+        pool = cls._pools.get(campaign_id)
+        if pool is not None:
+            pool.add(code, owner=wallet_id)
+        elif campaign_id in cls._backlog:
+            cls._backlog[campaign_id].append((wallet_id, code))
@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from cryptography.fernet import Fernet
+from eth_account import Account
+
+# keys per worker task, small imports are derived in the calling process
+CHUNK_SIZE = 500
+
+_fernet: Optional[Fernet] = None
+
+
+def init_worker(cipher_key: Optional[bytes]) -> None:
+    global _fernet
+    _fernet = Fernet(cipher_key) if cipher_key else None
+
+
+def derive_wallet(value: str) -> Optional[tuple[str, str, str]]:
+    """
+    Address and DB value of a private key from private_keys.txt, without building a Web3 client
+
+    Args:
+        value: private key, plain or already encrypted
+
+    Returns:
+        (value, address, private key to store) or None if the key is broken or can't be decrypted
+    """
+    try:
+        if _fernet is None:
+            return value, Account.from_key(value).address, value
+        if "gAAAA" in value:
+            return value, Account.from_key(_fernet.decrypt(value.encode()).decode()).address, value
+        return value, Account.from_key(value).address, _fernet.encrypt(value.encode()).decode()
+    except Exception:
+        return None
+
+
+def derive_wallets(values: list[str], cipher_key: Optional[bytes] = None) -> list[Optional[tuple[str, str, str]]]:
+    """
+    derive_wallet for many keys, spread over all CPU cores
+
+    Args:
+        values: private keys
+        cipher_key: Fernet key to encrypt plain keys with and decrypt encrypted ones, None - encryption is off
+
+    Returns:
+        derive_wallet results in the order of values
+    """
+    if len(values) <= CHUNK_SIZE:
+        init_worker(cipher_key)
+        return [derive_wallet(value) for value in values]
+
+    workers = min(os.cpu_count() or 1, (len(values) + CHUNK_SIZE - 1) // CHUNK_SIZE)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(cipher_key,)) as executor:
+        return list(executor.map(derive_wallet, values, chunksize=CHUNK_SIZE))
+
+
+def decrypt_key(value: str) -> str:
+    """Plain private key of a DB value, values that aren't encrypted or can't be decrypted are returned as they are"""
+    if _fernet is None or "gAAAA" not in value:
+        return value
+    try:
+        return _fernet.decrypt(value.encode()).decode()
+    except Exception:
+        return value
+
+
+class KeyDecryptor:
+    """decrypt_key for a stream of batches, the worker pool is started once by the first batch big enough to need it"""
+
+    def __init__(self, cipher_key: Optional[bytes]):
+        self.cipher_key = cipher_key
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._workers = os.cpu_count() or 1
+        init_worker(cipher_key)
+
+    def decrypt(self, values: list[str]) -> list[str]:
+        if len(values) <= CHUNK_SIZE or self._workers == 1:
+            return [decrypt_key(value) for value in values]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers, initializer=init_worker, initargs=(self.cipher_key,))
+        chunksize = (len(values) + self._workers - 1) // self._workers
+        return list(self._executor.map(decrypt_key, values, chunksize=chunksize))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,292 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Callable, Optional
+
+from loguru import logger
+
+from data.settings import Settings
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+_HELP = {
+    "stage_duration_seconds": ("histogram", "Duration of wallet pipeline stages"),
+    "stage_total": ("counter", "Finished wallet pipeline stages by result"),
+    "http_request_duration_seconds": ("histogram", "Duration of HTTP requests by upstream host"),
+    "http_requests_total": ("counter", "HTTP requests by upstream host and status"),
+    "rpc_request_duration_seconds": ("histogram", "Duration of JSON-RPC calls by network and method"),
+    "rpc_requests_total": ("counter", "JSON-RPC calls by network, method and result"),
+    "captcha_solve_duration_seconds": ("histogram", "Duration of captcha solves by provider"),
+    "captcha_solves_total": ("counter", "Captcha solves by provider and result"),
+    "rate_limit_wait_seconds": ("histogram", "Time spent queued for a rate limit token"),
+    "host_concurrency_limit": ("gauge", "Current adaptive concurrency limit by host"),
+    "wallets": ("gauge", "Wallets by scheduler state"),
+    "wallets_finished_total": ("counter", "Finished wallet runs by result"),
+    "db_buffered_updates_total": ("counter", "Wallet field updates queued in the DB write buffer"),
+    "db_flush_duration_seconds": ("histogram", "Duration of DB write buffer flushes"),
+    "circuit_breaker_state": ("gauge", "Circuit breaker state by host (0 closed, 1 half-open, 2 open)"),
+    "circuit_breaker_transitions_total": ("counter", "Circuit breaker state changes by host and new state"),
+    "circuit_breaker_rejected_total": ("counter", "Requests failed fast by an open circuit breaker by host"),
+    "retries_total": ("counter", "Retried call failures by policy and result (retry, exhausted, budget_spent, fatal, rotate_proxy)"),
+    "galxe_cache_requests_total": ("counter", "Campaign cache lookups by result (hit, shared in-flight fetch, miss)"),
+}
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(DEFAULT_BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(DEFAULT_BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+def _labels(labels: dict) -> tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: tuple, extra: Optional[tuple] = None) -> str:
+    items = list(labels) + list(extra or ())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in items) + "}"
+
+
+class Metrics:
+    """In-process counters, gauges and histograms rendered in the Prometheus text format"""
+
+    _counters: dict[tuple[str, tuple], float] = {}
+    _gauges: dict[tuple[str, tuple], float] = {}
+    _histograms: dict[tuple[str, tuple], _Histogram] = {}
+    _collectors: list[Callable[[], None]] = []
+    _stage_listeners: list[Callable[[str, datetime, datetime, str, Optional[str]], None]] = []
+    _samples: Optional[dict[tuple[str, tuple], list[float]]] = None
+
+    @classmethod
+    def keep_samples(cls) -> None:
+        """Keep raw histogram observations as well, for exact percentiles in benchmarks"""
+        cls._samples = {}
+
+    @classmethod
+    def counters(cls, name: str) -> dict[tuple, float]:
+        return {labels: value for (counter_name, labels), value in cls._counters.items() if counter_name == name}
+
+    @classmethod
+    def samples(cls, name: str) -> dict[tuple, list[float]]:
+        return {labels: values for (sample_name, labels), values in (cls._samples or {}).items() if sample_name == name}
+
+    @classmethod
+    def inc(cls, name: str, value: float = 1, **labels) -> None:
+        key = (name, _labels(labels))
+        cls._counters[key] = cls._counters.get(key, 0) + value
+
+    @classmethod
+    def set(cls, name: str, value: float, **labels) -> None:
+        cls._gauges[(name, _labels(labels))] = value
+
+    @classmethod
+    def observe(cls, name: str, value: float, **labels) -> None:
+        key = (name, _labels(labels))
+        histogram = cls._histograms.get(key)
+        if histogram is None:
+            histogram = cls._histograms[key] = _Histogram()
+        histogram.observe(value)
+        if cls._samples is not None:
+            cls._samples.setdefault(key, []).append(value)
+
+    @classmethod
+    def add_collector(cls, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before rendering"""
+        cls._collectors.append(collector)
+
+    @classmethod
+    def remove_collector(cls, collector: Callable[[], None]) -> None:
+        if collector in cls._collectors:
+            cls._collectors.remove(collector)
+
+    @classmethod
+    def add_stage_listener(cls, listener: Callable[[str, datetime, datetime, str, Optional[str]], None]) -> None:
+        """Register a callback getting (stage, started_at, finished_at, result, error class name) of every finished stage"""
+        cls._stage_listeners.append(listener)
+
+    @classmethod
+    @asynccontextmanager
+    async def stage(cls, name: str):
+        """
+        Time a pipeline stage, the result is `error` on exception and `ok` otherwise unless set on the yielded dict
+
+        A cancelled stage (shutdown, worker cancel) is only counted as `cancelled`, it tells nothing about
+        the duration or the success of the stage, so it is not observed and not passed to the stage listeners.
+        """
+        outcome = {"result": "ok"}
+        error = None
+        started_at = datetime.now()
+        started = time.monotonic()
+        try:
+            yield outcome
+        except Exception as e:
+            outcome["result"] = "error"
+            error = type(e).__name__
+            raise
+        except BaseException:
+            outcome["result"] = "cancelled"
+            raise
+        finally:
+            duration = time.monotonic() - started
+            cls.inc("stage_total", stage=name, result=outcome["result"])
+            if outcome["result"] != "cancelled":
+                cls.observe("stage_duration_seconds", duration, stage=name)
+                for listener in cls._stage_listeners:
+                    try:
+                        listener(name, started_at, started_at + timedelta(seconds=duration), outcome["result"], error)
+                    except Exception as e:
+                        logger.debug(f"stage listener failed: {e}")
+
+    @classmethod
+    def render(cls) -> str:
+        for collector in list(cls._collectors):
+            try:
+                collector()
+            except Exception as e:
+                logger.debug(f"metrics collector failed: {e}")
+
+        lines = []
+        described = set()
+
+        def describe(name: str) -> None:
+            if name in described or name not in _HELP:
+                return
+            described.add(name)
+            kind, text = _HELP[name]
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(cls._counters.items()):
+            describe(name)
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), value in sorted(cls._gauges.items()):
+            describe(name)
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(cls._histograms.items()):
+            describe(name)
+            for bound, count in zip(DEFAULT_BUCKETS, histogram.counts):
+                lines.append(f"{name}_bucket{_format_labels(labels, (('le', str(bound)),))} {count}")
+            lines.append(f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def measure_stage(name: str):
+    """Decorator for coroutine functions: times the call as a pipeline stage, a False or unsuccessful result counts as `fail`"""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with Metrics.stage(name) as outcome:
+                result = await func(*args, **kwargs)
+                if result is False or getattr(result, "success", True) is False:
+                    outcome["result"] = "fail"
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def measure_captcha(provider: str):
+    """Decorator for captcha solving coroutines: an empty result counts as `fail`"""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            result = "error"
+            try:
+                token = await func(*args, **kwargs)
+                result = "ok" if token else "fail"
+                return token
+            finally:
+                Metrics.observe("captcha_solve_duration_seconds", time.monotonic() - started, provider=provider)
+                Metrics.inc("captcha_solves_total", provider=provider, result=result)
+
+        return wrapper
+
+    return decorator
+
+
+class MetricsExporter:
+    """Serves metrics over HTTP on localhost and/or rewrites a .prom file periodically"""
+
+    def __init__(self, shard: int = 0):
+        """
+        Args:
+            shard: worker process number, shards serve on port + shard and write to their own file
+        """
+        settings = Settings()
+        self.enabled = settings.metrics_enabled
+        self.port = settings.metrics_port + shard if settings.metrics_port else 0
+        self.file = settings.metrics_file
+        if self.file and shard:
+            root, ext = os.path.splitext(self.file)
+            self.file = f"{root}-{shard}{ext}"
+        self.interval = settings.metrics_interval
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            body = Metrics.render().encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"metrics request failed: {e}")
+        finally:
+            writer.close()
+
+    def _write_file(self) -> None:
+        tmp = f"{self.file}.tmp"
+        with open(tmp, "w") as f:
+            f.write(Metrics.render())
+        os.replace(tmp, self.file)
+
+    async def _file_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self._write_file()
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        if self.port:
+            self._server = await asyncio.start_server(self._handle, host="127.0.0.1", port=self.port)
+            logger.info(f"Metrics | serving on http://127.0.0.1:{self.port}/metrics")
+        if self.file:
+            self._writer = asyncio.create_task(self._file_loop())
+            logger.info(f"Metrics | writing {self.file} every {self.interval}s")
+
+    async def stop(self) -> None:
+        if self._writer:
+            self._writer.cancel()
+            self._writer = None
+        if self.file and self.enabled:
+            self._write_file()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from curl_cffi.requests.exceptions import ProxyError, SSLError, Timeout
+from loguru import logger
+
+from data import config
+from data.settings import Settings
+from libs.baseAsyncSession import BaseAsyncSession
+from utils.db_api import async_wallet_api
+from utils.db_api.models import Wallet
+from utils.resource_manager import ResourceManager
+
+
+@dataclass
+class ProxyCheck:
+    proxy: str
+    ok: bool
+    latency_ms: Optional[int] = None
+    exit_ip: Optional[str] = None
+    error: Optional[str] = None
+
+
+def proxy_checked_recently(wallet: Wallet) -> bool:
+    """Whether the pre-flight result stored for the wallet proxy is still within its TTL"""
+    if not wallet.proxy or not wallet.proxy_checked_at:
+        return False
+    return datetime.now() - wallet.proxy_checked_at < timedelta(seconds=Settings().proxy_check_ttl)
+
+
+class ProxyPreflight:
+    """Probes every proxy of the fleet concurrently before wallets are scheduled"""
+
+    CHECK_URL = "https://api.ipify.org"
+
+    def __init__(self, concurrency: Optional[int] = None, ttl: Optional[int] = None, timeout: int = 15):
+        """
+        Args:
+            concurrency: maximum number of proxies probed at the same time
+            ttl: seconds a stored check result stays valid
+            timeout: request timeout of a single probe
+        """
+        self.concurrency = concurrency or Settings().proxy_check_concurrency
+        self.ttl = ttl if ttl is not None else Settings().proxy_check_ttl
+        self.timeout = timeout
+        self.resource_manager = ResourceManager()
+
+    @staticmethod
+    def classify_error(error: Exception) -> str:
+        if isinstance(error, Timeout):
+            return "timeout"
+        if isinstance(error, ProxyError):
+            return "proxy"
+        if isinstance(error, SSLError):
+            return "ssl"
+        return error.__class__.__name__
+
+    async def probe(self, proxy: str) -> ProxyCheck:
+        started = time.monotonic()
+        try:
+            async with BaseAsyncSession(proxy=proxy) as session:
+                response = await session.get(self.CHECK_URL, timeout=self.timeout)
+        except Exception as e:
+            return ProxyCheck(proxy=proxy, ok=False, error=self.classify_error(e))
+
+        latency_ms = int((time.monotonic() - started) * 1000)
+        if response.status_code != 200:
+            return ProxyCheck(proxy=proxy, ok=False, latency_ms=latency_ms, error=f"http_{response.status_code}")
+        return ProxyCheck(proxy=proxy, ok=True, latency_ms=latency_ms, exit_ip=response.text.strip())
+
+    async def probe_all(self, proxies: list[str]) -> list[ProxyCheck]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded_probe(proxy: str) -> ProxyCheck:
+            async with semaphore:
+                return await self.probe(proxy)
+
+        return await asyncio.gather(*(bounded_probe(proxy) for proxy in proxies))
+
+    async def run(self) -> dict:
+        """
+        Probe DB and reserve proxies, store results and replace dead DB proxies
+
+        Returns:
+            Summary counters
+        """
+        proxies = await async_wallet_api.get_proxies_to_check(checked_before=datetime.now() - timedelta(seconds=self.ttl))
+        reserve = self.resource_manager._load_from_file(config.RESERVE_PROXY_FILE) if Settings().auto_replace_proxy else []
+
+        if not proxies:
+            logger.info("Proxy pre-flight | all proxies were checked recently")
+            return {"checked": 0, "bad": 0, "replaced": 0}
+
+        logger.info(f"Proxy pre-flight | checking {len(proxies)} proxies and {len(reserve)} reserve proxies")
+        checks = await self.probe_all(proxies + reserve)
+        fleet_checks, reserve_checks = checks[: len(proxies)], checks[len(proxies) :]
+
+        bad = [check for check in fleet_checks if not check.ok]
+        for check in fleet_checks:
+            await async_wallet_api.save_proxy_check(
+                proxy=check.proxy, ok=check.ok, latency_ms=check.latency_ms, exit_ip=check.exit_ip, error=check.error
+            )
+
+        healthy_reserve = sorted((check for check in reserve_checks if check.ok), key=lambda check: check.latency_ms)
+        replaced = 0
+        for check in bad:
+            logger.warning(f"Proxy pre-flight | {check.proxy} failed: {check.error}")
+            for wallet_id in await async_wallet_api.get_wallet_ids_by_proxy(check.proxy):
+                if not healthy_reserve:
+                    break
+                new = healthy_reserve.pop(0)
+                await async_wallet_api.replace_bad_proxy(id=wallet_id, new_proxy=new.proxy)
+                await async_wallet_api.save_proxy_check(proxy=new.proxy, ok=True, latency_ms=new.latency_ms, exit_ip=new.exit_ip, error=None)
+                replaced += 1
+
+        if reserve:
+            # dead reserve proxies are dropped, used ones are removed, the rest is kept sorted by latency
+            self.resource_manager._save_to_file(config.RESERVE_PROXY_FILE, [check.proxy for check in healthy_reserve])
+
+        latencies = sorted(check.latency_ms for check in fleet_checks if check.ok)
+        median = latencies[len(latencies) // 2] if latencies else 0
+        logger.info(
+            f"Proxy pre-flight | checked {len(fleet_checks)} | bad {len(bad)} | replaced {replaced} | "
+            f"dead reserve {len(reserve_checks) - len([c for c in reserve_checks if c.ok])} | median latency {median}ms"
+        )
+        return {"checked": len(fleet_checks), "bad": len(bad), "replaced": replaced}
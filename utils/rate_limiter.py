@@ -0,0 +1,122 @@
+import asyncio
+import time
+from typing import Optional
+
+from loguru import logger
+
+from data.settings import Settings
+from utils.metrics import Metrics
+
+
+class TokenBucket:
+    """
+    Token bucket with FIFO reservations
+
+    Every caller reserves its token at arrival, callers that find the bucket empty
+    sleep until their own token is refilled, so waiters are served in arrival order.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens: float = float(self.burst)
+        self.updated = time.monotonic()
+
+        self.acquired = 0
+        self.waited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting for it if the bucket is empty
+
+        Returns:
+            Seconds spent in the queue
+        """
+        wait = self._reserve()
+        self.acquired += 1
+        Metrics.observe("rate_limit_wait_seconds", wait, bucket=self.name)
+        if wait > 0:
+            self.waited += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_total": round(self.wait_total, 3),
+            "wait_max": round(self.wait_max, 3),
+        }
+
+
+class RateLimits:
+    """
+    Process-wide token buckets keyed by host and by host/operation
+
+    Buckets come from `rate_limits` in settings.yaml, e.g. `graphigo.prd.galaxy.eco` or
+    `graphigo.prd.galaxy.eco/SyncCredentialValue`. A request takes a token from both the
+    host bucket and its operation bucket, endpoints without a configured bucket are not limited.
+    """
+
+    _buckets: dict[str, TokenBucket] = {}
+    _config: Optional[dict] = None
+
+    @classmethod
+    def _get_config(cls) -> dict:
+        if cls._config is None:
+            cls._config = Settings().rate_limits or {}
+        return cls._config
+
+    @classmethod
+    def get(cls, key: str) -> Optional[TokenBucket]:
+        bucket = cls._buckets.get(key)
+        if bucket is None:
+            limit = cls._get_config().get(key)
+            if not limit:
+                return None
+            bucket = TokenBucket(name=key, rate=float(limit["rate"]), burst=int(limit.get("burst", 1)))
+            cls._buckets[key] = bucket
+        return bucket
+
+    @classmethod
+    async def acquire(cls, host: str, operation: Optional[str] = None) -> float:
+        """
+        Wait for a token of the host bucket and of the operation bucket
+
+        Returns:
+            Seconds spent in the queues
+        """
+        keys = [host, f"{host}/{operation}"] if operation else [host]
+        waited = 0.0
+        for key in keys:
+            bucket = cls.get(key)
+            if bucket is not None:
+                waited += await bucket.acquire()
+        return waited
+
+    @classmethod
+    def stats(cls) -> dict[str, dict]:
+        return {key: bucket.stats() for key, bucket in cls._buckets.items()}
+
+    @classmethod
+    def log_stats(cls) -> None:
+        for key, stats in cls.stats().items():
+            if stats["waited"]:
+                logger.info(
+                    f"Rate limit | {key} | {stats['acquired']} requests | {stats['waited']} queued | "
+                    f"wait total {stats['wait_total']}s | max {stats['wait_max']}s"
+                )
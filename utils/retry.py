@@ -1,45 +1,183 @@
 import asyncio
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
-from typing import Tuple, Type
+from typing import Optional, Tuple, Type
 
+from aiohttp import ClientProxyConnectionError
+from cryptography.fernet import InvalidToken
+from curl_cffi.requests.exceptions import ProxyError
 from loguru import logger
 
 from data.settings import Settings
+from utils.cooldown import cooldown_sleep
+from utils.metrics import Metrics
+
+RETRYABLE = "retryable"
+FATAL = "fatal"
+ROTATE_PROXY = "rotate_proxy"
+
+# used for policy fields missing in retry_policies, attempts default to the retry setting
+DEFAULT_POLICY = {"base_delay": 3, "max_delay": 60, "multiplier": 2, "jitter": 0.5}
+
+
+class FatalError(Exception):
+    """An error retrying can't fix, raise it (or a subclass) to skip the remaining attempts"""
+
+
+class ProxyRotationRequired(Exception):
+    """The wallet proxy doesn't work, the run has to continue with another proxy"""
+
+
+def classify(error: BaseException) -> str:
+    """
+    Args:
+        error: exception raised by the retried call
+
+    Returns:
+        RETRYABLE, FATAL or ROTATE_PROXY
+    """
+    if isinstance(error, ProxyRotationRequired):
+        # already handled by an inner layer, the outer ones only pass it through
+        return FATAL
+    if isinstance(error, (ProxyError, ClientProxyConnectionError)):
+        return ROTATE_PROXY
+    if isinstance(error, (FatalError, InvalidToken, NotImplementedError)):
+        return FATAL
+    return RETRYABLE
+
+
+class RetryPolicy:
+    """Attempts and exponential backoff of one kind of call, configured in retry_policies"""
+
+    _policies: dict[str, "RetryPolicy"] = {}
+
+    def __init__(self, name: str, attempts: int, base_delay: float, max_delay: float, multiplier: float, jitter: float):
+        self.name = name
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    @classmethod
+    def get(cls, name: str) -> "RetryPolicy":
+        """Policy by name, read from the settings on first use, unknown names get the default policy"""
+        policy = cls._policies.get(name)
+        if policy is None:
+            configured = Settings().retry_policies
+            values = {"attempts": Settings().retry, **DEFAULT_POLICY, **configured.get("default", {}), **configured.get(name, {})}
+            policy = cls(name=name, **values)
+            cls._policies[name] = policy
+        return policy
+
+    def delay(self, attempt: int, base_delay: Optional[float] = None) -> float:
+        """Backoff before the next try after the attempt-th failure, +-jitter share of it at random"""
+        delay = min(self.max_delay, (base_delay or self.base_delay) * self.multiplier ** (attempt - 1))
+        return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+
+class RetryBudget:
+    """Retries left for one call chain, shared by every nested async_retry layer in it"""
+
+    def __init__(self, retries: int):
+        self.left = retries
+
+    def take(self) -> bool:
+        if self.left <= 0:
+            return False
+        self.left -= 1
+        return True
+
+
+_budget_var: ContextVar[Optional[RetryBudget]] = ContextVar("retry_budget", default=None)
+
+
+@contextmanager
+def retry_budget(retries: Optional[int] = None):
+    """
+    Share one retry budget between all retried calls made in the block, nested blocks reuse the outer budget
+
+    Args:
+        retries: retries allowed in total, None - the retry_budget setting
+    """
+    if _budget_var.get() is not None:
+        yield _budget_var.get()
+        return
+    budget = RetryBudget(Settings().retry_budget if retries is None else retries)
+    token = _budget_var.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget_var.reset(token)
 
 
 def async_retry(
-    retries: int = Settings().retry,
-    delay: int = 3,
+    retries: Optional[int] = None,
+    delay: Optional[float] = None,
     to_raise: bool = True,
     exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    policy: str = "default",
 ):
+    """
+    Retry a method by a retry policy with exponential backoff
+
+    Args:
+        retries: attempts, None - from the policy
+        delay: first backoff in seconds, None - from the policy
+        to_raise: raise the last error after the last attempt, otherwise a generic Exception with the last message
+        exceptions: errors to retry, the rest are raised at once
+        policy: name of the policy in retry_policies
+    """
+
     def decorator(func):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
-            attempt = 0
-            last_exc: BaseException | None = None
+            rule = RetryPolicy.get(policy)
+            attempts = retries or rule.attempts
 
             wallet_name = getattr(self, "wallet", None)
-            # chain = getattr(getattr(getattr(self, "client", None), "network", None), "name", "unknown").capitalize()
             module = getattr(self, "__module_name__", self.__class__.__name__)
 
-            last_msg = None
+            with retry_budget() as budget:
+                attempt = 0
+                last_exc: BaseException | None = None
+                last_msg = None
+
+                while attempt < attempts:
+                    try:
+                        return await func(self, *args, **kwargs)
+
+                    except asyncio.CancelledError:
+                        raise
 
-            while attempt < retries:
-                try:
-                    return await func(self, *args, **kwargs)
+                    except exceptions as e:
+                        last_exc = e
+                        attempt += 1
+                        kind = classify(e)
+                        msg = f"{wallet_name} | {module} | {func.__name__} | Failed | attempt {attempt}/{attempts}: {e}"
+                        last_msg = f"{func.__name__} | attempt {attempt}/{attempts}: {e}"
 
-                except asyncio.CancelledError:
-                    raise
+                        if kind == ROTATE_PROXY:
+                            logger.warning(f"{msg} | proxy error, rotating proxy")
+                            Metrics.inc("retries_total", policy=policy, result="rotate_proxy")
+                            raise ProxyRotationRequired(str(e)) from e
+                        if kind == FATAL:
+                            Metrics.inc("retries_total", policy=policy, result="fatal")
+                            raise
+                        if attempt >= attempts:
+                            logger.warning(msg)
+                            Metrics.inc("retries_total", policy=policy, result="exhausted")
+                            break
+                        if not budget.take():
+                            logger.warning(f"{msg} | retry budget of the call chain is spent")
+                            Metrics.inc("retries_total", policy=policy, result="budget_spent")
+                            break
 
-                except exceptions as e:
-                    last_exc = e
-                    attempt += 1
-                    msg = f"{wallet_name} | {module} | {func.__name__} | Failed | attempt {attempt}/{retries}: {e}"
-                    last_msg = f"{func.__name__} | attempt {attempt}/{retries}: {e}"
-                    logger.warning(msg)
-                    if attempt < retries:
-                        await asyncio.sleep(delay)
+                        logger.warning(msg)
+                        Metrics.inc("retries_total", policy=policy, result="retry")
+                        await cooldown_sleep(rule.delay(attempt, base_delay=delay))
 
             if to_raise and last_exc is not None:
                 raise last_exc
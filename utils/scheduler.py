@@ -0,0 +1,180 @@
+import asyncio
+import heapq
+import random
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Awaitable, Callable, Iterable, Optional
+
+from loguru import logger
+
+from data.settings import Settings
+from utils.circuit_breaker import CircuitOpen
+from utils.cooldown import ActiveSlots
+from utils.db_api import async_wallet_api
+from utils.db_api.models import Wallet
+from utils.event_log import EventLog
+from utils.metrics import Metrics
+
+
+class WalletScheduler:
+    """Heap of wallets ordered by due time, dispatched to a bounded worker pool"""
+
+    def __init__(
+        self,
+        task_func: Callable[[Wallet], Awaitable],
+        workers: int,
+        in_flight: int = 0,
+        pause_min: int = 0,
+        pause_max: int = 0,
+        shuffle: bool = True,
+    ):
+        """
+        Args:
+            task_func: coroutine function run for every due wallet
+            workers: number of wallets actively working at the same time
+            in_flight: number of wallets started at the same time, including the ones sleeping out a cooldown
+            pause_min: minimal pause in seconds before the wallet is due again
+            pause_max: maximal pause in seconds before the wallet is due again
+            shuffle: randomize the order of wallets that are due at the same time
+        """
+        self.task_func = task_func
+        self.workers = max(1, workers)
+        self.in_flight = max(self.workers, in_flight)
+        self.pause_min = pause_min
+        self.pause_max = pause_max
+        self.shuffle = shuffle
+        self.repeat = pause_max > 0
+
+        self._heap: list[tuple[float, float, int]] = []
+        self._queue: asyncio.Queue[int] = asyncio.Queue(maxsize=self.in_flight)
+        self._changed = asyncio.Event()
+        self._busy = 0
+        self._defers: Counter = Counter()
+        self.stats: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, wallet_id: int, due: Optional[datetime] = None) -> None:
+        """
+        Add a wallet to the schedule
+
+        Args:
+            wallet_id: wallet id
+            due: time the wallet becomes due, None means now
+        """
+        self._push_at(wallet_id=wallet_id, due_ts=due.timestamp() if due and self.repeat else 0.0)
+
+    def _push_at(self, wallet_id: int, due_ts: float) -> None:
+        tiebreak = random.random() if self.shuffle else float(wallet_id)
+        heapq.heappush(self._heap, (due_ts, tiebreak, wallet_id))
+        self._changed.set()
+
+    def defer(self, wallet_id: int, delay: float) -> None:
+        """Run the wallet again in delay seconds, also when the schedule doesn't repeat"""
+        # spread the deferred wallets so they don't all hit the recovering upstream at once
+        self._push_at(wallet_id=wallet_id, due_ts=time.time() + delay + random.uniform(0, delay / 2))
+
+    def load(self, rows: Iterable[tuple[int, Optional[datetime]]]) -> int:
+        """
+        Fill the schedule from (wallet_id, next_action_time) rows
+
+        Returns:
+            Number of scheduled wallets
+        """
+        for wallet_id, next_action_time in rows:
+            self.push(wallet_id=wallet_id, due=next_action_time)
+        return len(self._heap)
+
+    def _next_due(self) -> datetime:
+        return datetime.fromtimestamp(time.time() + random.randint(self.pause_min, self.pause_max))
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._heap:
+                if not self.repeat and self._busy == 0 and self._queue.empty():
+                    return
+                self._changed.clear()
+                await self._changed.wait()
+                continue
+
+            due_ts, _, wallet_id = self._heap[0]
+            delay = due_ts - time.time()
+            if delay > 0:
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            await self._queue.put(wallet_id)
+
+    async def _worker(self) -> None:
+        while True:
+            wallet_id = await self._queue.get()
+            self._busy += 1
+            try:
+                async with ActiveSlots.hold():
+                    await self._process(wallet_id)
+            finally:
+                self._busy -= 1
+                self._queue.task_done()
+                self._changed.set()
+
+    async def _process(self, wallet_id: int) -> None:
+        wallet = await async_wallet_api.get_wallet(wallet_id)
+        if not wallet:
+            logger.warning(f"[{wallet_id}] wallet not found in DB, removed from schedule")
+            return
+
+        try:
+            with EventLog.context(wallet_id=wallet.id):
+                result = await self.task_func(wallet)
+            state = "skipped" if result is False else "completed"
+        except CircuitOpen as e:
+            if self._defers[wallet.id] < Settings().circuit_breaker_max_defers:
+                self._defers[wallet.id] += 1
+                self.stats["deferred"] += 1
+                Metrics.inc("wallets_finished_total", result="deferred")
+                self.defer(wallet_id=wallet.id, delay=e.retry_after)
+                logger.warning(f"{wallet} stopped: {e}. Deferred ({self._defers[wallet.id]}/{Settings().circuit_breaker_max_defers})")
+                return
+            state = "failed"
+            logger.error(f"[{wallet.id}] failed: {e}")
+        except Exception as e:
+            state = "failed"
+            logger.error(f"[{wallet.id}] failed: {e}")
+        self._defers.pop(wallet.id, None)
+        self.stats[state] += 1
+        Metrics.inc("wallets_finished_total", result=state)
+
+        if not self.repeat:
+            return
+
+        next_action_time = self._next_due()
+        await async_wallet_api.update_next_action_time(address=wallet.address, next_action_time=next_action_time)
+        self.push(wallet_id=wallet.id, due=next_action_time)
+        logger.info(f"{wallet} next run at: {next_action_time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    def collect_metrics(self) -> None:
+        active = ActiveSlots.in_use()
+        Metrics.set("wallets", len(self._heap), state="scheduled")
+        Metrics.set("wallets", self._queue.qsize(), state="queued")
+        Metrics.set("wallets", active, state="active")
+        Metrics.set("wallets", max(self._busy - active, 0), state="cooldown")
+
+    async def run(self) -> None:
+        ActiveSlots.configure(self.workers)
+        Metrics.add_collector(self.collect_metrics)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.in_flight)]
+        try:
+            await self._dispatch()
+            await self._queue.join()
+        finally:
+            Metrics.remove_collector(self.collect_metrics)
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
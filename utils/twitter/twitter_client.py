@@ -10,8 +10,8 @@ import libs.twitter as twitter
 from libs.twitter.errors import AccountLocked, AccountNotFound, AccountSuspended, BadAccountToken
 from libs.twitter.utils import remove_at_sign
 from utils.browser import Browser
+from utils.db_api import async_wallet_api
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import mark_twitter_status, update_twitter_token
 
 
 class BadTwitter(Exception):
@@ -116,38 +116,38 @@ class TwitterClient:
 
             if self.twitter_account.status == twitter.AccountStatus.GOOD:
                 logger.success(f"{self.user} Twitter client initialized")
-                update_twitter_token(address=self.user.address, updated_token=self.twitter_account.auth_token)
+                await async_wallet_api.update_twitter_token(address=self.user.address, updated_token=self.twitter_account.auth_token)
 
                 self.user.twitter_status = TwitterStatuses.ok
                 return True
 
         except AccountSuspended:
             self.user.twitter_status = TwitterStatuses.suspended
-            mark_twitter_status(id=self.user.id, status=TwitterStatuses.suspended)
+            await async_wallet_api.mark_twitter_status(id=self.user.id, status=TwitterStatuses.suspended)
             logger.error(f"{self.user} | Twitter Suspended, try to reauth manually")
             return False
 
         except BadAccountToken:
             self.user.twitter_status = TwitterStatuses.relogin
-            mark_twitter_status(id=self.user.id, status=TwitterStatuses.bad_token)
+            await async_wallet_api.mark_twitter_status(id=self.user.id, status=TwitterStatuses.bad_token)
             logger.error(f"{self.user} | Twitter BadToken, try to reauth manually")
             return False
 
         except AccountLocked:
             self.user.twitter_status = TwitterStatuses.locked
-            mark_twitter_status(id=self.user.id, status=TwitterStatuses.locked)
+            await async_wallet_api.mark_twitter_status(id=self.user.id, status=TwitterStatuses.locked)
             logger.error(f"{self.user} | Twitter Locked, replace twitter token")
             return False
 
         except AccountNotFound:
             self.user.twitter_status = TwitterStatuses.not_found
-            mark_twitter_status(id=self.user.id, status=TwitterStatuses.not_found)
+            await async_wallet_api.mark_twitter_status(id=self.user.id, status=TwitterStatuses.not_found)
             logger.error(f"{self.user} | Twitter Not Found, replace twitter token")
             return False
 
         except Exception:
             self.user.twitter_status = TwitterStatuses.locked
-            mark_twitter_status(id=self.user.id, status=TwitterStatuses.locked)
+            await async_wallet_api.mark_twitter_status(id=self.user.id, status=TwitterStatuses.locked)
             logger.error(f"{self.user} | Twitter Locked, replace twitter token")
             return False
 
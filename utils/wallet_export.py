@@ -0,0 +1,176 @@
+import csv
+import json
+import os
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, select
+
+from utils.db_api.models import Wallet
+from utils.db_api.wallet_api import db
+from utils.key_derivation import KeyDecryptor
+
+# columns shown first, the rest follow in table order
+PREFERRED_COLUMNS = ["id", "address", "private_key", "proxy", "twitter_token"]
+
+# rows fetched from the DB, written and decrypted at a time
+BATCH_SIZE = 5000
+
+
+def export_columns(names: Optional[list[str]] = None) -> list[Column]:
+    """
+    Wallet table columns to export, taken from the table metadata
+
+    Args:
+        names: columns to keep, empty - all of them
+
+    Returns:
+        the columns, PREFERRED_COLUMNS first
+    """
+    table_columns = Wallet.__table__.columns
+    if names:
+        unknown = [name for name in names if name not in table_columns]
+        if unknown:
+            raise ValueError(f"unknown wallet columns: {', '.join(unknown)}")
+        return [table_columns[name] for name in names]
+
+    preferred = [table_columns[name] for name in PREFERRED_COLUMNS if name in table_columns]
+    return preferred + [column for column in table_columns if column.name not in PREFERRED_COLUMNS]
+
+
+def stream_wallet_rows(columns: list[Column], filters: Optional[dict[str, Any]] = None, batch_size: int = BATCH_SIZE) -> Iterator[list[dict]]:
+    """
+    Wallet rows in id order, one batch at a time over a single streamed cursor
+
+    Args:
+        columns: columns to select
+        filters: {column: value} to match, a list value matches any of its items and None matches NULL
+        batch_size: rows per batch
+
+    Returns:
+        Iterator over batches of {column name: value}
+    """
+    stmt = select(*columns)
+    for name, value in (filters or {}).items():
+        if name not in Wallet.__table__.columns:
+            raise ValueError(f"unknown wallet column in export filters: {name}")
+        column = Wallet.__table__.columns[name]
+        if isinstance(value, list):
+            stmt = stmt.where(column.in_(value))
+        elif value is None:
+            stmt = stmt.where(column.is_(None))
+        else:
+            stmt = stmt.where(column == value)
+
+    result = db.s.execute(stmt.order_by(Wallet.id).execution_options(yield_per=batch_size))
+    for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+
+class _CsvWriter:
+    def __init__(self, path: str, columns: list[Column]):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=[column.name for column in columns])
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path: str, columns: list[Column]):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: list[dict]) -> None:
+        self._file.writelines(json.dumps(row, default=_json_default) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class _ParquetWriter:
+    def __init__(self, path: str, columns: list[Column]):
+        # optional dependency, only needed for this format
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+
+        self._pa = pa
+        fields = []
+        for column in columns:
+            if isinstance(column.type, Boolean):
+                arrow_type = pa.bool_()
+            elif isinstance(column.type, Integer):
+                arrow_type = pa.int64()
+            elif isinstance(column.type, DateTime):
+                arrow_type = pa.timestamp("us")
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(column.name, arrow_type))
+        self._schema = pa.schema(fields)
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+def export_wallets(
+    path: str,
+    fmt: str = "csv",
+    columns: Optional[list[str]] = None,
+    filters: Optional[dict[str, Any]] = None,
+    cipher_key: Optional[bytes] = None,
+) -> int:
+    """
+    Write wallets to a file batch by batch, memory use doesn't depend on the number of wallets
+
+    Args:
+        path: output file
+        fmt: csv, jsonl or parquet
+        columns: columns to export, empty - all of them
+        filters: {column: value} the wallets must match, see stream_wallet_rows
+        cipher_key: Fernet key to export plain private keys with, None - keys are exported as stored
+
+    Returns:
+        number of exported wallets
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"unknown export format {fmt}, use one of: {', '.join(WRITERS)}")
+    selected = export_columns(columns)
+    decrypt = cipher_key is not None and any(column.name == "private_key" for column in selected)
+
+    exported = 0
+    writer = WRITERS[fmt](path, selected)
+    decryptor = KeyDecryptor(cipher_key) if decrypt else None
+    try:
+        for rows in stream_wallet_rows(selected, filters):
+            if decryptor:
+                for row, private_key in zip(rows, decryptor.decrypt([row["private_key"] for row in rows])):
+                    row["private_key"] = private_key
+            writer.write(rows)
+            exported += len(rows)
+    finally:
+        writer.close()
+        if decryptor:
+            decryptor.close()
+
+    if not exported:
+        os.remove(path)
+    return exported